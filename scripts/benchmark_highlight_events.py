@@ -0,0 +1,77 @@
+"""Compare highlight event parsing with the former bitstring implementation.
+
+Requires `bitstring` (`pip install bitstring`) to run the former implementation.
+"""
+
+import argparse
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from bitstring import Bits
+
+from spnkr.film import highlight_events
+from spnkr.film.medals import MEDALS
+
+FILM_DIR = Path(__file__).parents[1] / "tests" / "data" / "film"
+
+
+def read_bitstring(data: bytes, version: int):
+    """Iterate events with the former bit-level scan."""
+    bits = Bits(bytes=zlib.decompress(data))
+    for marker_start in bits.findall(Bits(hex="c0")):
+        xuid_end = marker_start - 8
+        if bits[xuid_end:marker_start].hex not in ("2d", "25"):
+            continue
+        xuid_bits = bits[xuid_end - 64 : xuid_end]
+        if len(xuid_bits) < 64 or not 2e15 < xuid_bits.uintle < 3e15:
+            continue
+        selected = bits[xuid_end - 64 : xuid_end - 64 + 20_000]
+        end = selected.find(Bits(hex="00002ee0"))[0]  # type: ignore
+        values: list[Any] = selected[end - 480 : end].unpack(fmt=_format(version))
+        gamertag_bytes, type_hint, time_ms, is_medal, medal_value = values
+        event_type = highlight_events._infer_event_type(type_hint, is_medal == 1)
+        yield highlight_events.HighlightEvent(
+            xuid=selected[:64].uintle,
+            gamertag=gamertag_bytes.decode("utf-16le").strip("\x00"),
+            type_hint=type_hint,
+            is_medal=is_medal == 1,
+            event_type=event_type,
+            time_ms=time_ms,
+            medal_value=medal_value,
+            medal_name=MEDALS.get(medal_value) if event_type == "medal" else None,
+        )
+
+
+def _format(version: int) -> str:
+    tail = "pad:24, uint:8, uint:32, pad:24, uint:8, pad:24, uint:8"
+    if version <= 38 or version >= 41:
+        return f"bytes:32, pad:96, {tail}"
+    return f"pad:96, bytes:32, {tail}"
+
+
+def main(number: int) -> None:
+    print(f"{'version':<8} {'events':>6} {'bitstring (ms)':>15} {'bytes (ms)':>11}")
+    for path in sorted(FILM_DIR.glob("[0-9]*.gzip")):
+        version = int(path.name[:2])
+        data = path.read_bytes()
+        results = {}
+        for name, read in [("bitstring", read_bitstring), ("bytes", None)]:
+            read = read or highlight_events.read
+            start = time.perf_counter()
+            for _ in range(number):
+                events = list(read(data, version))
+            results[name] = ((time.perf_counter() - start) / number, events)
+        (old, old_events), (new, new_events) = results.values()
+        assert new_events == old_events, f"Events differ for {path.name}"
+        print(
+            f"{version:<8} {len(new_events):>6} {old * 1e3:>15.1f} {new * 1e3:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=3)
+    args = parser.parse_args()
+    main(args.number)
@@ -0,0 +1,38 @@
+"""Measure the time to import spnkr in a fresh interpreter."""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "import spnkr": "import spnkr",
+    "first client.stats": "import spnkr.services.stats",
+    "import spnkr.film": "import spnkr.film",
+}
+
+
+def _time(statement: str, number: int) -> float:
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(number: int) -> None:
+    baseline = _time("pass", number)
+    print(f"{'statement':<20} {'median (ms)':>12} {'over python (ms)':>17}")
+    print(f"{'python':<20} {baseline * 1e3:>12.1f} {0:>17.1f}")
+    for name, statement in STATEMENTS.items():
+        median = _time(statement, number)
+        print(f"{name:<20} {median * 1e3:>12.1f} {(median - baseline) * 1e3:>17.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=20)
+    args = parser.parse_args()
+    main(args.number)
@@ -0,0 +1,69 @@
+"""Compare parsing of response fixtures from decoded data and from raw JSON."""
+
+import argparse
+import json
+import timeit
+import typing
+from pathlib import Path
+
+from spnkr.models.discovery_ugc import AssetSearchPage, Film, Map, UgcGameVariant
+from spnkr.models.profile import User
+from spnkr.models.projection import project
+from spnkr.models.skill import MatchSkill
+from spnkr.models.stats import MatchHistory, MatchStats, ServiceRecord
+from spnkr.responses import type_adapter
+
+RESPONSES = Path(__file__).parents[1] / "tests" / "data" / "responses"
+MATCH_STATS_CORE = project(
+    MatchStats,
+    "match_info",
+    "players.player_id",
+    "players.player_team_stats.stats.core_stats",
+)
+FIXTURES = [
+    ("get_match_stats.json", MatchStats),
+    ("get_match_stats.json", MATCH_STATS_CORE),
+    ("get_match_stats_pve.json", MatchStats),
+    ("get_match_history.json", MatchHistory),
+    ("get_service_record.json", ServiceRecord),
+    ("get_match_skill.json", MatchSkill),
+    ("get_film_by_match_id.json", Film),
+    ("get_map.json", Map),
+    ("get_ugc_game_variant.json", UgcGameVariant),
+    ("search_assets.json", AssetSearchPage),
+    ("get_users.json", list[User]),
+]
+
+
+def _name(model) -> str:
+    if isinstance(model, type):
+        return model.__name__
+    return f"list[{typing.get_args(model)[0].__name__}]"
+
+
+def main(number: int) -> None:
+    print(
+        f"{'fixture':<28} {'model':<24} {'decoded (us)':>12} {'raw (us)':>10}"
+        f" {'speedup':>8}"
+    )
+    for file_name, model in FIXTURES:
+        body = (RESPONSES / file_name).read_bytes()
+        adapter = type_adapter(model)
+        before = timeit.timeit(
+            lambda: adapter.validate_python(json.loads(body)), number=number
+        )
+        after = timeit.timeit(lambda: adapter.validate_json(body), number=number)
+        before_us = before / number * 1e6
+        after_us = after / number * 1e6
+        print(
+            f"{file_name:<28} {_name(model):<24}"
+            f" {before_us:>12.1f} {after_us:>10.1f}"
+            f" {before / after:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.number)
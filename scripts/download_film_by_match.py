@@ -9,6 +9,7 @@ import dotenv
 from aiohttp import ClientSession
 
 from spnkr import AzureApp, HaloInfiniteClient, refresh_player_tokens
+from spnkr.film import download_film
 
 dotenv.load_dotenv()
 
@@ -18,10 +19,7 @@ CLIENT_SECRET = os.environ["SPNKR_CLIENT_SECRET"]
 REDIRECT_URI = os.environ["SPNKR_REDIRECT_URI"]
 
 
-async def main(match_id: str, output_dir: Path) -> None:
-    directory = output_dir / match_id
-    directory.mkdir(parents=True, exist_ok=True)
-
+async def main(match_id: str, output_dir: Path, concurrency: int) -> None:
     app = AzureApp(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI)
 
     async with ClientSession() as session:
@@ -31,22 +29,18 @@ async def main(match_id: str, output_dir: Path) -> None:
             spartan_token=player.spartan_token.token,
             clearance_token=player.clearance_token.token,
         )
-        resp = await client.discovery_ugc.get_film_by_match_id(match_id)
-        film = await resp.parse()
-
-        for chunk, url in film.get_chunks_and_urls():
-            chunk_type = chunk.chunk_type.name.lower()
-            print(f"Chunk(index={chunk.index} type={chunk_type})")
-            response = await session.get(url)
-            dest = directory / f"{str(chunk.index).zfill(2)}_{chunk_type}.gzip"
-            with open(dest, "wb") as f:
-                f.write(await response.read())
+        paths = await download_film(
+            client, match_id, output_dir / match_id, concurrency
+        )
+        for path in paths:
+            print(path)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("match_id")
     parser.add_argument("--output_dir", type=Path, default=Path("films"))
+    parser.add_argument("--concurrency", type=int, default=4)
     args = parser.parse_args()
 
-    asyncio.run(main(args.match_id, args.output_dir))
+    asyncio.run(main(args.match_id, args.output_dir, args.concurrency))
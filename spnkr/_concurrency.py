@@ -0,0 +1,60 @@
+"""Concurrency helpers shared by the client services and film reading."""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+async def as_completed(
+    keys: Iterable[K],
+    request: Callable[[K], Awaitable[T]],
+    concurrency: int,
+) -> AsyncIterator[tuple[K, T | Exception]]:
+    """Call `request` for each key concurrently, yielding results as completed.
+
+    At most `concurrency` requests are in flight at once, and keys are only
+    consumed from `keys` as requests complete. An exception raised for one
+    key is yielded as its result and does not affect the other requests.
+    Pending requests are cancelled if iteration stops early.
+
+    Args:
+        keys: The keys to request.
+        request: Function requesting the result for a key.
+        concurrency: Maximum number of requests in flight.
+
+    Yields:
+        Tuples of a key and its result, or the exception raised for it.
+
+    Raises:
+        ValueError: If `concurrency` is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least 1")
+    keys = iter(keys)
+    pending: dict[asyncio.Task[T], K] = {}
+
+    def start_next() -> None:
+        for key in keys:
+            pending[asyncio.ensure_future(request(key))] = key
+            return
+
+    try:
+        for _ in range(concurrency):
+            start_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = pending.pop(task)
+                start_next()
+                error = task.exception()
+                if error is None:
+                    yield key, task.result()
+                elif isinstance(error, Exception):
+                    yield key, error
+                else:
+                    raise error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -2,6 +2,7 @@
 
 from aiohttp import ClientSession
 
+from spnkr import tracing
 from spnkr.auth import app, halo, oauth, player, xbox
 
 XSTS_V3_XBOX_AUDIENCE = "http://xboxlive.com"
@@ -44,6 +45,7 @@ def _get_authorization_code(app: app.AzureApp) -> str:
     return input("Enter the code...").strip()
 
 
+@tracing.traced("spnkr.auth.refresh_player_tokens")
 async def refresh_player_tokens(
     session: ClientSession, app: app.AzureApp, oauth_refresh_token: str
 ) -> player.AuthenticatedPlayer:
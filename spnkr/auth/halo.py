@@ -6,6 +6,8 @@ from typing import Any
 
 from aiohttp import ClientSession
 
+from spnkr import tracing
+
 
 @dataclass(frozen=True)
 class SpartanToken:
@@ -49,6 +51,7 @@ class ClearanceToken:
         return self.raw["FlightConfigurationId"]
 
 
+@tracing.traced("spnkr.auth.request_spartan_token")
 async def request_spartan_token(
     session: ClientSession, halo_xsts_token: str
 ) -> SpartanToken:
@@ -77,6 +80,7 @@ async def request_spartan_token(
     return SpartanToken(await response.json())
 
 
+@tracing.traced("spnkr.auth.request_clearance_token")
 async def request_clearance_token(
     session: ClientSession, spartan_token: str
 ) -> ClearanceToken:
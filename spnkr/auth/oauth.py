@@ -6,6 +6,7 @@ from typing import Any
 
 from aiohttp import ClientSession
 
+from spnkr import tracing
 from spnkr.auth.app import AzureApp
 from spnkr.errors import OAuth2Error
 
@@ -56,6 +57,7 @@ def generate_authorization_url(app: AzureApp) -> str:
     return f"https://login.live.com/oauth20_authorize.srf?{query}"
 
 
+@tracing.traced("spnkr.auth.request_oauth_token")
 async def request_oauth_token(
     session: ClientSession, authorization_code: str, app: AzureApp
 ) -> OAuth2Token:
@@ -78,6 +80,7 @@ async def request_oauth_token(
     return await _oauth2_token_request(session, data, app)
 
 
+@tracing.traced("spnkr.auth.refresh_oauth_token")
 async def refresh_oauth_token(
     session: ClientSession, refresh_token: str, app: AzureApp
 ) -> OAuth2Token:
@@ -5,6 +5,7 @@ from typing import Any
 
 from aiohttp import ClientSession
 
+from spnkr import tracing
 from spnkr.xuid import wrap_xuid
 
 
@@ -67,6 +68,7 @@ class XSTSResponse:
         return f"XBL3.0 x={self.userhash};{self.token}"
 
 
+@tracing.traced("spnkr.auth.request_user_token")
 async def request_user_token(
     session: ClientSession,
     access_token: str,
@@ -97,6 +99,7 @@ async def request_user_token(
     return XAUResponse(await response.json())
 
 
+@tracing.traced("spnkr.auth.request_xsts_token")
 async def request_xsts_token(
     session: ClientSession, user_token: str, relying_party: str
 ) -> XSTSResponse:
@@ -0,0 +1,567 @@
+"""Response caching built into the client services.
+
+Unlike caching with `aiohttp-client-cache`, cached responses are looked up
+before a request is sent, skipping rate limiting and HTTP handling entirely.
+Parsed models are kept alongside the cached response body, so repeat lookups
+don't need to parse the response again.
+"""
+
+import asyncio
+import collections
+import enum
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+if TYPE_CHECKING:
+    from spnkr.services.base import Response
+
+__all__ = [
+    "ENDPOINT_MUTABILITY",
+    "IMMUTABLE_CONDITIONS",
+    "CacheEntry",
+    "CachePolicy",
+    "MemoryCache",
+    "Mutability",
+    "ResponseCache",
+    "SqliteCache",
+    "StoredResponse",
+]
+
+
+@dataclass
+class CacheEntry:
+    """A cached response.
+
+    Attributes:
+        url: The URL of the response.
+        status: The HTTP status code of the response.
+        headers: The response headers.
+        body: The raw response body.
+        expires: Monotonic time at which the entry expires. `None` if it
+            doesn't expire.
+        parsed: The last parser used on the body and its result.
+    """
+
+    url: str
+    status: int
+    headers: CIMultiDictProxy[str]
+    body: bytes
+    expires: float | None = None
+    parsed: tuple[Callable[[Any], Any], Any] | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_response(cls, response: "Response", body: bytes) -> "CacheEntry":
+        """Create an entry from a response and its body."""
+        headers = CIMultiDictProxy(CIMultiDict(response.headers))
+        return cls(str(response.url), response.status, headers, body)
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the entry has expired."""
+        return self.expires is not None and self.expires <= time.monotonic()
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers to revalidate the entry with."""
+        validators = {}
+        etag = self.headers.get("ETag")
+        if etag is not None:
+            validators["If-None-Match"] = etag
+        last_modified = self.headers.get("Last-Modified")
+        if last_modified is not None:
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def revalidate(self, headers: Mapping[str, str]) -> None:
+        """Update the validators of the entry from a "304 Not Modified" response."""
+        updated = CIMultiDict(self.headers)
+        for name in ("ETag", "Last-Modified"):
+            value = headers.get(name)
+            if value is not None:
+                updated[name] = value
+        self.headers = CIMultiDictProxy(updated)
+
+
+class StoredResponse:
+    """A response read from a `ResponseCache`.
+
+    Provides the subset of the `aiohttp.ClientResponse` interface used to read
+    responses.
+    """
+
+    from_cache = True
+
+    def __init__(self, entry: CacheEntry) -> None:
+        self.entry = entry
+
+    @property
+    def url(self) -> str:
+        return self.entry.url
+
+    @property
+    def status(self) -> int:
+        return self.entry.status
+
+    @property
+    def ok(self) -> bool:
+        return self.entry.status < 400
+
+    @property
+    def headers(self) -> CIMultiDictProxy[str]:
+        return self.entry.headers
+
+    def raise_for_status(self) -> None:
+        """Do nothing. Only successful responses are cached."""
+
+    def release(self) -> None:
+        """Do nothing. There is no connection to release."""
+
+    async def read(self) -> bytes:
+        """Read the response body."""
+        return self.entry.body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Read the response body as text."""
+        return self.entry.body.decode(encoding)
+
+    async def json(
+        self,
+        *,
+        encoding: str = "utf-8",
+        loads: Callable[[str], Any] = json.loads,
+        content_type: str | None = None,
+    ) -> Any:
+        """Read the response body as JSON."""
+        return loads(self.entry.body.decode(encoding))
+
+
+class Mutability(enum.Enum):
+    """How often the data returned by an endpoint changes."""
+
+    IMMUTABLE = "immutable"
+    """The data never changes once it exists, e.g. stats of a finished match."""
+    LONG = "long"
+    """The data changes rarely, e.g. game content files and profiles."""
+    SHORT = "short"
+    """The data changes frequently, e.g. service records and match history."""
+    UNCACHEABLE = "uncacheable"
+    """The data depends on the authenticated user, e.g. the current user's
+    profile, which changes with the tokens of the client. It is never cached."""
+
+
+ENDPOINT_MUTABILITY: Mapping[str, Mutability] = MappingProxyType(
+    {
+        "discovery_ugc.get_film_by_match_id": Mutability.LONG,
+        "discovery_ugc.get_map": Mutability.IMMUTABLE,
+        "discovery_ugc.get_map_mode_pair": Mutability.IMMUTABLE,
+        "discovery_ugc.get_playlist": Mutability.IMMUTABLE,
+        "discovery_ugc.get_ugc_game_variant": Mutability.IMMUTABLE,
+        "discovery_ugc.search_assets": Mutability.SHORT,
+        "economy.get_player_career_rank": Mutability.SHORT,
+        "economy.get_player_customization": Mutability.SHORT,
+        "economy.get_player_reward_track_operations": Mutability.SHORT,
+        "gamecms_hacs.get_career_reward_track": Mutability.LONG,
+        "gamecms_hacs.get_csr_season_calendar": Mutability.LONG,
+        "gamecms_hacs.get_image": Mutability.LONG,
+        "gamecms_hacs.get_medal_metadata": Mutability.LONG,
+        "gamecms_hacs.get_operation_reward_track": Mutability.LONG,
+        "gamecms_hacs.get_progression_file": Mutability.LONG,
+        "gamecms_hacs.get_season_calendar": Mutability.LONG,
+        "profile.get_current_user": Mutability.UNCACHEABLE,
+        "profile.get_user_by_gamertag": Mutability.LONG,
+        "profile.get_user_by_id": Mutability.LONG,
+        "profile.get_users_by_id": Mutability.LONG,
+        "skill.get_match_skill": Mutability.IMMUTABLE,
+        "skill.get_playlist_csr": Mutability.SHORT,
+        "stats.get_challenge_decks": Mutability.SHORT,
+        "stats.get_match_count": Mutability.SHORT,
+        "stats.get_match_history": Mutability.SHORT,
+        "stats.get_match_stats": Mutability.IMMUTABLE,
+        "stats.get_service_record": Mutability.SHORT,
+    }
+)
+"""Mutability of the data returned by each service method.
+
+Discovery UGC assets are requested by asset and version ID, and the content of
+an asset version doesn't change. Note that the `asset_stats` of a cached asset
+(e.g., play counts) are not refreshed.
+"""
+
+
+def _is_final_match_skill(body: bytes) -> bool:
+    """Whether the skill results of all players of a match are available."""
+    try:
+        values = json.loads(body)["Value"]
+        return all(value["ResultCode"] == 0 for value in values)
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+IMMUTABLE_CONDITIONS: Mapping[str, Callable[[bytes], bool]] = MappingProxyType(
+    {"skill.get_match_skill": _is_final_match_skill}
+)
+"""Checks of response bodies from immutable endpoints, by endpoint name.
+
+Responses failing the check are treated as `Mutability.LONG`. Match skill is
+only immutable once the skill results of all players are available, i.e. every
+result code is `SkillResultCode.SUCCESS`.
+"""
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Time-to-live (TTL) of cached responses by the mutability of their data.
+
+    TTLs are in seconds. `None` disables expiration and 0 disables caching.
+    Endpoints not found in `endpoints` are treated as `Mutability.SHORT`, and
+    responses from `Mutability.UNCACHEABLE` endpoints are never cached.
+
+    Attributes:
+        immutable: TTL of responses from immutable endpoints.
+        long: TTL of responses from endpoints with rarely changing data.
+        short: TTL of responses from endpoints with frequently changing data.
+        endpoints: Mutability of each endpoint, by endpoint name.
+        conditions: Checks of response bodies from immutable endpoints, by
+            endpoint name. Responses failing the check are treated as
+            `Mutability.LONG`.
+    """
+
+    immutable: float | None = None
+    long: float | None = 6 * 60 * 60
+    short: float | None = 60
+    endpoints: Mapping[str, Mutability] = field(
+        default_factory=lambda: ENDPOINT_MUTABILITY
+    )
+    conditions: Mapping[str, Callable[[bytes], bool]] = field(
+        default_factory=lambda: IMMUTABLE_CONDITIONS
+    )
+
+    def mutability(self, endpoint: str, body: bytes | None = None) -> Mutability:
+        """Get the mutability of the data returned by `endpoint`.
+
+        Args:
+            endpoint: The endpoint name.
+            body: A response body from `endpoint`, checked with the condition
+                of the endpoint, if any.
+        """
+        mutability = self.endpoints.get(endpoint, Mutability.SHORT)
+        if mutability is Mutability.IMMUTABLE and body is not None:
+            condition = self.conditions.get(endpoint)
+            if condition is not None and not condition(body):
+                return Mutability.LONG
+        return mutability
+
+    def ttl(self, endpoint: str, body: bytes | None = None) -> float | None:
+        """Get the TTL of responses from `endpoint`, such as `body`."""
+        mutability = self.mutability(endpoint, body)
+        if mutability is Mutability.IMMUTABLE:
+            return self.immutable
+        if mutability is Mutability.LONG:
+            return self.long
+        if mutability is Mutability.UNCACHEABLE:
+            return 0
+        return self.short
+
+
+class ResponseCache(ABC):
+    """Base class for response caches used by the client services.
+
+    The time-to-live of entries is determined by the cache policy unless it is
+    overridden for an endpoint.
+    """
+
+    def __init__(
+        self,
+        policy: CachePolicy | None = None,
+        ttls: Mapping[str, float | None] | None = None,
+    ) -> None:
+        """Initialize a response cache.
+
+        Args:
+            policy: The cache policy. Defaults to `CachePolicy()`.
+            ttls: Time-to-live of entries by endpoint name, such as
+                "gamecms_hacs.get_medal_metadata", overriding the policy. `None`
+                disables expiration and 0 disables caching.
+        """
+        self.policy = policy or CachePolicy()
+        self.ttls = dict(ttls or {})
+
+    def ttl(self, endpoint: str, body: bytes | None = None) -> float | None:
+        """Get the time-to-live of entries from `endpoint`, such as `body`."""
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+        return self.policy.ttl(endpoint, body)
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get the fresh entry stored for `key`, if any."""
+
+    async def get_stale(self, key: str) -> CacheEntry | None:
+        """Get the entry stored for `key`, if any, even if it has expired.
+
+        Expired entries are only kept if they can be revalidated with a
+        conditional request, i.e. they have an "ETag" or "Last-Modified" header.
+        """
+        return None
+
+    @abstractmethod
+    async def set(self, key: str, endpoint: str, entry: CacheEntry) -> None:
+        """Store `entry` for `key`, a response from `endpoint`."""
+
+
+class MemoryCache(ResponseCache):
+    """An in-memory, least-recently-used cache of responses.
+
+    Entries expire according to the cache policy. When the total size of the
+    cached response bodies exceeds `max_bytes`, the least recently used entries
+    are evicted.
+
+    By default, models parsed from cached responses are kept with their entries
+    so they aren't parsed again. `max_bytes` only counts the response bodies,
+    and parsed models can take several times the memory of their body, e.g.
+    about 110 KB for a 43 KB match stats response. Disable `keep_parsed` to
+    bound the memory used by the cache with `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        policy: CachePolicy | None = None,
+        ttls: Mapping[str, float | None] | None = None,
+        *,
+        keep_parsed: bool = True,
+    ) -> None:
+        """Initialize an in-memory cache.
+
+        Args:
+            max_bytes: Maximum total size of cached response bodies, not
+                including parsed models kept with them.
+            policy: The cache policy. Defaults to `CachePolicy()`.
+            ttls: Time-to-live of entries by endpoint name, such as
+                "gamecms_hacs.get_medal_metadata", overriding the policy. `None`
+                disables expiration and 0 disables caching.
+            keep_parsed: Whether to keep models parsed from cached responses.
+        """
+        super().__init__(policy, ttls)
+        self.max_bytes = max_bytes
+        self.keep_parsed = keep_parsed
+        self.hits = 0
+        """Number of lookups that found a fresh entry."""
+        self.misses = 0
+        """Number of lookups that didn't find a fresh entry."""
+        self._entries: collections.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached response bodies in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get the fresh entry stored for `key`, if any."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.is_expired:
+            if not entry.validators:
+                self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        if not self.keep_parsed:
+            # Models parsed from the returned copy are not kept in the cache.
+            return replace(entry)
+        return entry
+
+    async def get_stale(self, key: str) -> CacheEntry | None:
+        """Get the entry stored for `key`, if any, even if it has expired."""
+        entry = self._entries.get(key)
+        if entry is not None and not self.keep_parsed:
+            return replace(entry, parsed=None)
+        return entry
+
+    async def set(self, key: str, endpoint: str, entry: CacheEntry) -> None:
+        """Store `entry` for `key`, evicting old entries if necessary."""
+        ttl = self.ttl(endpoint, entry.body)
+        if ttl == 0 or len(entry.body) > self.max_bytes:
+            return
+        if ttl is not None:
+            entry.expires = time.monotonic() + ttl
+        if not self.keep_parsed:
+            # The caller may still parse `entry`, so store a copy of it.
+            entry = replace(entry, parsed=None)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._size += len(entry.body)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.body)
+
+
+class SqliteCache(ResponseCache):
+    """A persistent cache of responses stored in a SQLite database.
+
+    Response bodies are stored zlib-compressed. The database uses write-ahead
+    logging, so several processes can share a cache file, reading while another
+    process writes. Database operations run in a worker thread to keep the
+    event loop responsive.
+
+    By default, only responses from immutable endpoints, such as
+    `StatsService.get_match_stats`, are stored, since they never need to be
+    fetched again.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "spnkr_cache.sqlite",
+        policy: CachePolicy | None = None,
+        ttls: Mapping[str, float | None] | None = None,
+        *,
+        immutable_only: bool = True,
+        compression_level: int = 6,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize a SQLite cache.
+
+        Args:
+            path: Path to the database file, created if it doesn't exist.
+            policy: The cache policy. Defaults to `CachePolicy()`.
+            ttls: Time-to-live of entries by endpoint name, overriding the
+                policy. `None` disables expiration and 0 disables caching.
+            immutable_only: Whether to only store responses from endpoints whose
+                data is immutable according to the policy.
+            compression_level: zlib compression level of stored bodies (0-9).
+            timeout: Seconds to wait for a lock held by another connection.
+        """
+        super().__init__(policy, ttls)
+        self.path = Path(path)
+        self.immutable_only = immutable_only
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self.hits = 0
+        """Number of lookups that found a fresh entry."""
+        self.misses = 0
+        """Number of lookups that didn't find a fresh entry."""
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get the fresh entry stored for `key`, if any."""
+        entry = await asyncio.to_thread(self._get, key)
+        if entry is not None and entry.is_expired:
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def get_stale(self, key: str) -> CacheEntry | None:
+        """Get the entry stored for `key`, if any, even if it has expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, endpoint: str, entry: CacheEntry) -> None:
+        """Store `entry` for `key` if `endpoint` is cacheable."""
+        if self.immutable_only and (
+            self.policy.mutability(endpoint, entry.body) is not Mutability.IMMUTABLE
+        ):
+            return
+        ttl = self.ttl(endpoint, entry.body)
+        if ttl == 0:
+            return
+        await asyncio.to_thread(self._set, key, endpoint, entry, ttl)
+
+    async def clear(self) -> None:
+        """Remove all entries."""
+        await asyncio.to_thread(self._execute, "DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the database connection, creating the database if necessary."""
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, url TEXT NOT NULL, "
+                "status INTEGER NOT NULL, headers TEXT NOT NULL, "
+                "body BLOB NOT NULL, expires REAL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(sql, params)
+
+    def _get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT url, status, headers, body, expires FROM responses "
+                    "WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        url, status, headers, body, expires = row
+        headers = CIMultiDictProxy(CIMultiDict(json.loads(headers)))
+        entry = CacheEntry(url, status, headers, zlib.decompress(body))
+        if expires is not None:
+            # Stored expiration times are wall clock times shared by processes.
+            entry.expires = time.monotonic() + expires - time.time()
+            if entry.is_expired and not entry.validators:
+                self._execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        return entry
+
+    def _set(
+        self, key: str, endpoint: str, entry: CacheEntry, ttl: float | None
+    ) -> None:
+        expires = None if ttl is None else time.time() + ttl
+        headers = json.dumps(list(entry.headers.items()))
+        body = zlib.compress(entry.body, self.compression_level)
+        self._execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, endpoint, entry.url, entry.status, headers, body, expires),
+        )
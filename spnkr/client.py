@@ -1,23 +1,35 @@
 """Provides a client for the Halo Infinite API."""
 
+import contextlib
+import math
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterator, Mapping, TypeVar
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
     from aiohttp_client_cache.session import CachedSession
 
-from spnkr.services import (
-    DiscoveryUgcService,
-    EconomyService,
-    GameCmsHacsService,
-    ProfileService,
-    SkillService,
-    StatsService,
-)
+    from spnkr.services import (
+        DiscoveryUgcService,
+        EconomyService,
+        GameCmsHacsService,
+        ProfileService,
+        SkillService,
+        StatsService,
+    )
+
+from spnkr.cache import ResponseCache
+from spnkr.metrics import MetricsSink
+from spnkr.ratelimit import HOSTS, RateLimit, RateLimiterRegistry
+from spnkr.retry import Retrier, RetryBudget, RetryPolicy
+from spnkr.scheduler import PriorityScheduler
+from spnkr.services.base import BaseService
 
 __all__ = ["HaloInfiniteClient"]
 
+_S = TypeVar("_S", bound=BaseService)
+
 
 class HaloInfiniteClient:
     """A client for the Halo Infinite API."""
@@ -28,6 +40,13 @@ class HaloInfiniteClient:
         spartan_token: str,
         clearance_token: str,
         requests_per_second: int = 5,
+        rate_limits: Mapping[str, RateLimit] | None = None,
+        adaptive_rate_limit: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        cache: ResponseCache | None = None,
+        scheduler: PriorityScheduler | None = None,
+        metrics: MetricsSink | None = None,
     ) -> None:
         """Initialize a client for the Halo Infinite API.
 
@@ -36,14 +55,143 @@ class HaloInfiniteClient:
                 available via a `CachedSession` from `aiohttp-client-cache`.
             spartan_token: The spartan token used to authenticate with the API.
             clearance_token: The clearance token used to authenticate with the API.
-            requests_per_second: The rate limit to use. Note that this rate
-                limit is enforced per service, not globally. Defaults to 5
+            requests_per_second: The default rate limit to use. Note that this
+                rate limit is enforced per API host, not globally. Defaults to 5
                 requests per second.
+            rate_limits: Per-host rate limits overriding `requests_per_second`,
+                keyed by host (e.g., "halostats"). See `spnkr.ratelimit.HOSTS`
+                for valid keys. Limits are shared by all services.
+            adaptive_rate_limit: Whether to adapt the rate of each host to
+                throttling (HTTP 429/503) responses, starting from the
+                configured rates. The current rates are available from
+                `rate_limiters.rates`.
+            retry_policy: Rules for retrying requests that fail with transient
+                errors. Failed requests are not retried if neither
+                `retry_policy` nor `retry_budget` is provided.
+            retry_budget: Client-wide allowance of retries. Defaults to
+                `RetryBudget()` if `retry_policy` is provided.
+            cache: Cache of responses shared by the services, such as a
+                `spnkr.cache.MemoryCache`. Cached responses are returned without
+                sending requests.
+            scheduler: Grants rate limit permits to waiting requests by
+                priority, set with `spnkr.scheduler.priority`. Permits are
+                granted in FIFO order if not provided.
+            metrics: Receives per-endpoint request timings and counters, such
+                as a `spnkr.metrics.MemorySink`. Metrics are not recorded if
+                not provided.
         """
         self._session = session
-        self._requests_per_second = requests_per_second
+        self._rate_limiters = RateLimiterRegistry(
+            requests_per_second, limits=rate_limits, adaptive=adaptive_rate_limit
+        )
+        self._cache = cache
+        self._scheduler = scheduler
+        self._metrics = metrics
+        self._retrier = None
+        if retry_policy is not None or retry_budget is not None:
+            self._retrier = Retrier(retry_policy, retry_budget)
         self.set_tokens(spartan_token, clearance_token)
 
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def create(
+        cls,
+        spartan_token: str,
+        clearance_token: str,
+        requests_per_second: int = 5,
+        rate_limits: Mapping[str, RateLimit] | None = None,
+        *,
+        limit_per_host: int | None = None,
+        keepalive_timeout: float = 30,
+        ttl_dns_cache: int | None = 300,
+        timeout: ClientTimeout | None = None,
+        auto_decompress: bool = True,
+        **kwargs,
+    ) -> AsyncIterator["HaloInfiniteClient"]:
+        """Create a client with its own session, closed on exit.
+
+        The session's connection pool is sized for the configured rate limits,
+        keeps idle connections alive between requests, and caches DNS lookups.
+
+        ```python
+        async with HaloInfiniteClient.create(spartan, clearance) as client:
+            resp = await client.stats.get_match_stats(match_id)
+        ```
+
+        Args:
+            spartan_token: The spartan token used to authenticate with the API.
+            clearance_token: The clearance token used to authenticate with the API.
+            requests_per_second: The default rate limit to use for each host.
+            rate_limits: Per-host rate limits overriding `requests_per_second`.
+            limit_per_host: Maximum concurrent connections per host. Defaults to
+                the highest configured rate plus its burst allowance.
+            keepalive_timeout: Seconds to keep idle connections open for reuse.
+            ttl_dns_cache: Seconds to cache DNS lookups. `None` caches them
+                forever.
+            timeout: Timeout settings of the session. Defaults to a total
+                timeout of 60 seconds per request.
+            auto_decompress: Whether to decompress compressed response bodies.
+                Compressed responses are requested by default.
+            **kwargs: Other keyword arguments passed to `HaloInfiniteClient`,
+                such as `retry_policy` or `cache`.
+
+        Yields:
+            The client.
+        """
+        if limit_per_host is None:
+            limits = [RateLimit(requests_per_second), *(rate_limits or {}).values()]
+            limit_per_host = max(
+                math.ceil(limit.requests_per_second) + limit.burst for limit in limits
+            )
+        connector = TCPConnector(
+            limit=limit_per_host * len(HOSTS),
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            use_dns_cache=True,
+        )
+        session = ClientSession(
+            connector=connector,
+            timeout=timeout or ClientTimeout(total=60),
+            auto_decompress=auto_decompress,
+        )
+        async with session:
+            yield cls(
+                session,
+                spartan_token,
+                clearance_token,
+                requests_per_second,
+                rate_limits,
+                **kwargs,
+            )
+
+    @property
+    def rate_limiters(self) -> RateLimiterRegistry:
+        """Per-host rate limiters shared by the client services."""
+        return self._rate_limiters
+
+    @property
+    def retrier(self) -> Retrier | None:
+        """Retrier of failed requests, if retries are enabled.
+
+        Retry counts per endpoint are available from `retrier.retries`.
+        """
+        return self._retrier
+
+    @property
+    def scheduler(self) -> PriorityScheduler | None:
+        """Scheduler of rate limit permits, if requests are prioritized.
+
+        Queue depth and wait time statistics per priority class are available
+        from `scheduler.stats`.
+        """
+        return self._scheduler
+
+    @property
+    def metrics(self) -> MetricsSink | None:
+        """Receiver of request metrics, if metrics are enabled."""
+        return self._metrics
+
     def set_tokens(self, spartan_token: str, clearance_token: str) -> None:
         """Update the tokens used for authentication.
 
@@ -62,31 +210,54 @@ class HaloInfiniteClient:
         self._session.headers.update(update)
 
     @cached_property
-    def profile(self) -> ProfileService:
+    def profile(self) -> "ProfileService":
         """Profile data service. Get user data, such as XUIDs/gamertags."""
-        return ProfileService(self._session, self._requests_per_second)
+        from spnkr.services.profile import ProfileService
+
+        return self._create_service(ProfileService)
 
     @cached_property
-    def gamecms_hacs(self) -> GameCmsHacsService:
+    def gamecms_hacs(self) -> "GameCmsHacsService":
         """Game content management data service (e.g., medal metadata)"""
-        return GameCmsHacsService(self._session, self._requests_per_second)
+        from spnkr.services.gamecms_hacs import GameCmsHacsService
+
+        return self._create_service(GameCmsHacsService)
 
     @cached_property
-    def skill(self) -> SkillService:
+    def skill(self) -> "SkillService":
         """Skill data service. Retrieve MMR and CSR data by match or playlist."""
-        return SkillService(self._session, self._requests_per_second)
+        from spnkr.services.skill import SkillService
+
+        return self._create_service(SkillService)
 
     @cached_property
-    def stats(self) -> StatsService:
+    def stats(self) -> "StatsService":
         """Stats data service. Retrieve match history and match stats."""
-        return StatsService(self._session, self._requests_per_second)
+        from spnkr.services.stats import StatsService
+
+        return self._create_service(StatsService)
 
     @cached_property
-    def discovery_ugc(self) -> DiscoveryUgcService:
+    def discovery_ugc(self) -> "DiscoveryUgcService":
         """User-generated content discovery data service (maps, modes, etc.)."""
-        return DiscoveryUgcService(self._session, self._requests_per_second)
+        from spnkr.services.discovery_ugc import DiscoveryUgcService
+
+        return self._create_service(DiscoveryUgcService)
 
     @cached_property
-    def economy(self) -> EconomyService:
+    def economy(self) -> "EconomyService":
         """Store and customization data service."""
-        return EconomyService(self._session, self._requests_per_second)
+        from spnkr.services.economy import EconomyService
+
+        return self._create_service(EconomyService)
+
+    def _create_service(self, service_type: type[_S]) -> _S:
+        """Create a service sharing the client's session and request handling."""
+        return service_type(
+            self._session,
+            rate_limiters=self._rate_limiters,
+            retrier=self._retrier,
+            cache=self._cache,
+            scheduler=self._scheduler,
+            metrics=self._metrics,
+        )
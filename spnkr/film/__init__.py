@@ -1,6 +1,17 @@
 """Download and read Halo Infinite film chunks to extract match data."""
 
-from spnkr.film.api import read_highlight_events
+from spnkr.film.api import (
+    download_film,
+    iter_highlight_events,
+    read_highlight_events,
+    read_highlight_events_many,
+)
 from spnkr.film.highlight_events import HighlightEvent
 
-__all__ = ["read_highlight_events", "HighlightEvent"]
+__all__ = [
+    "download_film",
+    "iter_highlight_events",
+    "read_highlight_events",
+    "read_highlight_events_many",
+    "HighlightEvent",
+]
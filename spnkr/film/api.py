@@ -1,15 +1,40 @@
 """Film-reading API"""
 
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Literal, overload
 from uuid import UUID
 
-from aiohttp import ClientResponseError
+from aiohttp import ClientResponse, ClientResponseError
 
+from spnkr import tracing
+from spnkr._concurrency import as_completed
 from spnkr.client import HaloInfiniteClient
 from spnkr.errors import FilmReadError
 from spnkr.film import highlight_events
+from spnkr.film.highlight_events import HighlightEvent, HighlightEventTable
 
+if TYPE_CHECKING:
+    from spnkr.models.discovery_ugc import Film, FilmChunk
 
-async def read_highlight_events(client: HaloInfiniteClient, match_id: str | UUID):
+
+@overload
+async def read_highlight_events(
+    client: HaloInfiniteClient, match_id: str | UUID, *, table: Literal[False] = False
+) -> list[HighlightEvent]: ...
+
+
+@overload
+async def read_highlight_events(
+    client: HaloInfiniteClient, match_id: str | UUID, *, table: Literal[True]
+) -> HighlightEventTable: ...
+
+
+@tracing.traced("spnkr.film.read_highlight_events")
+async def read_highlight_events(
+    client: HaloInfiniteClient, match_id: str | UUID, *, table: bool = False
+) -> list[HighlightEvent] | HighlightEventTable:
     """Download and parse the highlight events chunk from a film asset for a given match.
 
     Only human (not bot) players have events available. Bot data is unlikely to be
@@ -32,31 +57,302 @@ async def read_highlight_events(client: HaloInfiniteClient, match_id: str | UUID
     Args:
         client: A client for requesting film metadata and downloading film data.
         match_id: The UUID of the match to read film data for.
+        table: Whether to read the events into a `HighlightEventTable` of
+            columns, as with `highlight_events.read_table`.
 
     Returns:
-        A list of HighlightEvent instances extracted from the downloaded data.
+        A list of HighlightEvent instances extracted from the downloaded data,
+        or a table of the events if `table` is true.
+
+    Raises:
+        spnkr.errors.FilmReadError when film data can't be retrieved or read.
+    """
+    url, version = await _get_highlight_events_chunk(client, match_id)
+    with tracing.span("spnkr.film.download", url=url):
+        response = await _request_chunk(client, url)
+        data = await response.read()
+
+    with tracing.span("spnkr.film.parse", version=version, size=len(data)):
+        if table:
+            return highlight_events.read_table(data, version, match_id)
+        return list(highlight_events.read(data, version))
+
+
+@overload
+def read_highlight_events_many(
+    client: HaloInfiniteClient,
+    match_ids: Iterable[str | UUID],
+    workers: int | None = None,
+    concurrency: int = 10,
+    *,
+    executor: Executor | None = None,
+    table: Literal[False] = False,
+) -> AsyncIterator[tuple[str | UUID, list[HighlightEvent] | Exception]]: ...
+
+
+@overload
+def read_highlight_events_many(
+    client: HaloInfiniteClient,
+    match_ids: Iterable[str | UUID],
+    workers: int | None = None,
+    concurrency: int = 10,
+    *,
+    executor: Executor | None = None,
+    table: Literal[True],
+) -> AsyncIterator[tuple[str | UUID, HighlightEventTable | Exception]]: ...
+
+
+def read_highlight_events_many(
+    client: HaloInfiniteClient,
+    match_ids: Iterable[str | UUID],
+    workers: int | None = None,
+    concurrency: int = 10,
+    *,
+    executor: Executor | None = None,
+    table: bool = False,
+) -> AsyncIterator[tuple[str | UUID, Any]]:
+    """Read highlight events for many matches, parsing chunks in worker processes.
+
+    Chunks are downloaded concurrently and parsed in a process pool, so parsing
+    uses several cores and does not block the event loop. Results are yielded
+    as matches complete, not in the order of `match_ids`. A match that fails
+    yields its exception without affecting the other matches.
+
+    ```python
+    async for match_id, result in read_highlight_events_many(client, ids):
+        if isinstance(result, Exception):
+            print(f"Failed to read {match_id}: {result}")
+        else:
+            print(match_id, len(result))
+    ```
+
+    With `table`, each match is read into a `HighlightEventTable`, which is
+    much cheaper to send back from a worker process than a list of events.
+    Tables of a batch of matches can be combined with
+    `HighlightEventTable.concat`.
+
+    Args:
+        client: A client for requesting film metadata and downloading film data.
+        match_ids: The UUIDs of the matches to read film data for. IDs are
+            consumed lazily as matches complete.
+        workers: Number of worker processes. Defaults to the number of CPUs.
+            Ignored if `executor` is given.
+        concurrency: Maximum number of matches downloaded or parsed at once.
+        executor: An executor to parse chunks with instead of a new process
+            pool. It is not shut down when iteration stops.
+        table: Whether to read the events of each match into a
+            `HighlightEventTable`, as with `highlight_events.read_table`.
+
+    Returns:
+        An async iterator of (match ID, highlight events or exception) tuples.
+
+    Raises:
+        ValueError: If `concurrency` or `workers` is less than 1.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("`workers` must be at least 1")
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least 1")
+    return _read_highlight_events_many(
+        client, match_ids, workers, concurrency, executor, table
+    )
+
+
+async def _read_highlight_events_many(
+    client: HaloInfiniteClient,
+    match_ids: Iterable[str | UUID],
+    workers: int | None,
+    concurrency: int,
+    executor: Executor | None,
+    table: bool,
+) -> AsyncIterator[tuple[str | UUID, Any]]:
+    pool = executor or ProcessPoolExecutor(workers)
+    loop = asyncio.get_running_loop()
+
+    async def read(match_id: str | UUID) -> list[HighlightEvent] | HighlightEventTable:
+        url, version = await _get_highlight_events_chunk(client, match_id)
+        with tracing.span("spnkr.film.download", url=url):
+            response = await _request_chunk(client, url)
+            data = await response.read()
+        with tracing.span("spnkr.film.parse", version=version, size=len(data)):
+            if table:
+                return await loop.run_in_executor(
+                    pool, highlight_events.read_table, data, version, match_id
+                )
+            return await loop.run_in_executor(pool, _read_list, data, version)
+
+    try:
+        async for result in as_completed(match_ids, read, concurrency):
+            yield result
+    finally:
+        if executor is None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def iter_highlight_events(
+    client: HaloInfiniteClient, match_id: str | UUID, chunk_size: int = 65_536
+) -> AsyncIterator[HighlightEvent]:
+    """Stream and parse the highlight events chunk from a film asset for a given match.
+
+    Events are parsed while the chunk downloads and yielded as they are found,
+    in the same order as `read_highlight_events` returns them. Only the part of
+    the chunk that may contain an event being read is kept in memory.
+
+    ```python
+    async for event in iter_highlight_events(client, match_id):
+        print(event.gamertag, event.event_type, event.time_ms)
+    ```
+
+    Args:
+        client: A client for requesting film metadata and downloading film data.
+        match_id: The UUID of the match to read film data for.
+        chunk_size: Number of bytes of the response to read at once.
+
+    Yields:
+        HighlightEvent instances extracted from the downloaded data.
 
     Raises:
         spnkr.errors.FilmReadError when film data can't be retrieved or read.
     """
+    url, version = await _get_highlight_events_chunk(client, match_id)
+    reader = highlight_events.StreamReader(version)
+    response = await _request_chunk(client, url)
+    try:
+        async for data in response.content.iter_chunked(chunk_size):
+            for event in reader.feed(data):
+                yield event
+    finally:
+        response.release()
+    for event in reader.close():
+        yield event
+
+
+@tracing.traced("spnkr.film.download_film")
+async def download_film(
+    client: HaloInfiniteClient,
+    match_id: str | UUID,
+    directory: str | Path,
+    concurrency: int = 4,
+    read_size: int = 65_536,
+) -> list[Path]:
+    """Download all chunks of the film of a given match to a directory.
+
+    Chunks are downloaded concurrently and written to disk as they are
+    received. Each chunk is saved as "<index>_<chunk type>.gzip", such as
+    "00_film_header.gzip", once its size matches the film metadata. Chunks
+    already saved are skipped, and partially downloaded chunks, kept with a
+    ".part" suffix, are resumed with HTTP range requests, so calling this again
+    after a failure only downloads the missing data.
+
+    ```python
+    paths = await download_film(client, match_id, Path("films") / match_id)
+    ```
+
+    Args:
+        client: A client for requesting film metadata and downloading film data.
+        match_id: The UUID of the match to download the film for.
+        directory: The directory to save the chunks in. It is created if needed.
+        concurrency: Maximum number of chunks downloaded at once.
+        read_size: Number of bytes of a response to read and write at once.
+
+    Returns:
+        Paths of the saved chunks, in order of index.
+
+    Raises:
+        ValueError: If `concurrency` is less than 1.
+        spnkr.errors.FilmReadError when film data can't be retrieved or a
+            downloaded chunk doesn't have the expected size.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    film = await _get_film(client, match_id)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download(chunk: "FilmChunk", url: str) -> Path:
+        chunk_type = chunk.chunk_type.name.lower()
+        path = directory / f"{chunk.index:02d}_{chunk_type}.gzip"
+        async with semaphore:
+            with tracing.span("spnkr.film.download", url=url):
+                await _download_chunk(client, url, path, chunk.chunk_size, read_size)
+        return path
+
+    tasks = [
+        asyncio.ensure_future(download(chunk, url))
+        for chunk, url in film.get_chunks_and_urls()
+    ]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _download_chunk(
+    client: HaloInfiniteClient, url: str, path: Path, size: int, read_size: int
+) -> None:
+    """Download a film chunk to `path`, resuming a partial download."""
+    if path.exists() and path.stat().st_size == size:
+        return
+    partial = path.with_name(f"{path.name}.part")
+    offset = partial.stat().st_size if partial.exists() else 0
+    if offset > size:
+        offset = 0
+    if offset < size:
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        response = await _request_chunk(client, url, headers)
+        try:
+            if response.status != 206:
+                offset = 0  # The range was ignored
+            with open(partial, "ab" if offset else "wb") as f:
+                async for data in response.content.iter_chunked(read_size):
+                    f.write(data)
+        finally:
+            response.release()
+    received = partial.stat().st_size
+    if received != size:
+        raise FilmReadError(
+            f"Downloaded {received} bytes of film chunk {path.name}, expected {size}"
+        )
+    partial.replace(path)
+
+
+def _read_list(data: bytes, version: int) -> list[HighlightEvent]:
+    """Read all highlight events of a chunk, in a worker process."""
+    return list(highlight_events.read(data, version))
+
+
+async def _get_film(client: HaloInfiniteClient, match_id: str | UUID) -> "Film":
+    """Get the film metadata of a match."""
     try:
         film_response = await client.discovery_ugc.get_film_by_match_id(match_id)
     except ClientResponseError as ex:
-        raise FilmReadError(
-            f"Error getting highlight events film metadata: {ex}"
-        ) from ex
-    film = await film_response.parse()
+        raise FilmReadError(f"Error getting film metadata: {ex}") from ex
+    return await film_response.parse()
+
+
+async def _get_highlight_events_chunk(
+    client: HaloInfiniteClient, match_id: str | UUID
+) -> tuple[str, int]:
+    """Get the highlight events chunk URL and the film major version of a match."""
+    film = await _get_film(client, match_id)
     url = film.highlight_events_url
     if url is None:
         raise FilmReadError("Film doesn't have a highlight events chunk")
+    return url, film.custom_data.film_major_version
+
 
-    response = await client._session.get(url)
+async def _request_chunk(
+    client: HaloInfiniteClient, url: str, headers: dict[str, str] | None = None
+) -> ClientResponse:
+    """Request a film chunk."""
+    response = await client._session.get(url, headers=headers)
     try:
         response.raise_for_status()
     except ClientResponseError as ex:
-        raise FilmReadError(
-            f"Error downloading highlight events film chunk: {ex}"
-        ) from ex
-
-    version = film.custom_data.film_major_version
-    return list(highlight_events.read(await response.read(), version))
+        response.release()
+        raise FilmReadError(f"Error downloading film chunk: {ex}") from ex
+    return response
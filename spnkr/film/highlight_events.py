@@ -1,19 +1,29 @@
 """Read highlight event film chunks."""
 
 import collections
+import struct
 import zlib
-from typing import Any, Literal, NamedTuple
-
-from bitstring import Bits
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Iterator, Literal, NamedTuple
+from uuid import UUID
 
 from spnkr.errors import FilmReadError
 from spnkr.film.medals import MEDALS
-from spnkr.models.stats import MatchStats, PlayerStats
 from spnkr.xuid import unwrap_xuid
 
+if TYPE_CHECKING:
+    from spnkr.models.stats import MatchStats, PlayerStats
+
 _MIN_XUID = int(2e15)
 _MAX_XUID = int(3e15)
+_XUID = struct.Struct("<Q")
 _XUID_BITS = 64
+# A XUID is followed by a 0x2d or 0x25 byte and a 0xc0 marker byte.
+_XUID_MARKERS = (b"\x2d\xc0", b"\x25\xc0")
+_EVENT_END = b"\x00\x00\x2e\xe0"
+_EVENT_BITS = 60 * 8
+_EVENT_WINDOW_BITS = 20_000
 _MODE = 10
 _DEATH = 20
 _KILL = 50
@@ -37,6 +47,8 @@ _MEDAL_SORTING_WEIGHTS = {
 }
 
 EventType = Literal["kill", "death", "medal", "mode"]
+EVENT_TYPES: tuple[EventType, ...] = ("kill", "death", "medal", "mode")
+"""Event types in the order of the codes in `HighlightEventTable.event_type`."""
 
 
 class HighlightEvent(NamedTuple):
@@ -60,7 +72,7 @@ class HighlightEvent(NamedTuple):
     """Name of the medal awarded for 'medal' event types. Otherwise `None`."""
 
 
-def read(data: bytes, version: int):
+def read(data: bytes, version: int) -> Iterator["HighlightEvent"]:
     """Iterate events found in highlight event file content.
 
     Args:
@@ -70,28 +82,329 @@ def read(data: bytes, version: int):
 
     Yields:
         Highlight events.
+
+    Raises:
+        FilmReadError: If the data of an event is incomplete.
     """
-    bits = Bits(bytes=zlib.decompress(data))
-    for start, _ in _find_xuids(bits):
-        yield _parse_event(bits, start, version)
+    views = _shifted_views(zlib.decompress(data))
+    event_format = _event_format(version)
+    for start, xuid in _find_xuids(views):
+        yield _parse_event(views, start, xuid, event_format)
+
+
+def read_table(
+    data: bytes, version: int, match_id: str | UUID | None = None
+) -> "HighlightEventTable":
+    """Read the events of highlight event file content into columns.
+
+    Unlike `read`, gamertags are decoded once per player and medal names are
+    not looked up, so reading is faster and the result is much smaller.
+
+    Args:
+        data: The gzip-compressed file data.
+        version: The major version of the film, available from either the film metadata
+            or the film header.
+        match_id: The ID of the match the data belongs to, kept in the table to
+            identify the match after tables are concatenated.
+
+    Returns:
+        A table of the events, in the order they are yielded by `read`.
+
+    Raises:
+        FilmReadError: If the data of an event is incomplete.
+    """
+    views = _shifted_views(zlib.decompress(data))
+    event_format = _event_format(version)
+    table = HighlightEventTable([match_id])
+    gamertags = table.gamertags
+    codes: dict[tuple[int, int], int] = {}
+    for start, xuid in _find_xuids(views):
+        gamertag_bytes, type_hint, time_ms, is_medal, medal_value = _unpack_event(
+            views, start, event_format
+        )
+        code = codes.get((type_hint, is_medal))
+        if code is None:
+            event_type = _infer_event_type(type_hint, is_medal == 1)
+            code = codes[type_hint, is_medal] = EVENT_TYPES.index(event_type)
+        if xuid not in gamertags:
+            gamertags[xuid] = _decode_gamertag(gamertag_bytes)
+        table.match.append(0)
+        table.xuid.append(xuid)
+        table.time_ms.append(time_ms)
+        table.type_hint.append(type_hint)
+        table.is_medal.append(is_medal == 1)
+        table.medal_value.append(medal_value)
+        table.event_type.append(code)
+    return table
+
+
+@dataclass
+class HighlightEventTable:
+    """Highlight events of one or more matches stored in columns.
+
+    Each column is an `array.array` with one value per event. Tables of many
+    matches are combined with `concat`, and columns can be viewed as NumPy
+    arrays with `to_numpy` for vectorized analysis.
+
+    ```python
+    table = HighlightEventTable.concat(
+        read_table(data, version, match_id) for match_id, data in chunks
+    )
+    columns = table.to_numpy()
+    kills = columns["event_type"] == EVENT_TYPES.index("kill")
+    xuids, counts = numpy.unique(columns["xuid"][kills], return_counts=True)
+    ```
+
+    Attributes:
+        match_ids: IDs of the matches in the table, indexed by `match`.
+        gamertags: Gamertags of the players in the table by XUID.
+        match: Index of the match of each event in `match_ids`.
+        xuid: Xbox user ID of the player each event is tied to.
+        time_ms: Timestamp of each event in milliseconds following the start
+            of its match.
+        type_hint: Byte value used to infer the event type.
+        is_medal: Byte value used to infer the event type.
+        medal_value: Byte value encoding the medal type for medal events.
+        event_type: Inferred event type, as an index in `EVENT_TYPES`.
+    """
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "match",
+        "xuid",
+        "time_ms",
+        "type_hint",
+        "is_medal",
+        "medal_value",
+        "event_type",
+    )
+
+    match_ids: list[str | UUID | None] = field(default_factory=list)
+    gamertags: dict[int, str] = field(default_factory=dict)
+    match: array = field(default_factory=lambda: array("I"))
+    xuid: array = field(default_factory=lambda: array("Q"))
+    time_ms: array = field(default_factory=lambda: array("I"))
+    type_hint: array = field(default_factory=lambda: array("B"))
+    is_medal: array = field(default_factory=lambda: array("B"))
+    medal_value: array = field(default_factory=lambda: array("B"))
+    event_type: array = field(default_factory=lambda: array("B"))
+
+    def __len__(self) -> int:
+        return len(self.xuid)
+
+    @classmethod
+    def concat(cls, tables: Iterable["HighlightEventTable"]) -> "HighlightEventTable":
+        """Combine tables into a table with the events of all their matches.
+
+        Args:
+            tables: The tables to combine.
+
+        Returns:
+            A new table with the events of `tables`, in order.
+        """
+        out = cls()
+        for table in tables:
+            offset = len(out.match_ids)
+            out.match_ids.extend(table.match_ids)
+            out.gamertags.update(table.gamertags)
+            out.match.extend(i + offset for i in table.match)
+            for name in cls.COLUMNS[1:]:
+                getattr(out, name).extend(getattr(table, name))
+        return out
+
+    def events(self) -> Iterator[HighlightEvent]:
+        """Iterate the events of the table as `HighlightEvent` instances."""
+        rows = zip(
+            self.xuid,
+            self.type_hint,
+            self.is_medal,
+            self.event_type,
+            self.time_ms,
+            self.medal_value,
+        )
+        for xuid, type_hint, is_medal, code, time_ms, medal_value in rows:
+            event_type = EVENT_TYPES[code]
+            yield HighlightEvent(
+                xuid=xuid,
+                gamertag=self.gamertags[xuid],
+                type_hint=type_hint,
+                is_medal=bool(is_medal),
+                event_type=event_type,
+                time_ms=time_ms,
+                medal_value=medal_value,
+                medal_name=MEDALS.get(medal_value) if event_type == "medal" else None,
+            )
+
+    def to_numpy(self) -> dict[str, Any]:
+        """View the columns as NumPy arrays.
+
+        Requires NumPy, which is installed with the "numpy" extra. The arrays
+        share memory with the table, which can't be extended while they exist.
 
+        Returns:
+            A dictionary of one-dimensional arrays by column name.
+        """
+        import numpy
 
-def _find_xuids(bits: Bits):
-    """Iterate XUID (start, value) tuples found in binary data."""
+        return {
+            name: numpy.frombuffer(column, dtype=column.typecode)
+            for name in self.COLUMNS
+            for column in [getattr(self, name)]
+        }
+
+
+class StreamReader:
+    """Read highlight events incrementally from parts of a compressed chunk.
+
+    Parts are decompressed as they are fed, and events are returned once the
+    data they span has been received. Only the data that may still contain the
+    start of an event is kept, so memory use does not grow with the size of the
+    chunk.
+
+    ```python
+    reader = StreamReader(version)
+    async for part in response.content.iter_chunked(65_536):
+        for event in reader.feed(part):
+            ...
+    for event in reader.close():
+        ...
+    ```
+    """
+
+    def __init__(self, version: int, max_buffer: int = 65_536) -> None:
+        """Initialize a stream reader.
+
+        Args:
+            version: The major version of the film, available from either the
+                film metadata or the film header.
+            max_buffer: Maximum number of decompressed bytes added to the buffer
+                at once.
+        """
+        self._format = _event_format(version)
+        self._max_buffer = max_buffer
+        self._decompressor = zlib.decompressobj()
+        self._buffer = b""
+        self._scanned = 0  # Bit position from which to search for XUID markers
+        self._pending: list[tuple[int, int]] = []
+
+    def feed(self, data: bytes) -> list[HighlightEvent]:
+        """Add a part of the compressed chunk.
+
+        Args:
+            data: The next part of the compressed chunk.
+
+        Returns:
+            Events completed by the part, in the order of the chunk.
+
+        Raises:
+            FilmReadError: If the data is not a valid compressed chunk or the
+                data of an event is incomplete.
+        """
+        events = []
+        while data:
+            try:
+                part = self._decompressor.decompress(data, self._max_buffer)
+            except zlib.error as ex:
+                raise FilmReadError(f"Invalid highlight events data: {ex}") from ex
+            data = self._decompressor.unconsumed_tail
+            if part:
+                events.extend(self._process(part, final=False))
+        return events
+
+    def close(self) -> list[HighlightEvent]:
+        """Finish reading the chunk.
+
+        Returns:
+            The remaining events.
+
+        Raises:
+            FilmReadError: If the chunk is incomplete or the data of an event
+                is incomplete.
+        """
+        part = self._decompressor.flush()
+        if not self._decompressor.eof:
+            raise FilmReadError("Incomplete highlight events data")
+        return self._process(part, final=True)
+
+    def _process(self, part: bytes, final: bool) -> list[HighlightEvent]:
+        """Scan the buffer extended by `part` and parse the events it completes."""
+        buffer = self._buffer + part
+        views = _shifted_views(buffer)
+        self._pending.extend(_find_xuids(views, self._scanned))
+        # Markers may extend past the end of the buffer until it is final
+        self._scanned = max(self._scanned, views.size - 8 * len(_XUID_MARKERS[0]) + 1)
+        events = []
+        while self._pending:
+            start, xuid = self._pending[0]
+            if not final and start + _EVENT_WINDOW_BITS > views.size:
+                break
+            events.append(_parse_event(views, start, xuid, self._format))
+            self._pending.pop(0)
+        # Keep the data of pending events and XUIDs of markers not yet found
+        keep = self._scanned - _XUID_BITS
+        if self._pending:
+            keep = min(keep, self._pending[0][0])
+        drop = max(keep, 0) // 8
+        self._buffer = buffer[drop:]
+        self._scanned -= drop * 8
+        self._pending = [(start - drop * 8, xuid) for start, xuid in self._pending]
+        return events
+
+
+class _Views(NamedTuple):
+    """Copies of data shifted left by 0 to 7 bits, and the data size in bits.
+
+    Events are not aligned to bytes. A value at bit position `i` of the data is
+    byte-aligned at byte `i // 8` of the view `shifted[i % 8]`, so values can
+    be found with `bytes.find` and read with `struct.unpack_from`.
+    """
+
+    shifted: list[bytes]
+    size: int
+
+
+def _shifted_views(data: bytes) -> _Views:
+    """Create views of `data` shifted by each bit offset within a byte."""
+    size = len(data) * 8
+    value = int.from_bytes(data, "big")
+    mask = (1 << size) - 1
+    shifted = [data]
+    shifted.extend(
+        ((value << shift) & mask).to_bytes(len(data), "big") for shift in range(1, 8)
+    )
+    return _Views(shifted, size)
+
+
+def _find_xuids(views: _Views, first: int = 0) -> Iterator[tuple[int, int]]:
+    """Iterate XUID (start bit, value) tuples with markers from bit `first` on."""
     # Example:
     # ------xuid------ --marker-
     # 2a5bf9c8f1010900 (2d|25)c0
-    for marker_start in bits.findall(Bits(hex="c0")):
-        xuid_end = marker_start - 8
-        if bits[xuid_end:marker_start].hex not in ("2d", "25"):
-            continue
-        xuid_start = xuid_end - _XUID_BITS
-        xuid_bits = bits[xuid_start:xuid_end]
-        if len(xuid_bits) < _XUID_BITS:
-            continue
-        xuid = xuid_bits.uintle
-        if _MIN_XUID < xuid < _MAX_XUID:
-            yield (xuid_start, xuid)
+    found = []
+    for shift, view in enumerate(views.shifted):
+        for marker in _XUID_MARKERS:
+            index = view.find(marker, -((shift - first) // 8))
+            while index >= 0:
+                start = index * 8 + shift - _XUID_BITS
+                # Skip matches using the padding bits at the end of shifted views
+                if start >= 0 and (index + len(marker)) * 8 + shift <= views.size:
+                    (xuid,) = _XUID.unpack_from(view, index - 8)
+                    if _MIN_XUID < xuid < _MAX_XUID:
+                        found.append((start, xuid))
+                index = view.find(marker, index + 2)
+    found.sort()
+    return iter(found)
+
+
+def _find_bits(views: _Views, pattern: bytes, start: int, end: int) -> int:
+    """Find the first bit position of `pattern` between bits `start` and `end`."""
+    end = min(end, views.size)
+    first = -1
+    for shift, view in enumerate(views.shifted):
+        # Bytes of the view containing bits from `start` up to `end`
+        index = view.find(pattern, -((shift - start) // 8), (end - shift) // 8)
+        if index >= 0 and (first < 0 or index * 8 + shift < first):
+            first = index * 8 + shift
+    return first
 
 
 def _infer_event_type(hint: int, is_medal: bool) -> EventType:
@@ -107,45 +420,45 @@ def _infer_event_type(hint: int, is_medal: bool) -> EventType:
     raise FilmReadError(f"Unhandled event type args: {hint=}, {is_medal=}")
 
 
-def _tokens(version: int) -> list[str]:
+def _event_format(version: int) -> struct.Struct:
     """Determine unpacking strategy based on the film major version."""
     if version <= 38 or version >= 41:
-        return [
-            "bytes:32",  # 16-character utf-16 gamertag (32 bytes)
-            "pad:120",  # Skip (15 bytes)
-            "uint:8",  # Type hint (1 byte)
-            "uint:32",  # Timestamp in milliseconds (4 bytes)
-            "pad:24",  # Skip (3 bytes)
-            "uint:8",  # 1 if event is medal, otherwise 0 (1 byte)
-            "pad:24",  # Skip (3 bytes)
-            "uint:8",  # Medal type (1 byte)
-        ]
-    return [
-        "pad:96",  # Skip (12 bytes)
-        "bytes:32",  # 16-character utf-16 gamertag (32 bytes)
-        "pad:24",  # Skip (3 bytes)
-        "uint:8",  # Type hint (1 byte)
-        "uint:32",  # Timestamp in milliseconds (4 bytes)
-        "pad:24",  # Skip (3 bytes)
-        "uint:8",  # 1 if event is medal, otherwise 0 (1 byte)
-        "pad:24",  # Skip (3 bytes)
-        "uint:8",  # Medal type (1 byte)
-    ]
-
-
-def _parse_event(bits: Bits, start: int, version: int) -> HighlightEvent:
-    """Parse an event from `bits` starting at `start`."""
-    selected = bits[start : start + 20_000]  # 20,000 bits just to capture the event
-    # Grab the relevent 60 bytes of event data and unpack the attributes
-    end = selected.find(Bits(hex="00002ee0"))[0]  # type: ignore
-    event_bits = selected[end - (60 * 8) : end]
-    values: list[Any] = event_bits.unpack(fmt=", ".join(_tokens(version)))
+        return struct.Struct(
+            ">"
+            "32s"  # 16-character utf-16 gamertag (32 bytes)
+            "15x"  # Skip (15 bytes)
+            "B"  # Type hint (1 byte)
+            "I"  # Timestamp in milliseconds (4 bytes)
+            "3x"  # Skip (3 bytes)
+            "B"  # 1 if event is medal, otherwise 0 (1 byte)
+            "3x"  # Skip (3 bytes)
+            "B"  # Medal type (1 byte)
+        )
+    return struct.Struct(
+        ">"
+        "12x"  # Skip (12 bytes)
+        "32s"  # 16-character utf-16 gamertag (32 bytes)
+        "3x"  # Skip (3 bytes)
+        "B"  # Type hint (1 byte)
+        "I"  # Timestamp in milliseconds (4 bytes)
+        "3x"  # Skip (3 bytes)
+        "B"  # 1 if event is medal, otherwise 0 (1 byte)
+        "3x"  # Skip (3 bytes)
+        "B"  # Medal type (1 byte)
+    )
+
+
+def _parse_event(
+    views: _Views, start: int, xuid: int, event_format: struct.Struct
+) -> HighlightEvent:
+    """Parse an event of the player with `xuid` from `views` starting at `start`."""
+    values = _unpack_event(views, start, event_format)
     gamertag_bytes, type_hint, time_ms, is_medal, medal_value = values
     event_type = _infer_event_type(type_hint, is_medal == 1)
     medal_name = MEDALS.get(medal_value) if event_type == "medal" else None
     return HighlightEvent(
-        xuid=selected[:_XUID_BITS].uintle,
-        gamertag=gamertag_bytes.decode("utf-16le").strip("\x00"),
+        xuid=xuid,
+        gamertag=_decode_gamertag(gamertag_bytes),
         type_hint=type_hint,
         is_medal=is_medal == 1,
         event_type=event_type,
@@ -155,6 +468,22 @@ def _parse_event(bits: Bits, start: int, version: int) -> HighlightEvent:
     )
 
 
+def _unpack_event(
+    views: _Views, start: int, event_format: struct.Struct
+) -> tuple[Any, ...]:
+    """Unpack the values of the event starting at bit `start` of `views`."""
+    # The 60 bytes of event data end at a marker near the XUID
+    end = _find_bits(views, _EVENT_END, start, start + _EVENT_WINDOW_BITS)
+    if end - _EVENT_BITS < start:
+        raise FilmReadError(f"Incomplete highlight event at bit {start}")
+    offset = end - _EVENT_BITS
+    return event_format.unpack_from(views.shifted[offset % 8], offset // 8)
+
+
+def _decode_gamertag(data: bytes) -> str:
+    return data.decode("utf-16le").strip("\x00")
+
+
 class _EventCounts(NamedTuple):
     """Container for storing expected or resulting event counts."""
 
@@ -163,7 +492,7 @@ class _EventCounts(NamedTuple):
     medals: int
 
 
-def check(events: list[HighlightEvent], match_stats: MatchStats) -> list[str]:
+def check(events: list[HighlightEvent], match_stats: "MatchStats") -> list[str]:
     """Check that parsed highlight events line up with match stats from the API.
 
     For each player, check that the number of kills, deaths, and medals parsed
@@ -212,7 +541,7 @@ def _group_events_by_xuid(
     return out
 
 
-def _get_player_stat_event_type_counts(player: PlayerStats) -> _EventCounts:
+def _get_player_stat_event_type_counts(player: "PlayerStats") -> _EventCounts:
     """Get expected event counts from player stats."""
     kills = deaths = medals = 0
     for player_team in player.player_team_stats:
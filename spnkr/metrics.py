@@ -0,0 +1,265 @@
+"""Instrumentation of requests made by the client services.
+
+Timings are recorded per endpoint (e.g., "stats.get_match_stats") for each
+stage of a request:
+
+- `LIMITER_WAIT`: Waiting for a rate limit permit.
+- `TIME_TO_HEADERS`: Sending the request until the response headers arrive.
+- `BODY_READ`: Reading the response body.
+- `DECODE`: Decoding the JSON body in `JsonResponse.parse`, if it is decoded
+  separately from validation.
+- `VALIDATE`: Validating the JSON into models in `JsonResponse.parse`. Service
+  responses are validated directly from the raw body, which includes decoding.
+
+Counters are recorded for cache hits and misses, retries, and response status
+codes. A request counts as a cache miss only if both the response cache and the
+session cache miss, and callers sharing an in-flight request aren't counted
+again. Metrics are only recorded if a sink is passed to the client.
+"""
+
+import bisect
+import collections
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = [
+    "BODY_READ",
+    "CACHE_HITS",
+    "CACHE_MISSES",
+    "DECODE",
+    "LIMITER_WAIT",
+    "RESPONSES",
+    "RETRIES",
+    "TIME_TO_HEADERS",
+    "VALIDATE",
+    "Histogram",
+    "LoggingSink",
+    "MemorySink",
+    "MetricsSink",
+    "PrometheusSink",
+]
+
+LIMITER_WAIT = "limiter_wait"
+TIME_TO_HEADERS = "time_to_headers"
+BODY_READ = "body_read"
+DECODE = "decode"
+VALIDATE = "validate"
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+RETRIES = "retries"
+RESPONSES = "responses"
+"""Counter of responses, labeled by status code."""
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Default upper bounds of histogram buckets in seconds."""
+
+
+class MetricsSink(ABC):
+    """Base class for receivers of request metrics."""
+
+    @abstractmethod
+    def observe(self, endpoint: str, name: str, seconds: float) -> None:
+        """Record the duration of a request stage."""
+
+    @abstractmethod
+    def count(self, endpoint: str, name: str, value: int = 1, **labels: str) -> None:
+        """Increment a counter."""
+
+
+@dataclass
+class Histogram:
+    """Distribution of observed durations.
+
+    Attributes:
+        buckets: Upper bounds of the buckets in seconds.
+        counts: Number of observations in each bucket, plus a final bucket for
+            observations above the last bound. Counts are not cumulative.
+        count: Total number of observations.
+        sum: Sum of the observations in seconds.
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def mean(self) -> float:
+        """Average observation in seconds."""
+        return self.sum / self.count if self.count else 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add an observation."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class MemorySink(MetricsSink):
+    """Keep metrics in memory for inspection with `snapshot`."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an in-memory sink.
+
+        Args:
+            buckets: Upper bounds of histogram buckets in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        """Histograms keyed by metric name and endpoint."""
+        self.counters: collections.Counter[tuple[str, str, tuple]] = (
+            collections.Counter()
+        )
+        """Counters keyed by metric name, endpoint, and sorted label items."""
+
+    def observe(self, endpoint: str, name: str, seconds: float) -> None:
+        """Record the duration of a request stage."""
+        histogram = self.histograms.get((name, endpoint))
+        if histogram is None:
+            histogram = self.histograms[name, endpoint] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def count(self, endpoint: str, name: str, value: int = 1, **labels: str) -> None:
+        """Increment a counter."""
+        self.counters[name, endpoint, tuple(sorted(labels.items()))] += value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get a copy of the recorded metrics.
+
+        Returns:
+            A dictionary with "histograms" and "counters" keys. Histograms map
+            metric names to endpoints to count, sum, mean, p50, p90, and p99
+            values. Counters map metric names to endpoints to counts, or to
+            counts by label values for labeled counters.
+        """
+        histograms: dict[str, dict[str, dict[str, float]]] = {}
+        for (name, endpoint), histogram in self.histograms.items():
+            histograms.setdefault(name, {})[endpoint] = {
+                "count": histogram.count,
+                "sum": histogram.sum,
+                "mean": histogram.mean,
+                "p50": histogram.quantile(0.5),
+                "p90": histogram.quantile(0.9),
+                "p99": histogram.quantile(0.99),
+            }
+        counters: dict[str, dict[str, Any]] = {}
+        for (name, endpoint, labels), value in self.counters.items():
+            by_endpoint = counters.setdefault(name, {})
+            if labels:
+                key = ",".join(str(v) for _, v in labels)
+                by_endpoint.setdefault(endpoint, {})[key] = value
+            else:
+                by_endpoint[endpoint] = value
+        return {"histograms": histograms, "counters": counters}
+
+    def clear(self) -> None:
+        """Remove all recorded metrics."""
+        self.histograms.clear()
+        self.counters.clear()
+
+
+class PrometheusSink(MemorySink):
+    """Keep metrics in memory for export in the Prometheus text format."""
+
+    def __init__(
+        self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "spnkr"
+    ) -> None:
+        """Initialize a Prometheus sink.
+
+        Args:
+            buckets: Upper bounds of histogram buckets in seconds.
+            prefix: Prefix of the exported metric names.
+        """
+        super().__init__(buckets)
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """Render the recorded metrics in the Prometheus text exposition format."""
+        lines = []
+        by_name = collections.defaultdict(list)
+        for (name, endpoint), histogram in sorted(self.histograms.items()):
+            by_name[name].append((endpoint, histogram))
+        for name, histograms in by_name.items():
+            metric = f"{self.prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for endpoint, histogram in histograms:
+                cumulative = 0
+                bounds = [*map(str, histogram.buckets), "+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    labels = _labels(endpoint=endpoint, le=bound)
+                    lines.append(f"{metric}_bucket{labels} {cumulative}")
+                labels = _labels(endpoint=endpoint)
+                lines.append(f"{metric}_sum{labels} {histogram.sum}")
+                lines.append(f"{metric}_count{labels} {histogram.count}")
+        counters = collections.defaultdict(list)
+        for (name, endpoint, labels), value in sorted(self.counters.items()):
+            counters[name].append((_labels(endpoint=endpoint, **dict(labels)), value))
+        for name, values in counters.items():
+            metric = f"{self.prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(f"{metric}{labels} {value}" for labels, value in values)
+        return "\n".join(lines) + "\n"
+
+
+class LoggingSink(MetricsSink):
+    """Log each metric as it is recorded."""
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.DEBUG
+    ) -> None:
+        """Initialize a logging sink.
+
+        Args:
+            logger: The logger to use. Defaults to the "spnkr.metrics" logger.
+            level: The level of the log records.
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def observe(self, endpoint: str, name: str, seconds: float) -> None:
+        """Log the duration of a request stage."""
+        self.logger.log(self.level, "%s %s %.6fs", endpoint, name, seconds)
+
+    def count(self, endpoint: str, name: str, value: int = 1, **labels: str) -> None:
+        """Log a counter increment."""
+        self.logger.log(self.level, "%s %s +%d %s", endpoint, name, value, labels)
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels."""
+    items = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+    return f"{{{items}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
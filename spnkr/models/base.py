@@ -20,6 +20,7 @@ class CamelCaseModel(BaseModel, frozen=True):
     model_config = {
         "alias_generator": _to_camel_case,
         "populate_by_name": True,
+        "defer_build": True,
     }
 
 
@@ -29,4 +30,5 @@ class PascalCaseModel(BaseModel, frozen=True):
     model_config = {
         "alias_generator": _to_pascal_case,
         "populate_by_name": True,
+        "defer_build": True,
     }
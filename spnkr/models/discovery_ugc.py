@@ -3,11 +3,11 @@
 import datetime as dt
 import urllib.parse
 from typing import Any
-from uuid import UUID
 
 from pydantic import Field
 
 from spnkr.models.base import PascalCaseModel
+from spnkr.models.interning import InternedUUID
 from spnkr.models.refdata import (
     AssetHome,
     AssetKind,
@@ -101,8 +101,8 @@ class Asset(PascalCaseModel, frozen=True):
         order: The asset's order.
     """
 
-    asset_id: UUID
-    version_id: UUID
+    asset_id: InternedUUID
+    version_id: InternedUUID
     public_name: str
     description: str
     files: AssetFiles
@@ -325,14 +325,14 @@ class AssetSearchResult(PascalCaseModel, frozen=True):
         number_of_ratings: The number of ratings the asset has received.
     """
 
-    asset_id: UUID
-    asset_version_id: UUID
+    asset_id: InternedUUID
+    asset_version_id: InternedUUID
     name: str
     description: str
     asset_kind: AssetKind
     tags: tuple[str, ...]
     thumbnail_url: str
-    referenced_assets: tuple[UUID, ...]
+    referenced_assets: tuple[InternedUUID, ...]
     original_author: str
     likes: int
     bookmarks: int
@@ -410,7 +410,7 @@ class FilmCustomData(PascalCaseModel, frozen=True):
     chunks: tuple[FilmChunk, ...]
     has_game_ended: bool
     manifest_refresh_seconds: int
-    match_id: UUID
+    match_id: InternedUUID
     film_major_version: int
 
 
@@ -427,7 +427,7 @@ class Film(PascalCaseModel, frozen=True):
     film_status_bond: FilmStatus
     custom_data: FilmCustomData
     blob_storage_path_prefix: str
-    asset_id: UUID
+    asset_id: InternedUUID
 
     @property
     def highlight_events_url(self) -> str | None:
@@ -0,0 +1,135 @@
+"""Interning of identifiers repeated across parsed models.
+
+Player IDs, asset IDs, and season IDs repeat across many responses, but each
+parsed model holds its own copy. With an intern pool installed, identifiers of
+the models in `spnkr.models.stats`, `spnkr.models.skill`, and
+`spnkr.models.discovery_ugc` are replaced by an equal instance kept in the pool
+while validating, so models parsed from different responses share them.
+
+```python
+from spnkr.models.interning import InternPool, set_intern_pool
+
+pool = InternPool(max_size=100_000)
+set_intern_pool(pool)
+...
+print(pool.stats.saved_bytes)
+```
+"""
+
+import collections
+import sys
+from dataclasses import dataclass
+from typing import Annotated, Hashable, TypeVar
+from uuid import UUID
+
+from pydantic import AfterValidator
+
+__all__ = [
+    "InternPool",
+    "InternStats",
+    "InternedStr",
+    "InternedUUID",
+    "get_intern_pool",
+    "set_intern_pool",
+]
+
+H = TypeVar("H", bound=Hashable)
+
+
+@dataclass
+class InternStats:
+    """Usage of an intern pool.
+
+    Attributes:
+        hits: Number of values found in the pool.
+        misses: Number of values added to the pool.
+        evictions: Number of values removed from a full pool.
+        saved_bytes: Size of the values replaced by an equal instance from the
+            pool, which is the memory saved while the parsed models are kept.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    saved_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of hits to interned values."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class InternPool:
+    """Bounded pool of shared instances of equal values.
+
+    When the pool is full, the least recently used value is removed. Models
+    holding a removed value keep it, but later models get a new instance.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        """Initialize an intern pool.
+
+        Args:
+            max_size: Maximum number of values kept in the pool.
+
+        Raises:
+            ValueError: If `max_size` is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self.stats = InternStats()
+        self._values: collections.OrderedDict[Hashable, Hashable] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: H) -> H:
+        """Get the pooled instance equal to `value`, adding `value` if needed."""
+        pooled = self._values.get(value)
+        if pooled is not None:
+            self._values.move_to_end(value)
+            self.stats.hits += 1
+            if pooled is not value:
+                self.stats.saved_bytes += sys.getsizeof(value)
+            return pooled  # type: ignore
+        self.stats.misses += 1
+        self._values[value] = value
+        if len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+            self.stats.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all values from the pool and reset its statistics."""
+        self._values.clear()
+        self.stats = InternStats()
+
+
+_pool: InternPool | None = None
+
+
+def set_intern_pool(pool: InternPool | None) -> None:
+    """Install a pool to intern identifiers of parsed models, or `None` to stop."""
+    global _pool
+    _pool = pool
+
+
+def get_intern_pool() -> InternPool | None:
+    """Get the installed intern pool, if interning is enabled."""
+    return _pool
+
+
+def _intern(value: H) -> H:
+    if _pool is None:
+        return value
+    return _pool.intern(value)
+
+
+InternedStr = Annotated[str, AfterValidator(_intern)]
+"""A string interned with the installed pool when validated."""
+InternedUUID = Annotated[UUID, AfterValidator(_intern)]
+"""A UUID interned with the installed pool when validated."""
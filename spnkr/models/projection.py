@@ -0,0 +1,177 @@
+"""Projections of response models limited to selected fields.
+
+A projection is a model with a subset of the fields of another model. Fields
+that are not selected are skipped when validating a response, which saves the
+time and memory needed to build their models.
+
+```python
+from spnkr.models.projection import project
+from spnkr.models.stats import MatchStats
+
+MatchStatsCore = project(
+    MatchStats,
+    "match_info",
+    "players.player_id",
+    "players.player_team_stats.stats.core_stats",
+)
+```
+
+Validators, properties, and methods of projected models are kept. Field
+validators only apply to the selected fields. Properties and methods raise an
+`AttributeError` if they use a field that is not selected. For example,
+`MatchStats.xuids` needs the "players.player_id" and "players.player_type"
+fields.
+"""
+
+import functools
+import inspect
+import types
+import typing
+from typing import Any, Iterable
+
+from pydantic import BaseModel, create_model, field_validator, model_validator
+
+__all__ = ["project"]
+
+_Tree = dict[str, "_Tree"]
+
+
+def project(model: type[BaseModel], *fields: str) -> type[BaseModel]:
+    """Create a projection of `model` containing only the selected fields.
+
+    Fields of nested models are selected with dotted paths, such as
+    "players.player_team_stats.stats.core_stats". Selecting a field with a
+    model type keeps all of its fields. Projections are cached, so projecting
+    the same fields again returns the same model.
+
+    Validators, properties, and methods of the projected models are kept.
+    Properties and methods raise an `AttributeError` if they use a field that
+    is not selected.
+
+    Args:
+        model: The model to project.
+        *fields: Names or dotted paths of the fields to keep.
+
+    Returns:
+        A frozen model named after `model` with only the selected fields.
+
+    Raises:
+        ValueError: If no fields are given, a field does not exist, a path
+            continues past a field without a model type, or a projected model
+            has serializers, computed fields, or deprecated validators.
+    """
+    if not fields:
+        raise ValueError("At least one field must be selected.")
+    return _project(model, tuple(sorted(set(fields))))
+
+
+@functools.cache
+def _project(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    tree: _Tree = {}
+    for path in fields:
+        node = tree
+        names = path.split(".")
+        for i, name in enumerate(names):
+            if name in node and not node[name]:
+                break  # A parent field is already selected in full.
+            node = node.setdefault(name, {})
+            if i == len(names) - 1:
+                node.clear()
+    return _build(model, tree, model.__name__)
+
+
+def _build(model: type[BaseModel], tree: _Tree, path: str) -> type[BaseModel]:
+    definitions: dict[str, Any] = {}
+    for name, subtree in tree.items():
+        info = model.model_fields.get(name)
+        if info is None:
+            raise ValueError(f"{path} has no field {name!r}.")
+        annotation = info.annotation
+        if subtree:
+            submodel = _find_model(annotation)
+            if submodel is None:
+                raise ValueError(f"{path}.{name} is not a model field.")
+            projected = _build(submodel, subtree, f"{path}.{name}")
+            annotation = _replace(annotation, submodel, projected)
+        definitions[name] = (annotation, info)
+    projection = create_model(
+        f"{model.__name__}Projection",
+        __config__=model.model_config,
+        __module__=__name__,
+        __validators__=_validators(model, definitions),
+        **definitions,
+    )
+    projection.__doc__ = f"Projection of `{model.__name__}`."
+    _copy_members(model, projection)
+    return projection
+
+
+def _validators(model: type[BaseModel], fields: Iterable[str]) -> dict[str, Any]:
+    """Recreate the validators of `model` that apply to the selected fields."""
+    decorators = model.__pydantic_decorators__
+    unsupported = (
+        decorators.validators
+        or decorators.root_validators
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.computed_fields
+    )
+    if unsupported:
+        raise ValueError(f"Projections of {model.__name__} are not supported.")
+    validators: dict[str, Any] = {}
+    for name, decorator in decorators.field_validators.items():
+        info = decorator.info
+        if "*" in info.fields:
+            selected = ["*"]
+        else:
+            selected = [f for f in info.fields if f in fields]
+        if selected:
+            func = _unbind(decorator.func)
+            validators[name] = field_validator(*selected, mode=info.mode)(func)
+    for name, decorator in decorators.model_validators.items():
+        func = _unbind(decorator.func)
+        validators[name] = model_validator(mode=decorator.info.mode)(func)
+    return validators
+
+
+def _unbind(func: Any) -> Any:
+    """Get a class method bound to the source model as an unbound class method."""
+    if inspect.ismethod(func):
+        return classmethod(func.__func__)
+    return func
+
+
+def _copy_members(model: type[BaseModel], projection: type[BaseModel]) -> None:
+    """Copy the properties and methods defined by `model` to its projection."""
+    for base in reversed(model.__mro__):
+        if base is BaseModel or not issubclass(base, BaseModel):
+            continue
+        for name, value in vars(base).items():
+            if name.startswith(("_", "model_")) or name in projection.model_fields:
+                continue
+            if isinstance(value, property) or inspect.isfunction(value):
+                setattr(projection, name, value)
+
+
+def _find_model(annotation: Any) -> type[BaseModel] | None:
+    """Find the model type in an annotation like `tuple[Model, ...] | None`."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        model = _find_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _replace(annotation: Any, old: type, new: type) -> Any:
+    """Replace a type nested in an annotation."""
+    if annotation is old:
+        return new
+    origin = typing.get_origin(annotation)
+    if origin is None:
+        return annotation
+    args = tuple(_replace(arg, old, new) for arg in typing.get_args(annotation))
+    if origin in (typing.Union, types.UnionType):
+        return typing.Union[args]
+    return origin[args]
@@ -0,0 +1,116 @@
+"""Compact records of parsed models for keeping many matches in memory.
+
+Parsed models keep their field values in a dictionary along with pydantic
+bookkeeping, which costs several kilobytes for each player of a match. Records
+are named tuples with the same fields, converted from and to models with
+`to_record` and `from_record`. Nested models are converted to records, and
+equal strings and UUIDs are shared between records when converted with the
+same `shared` mapping.
+
+```python
+from spnkr.models.records import from_record, to_record
+
+shared = {}
+records = [to_record(await resp.parse(), shared) for resp in responses]
+kills = records[0].players[0].player_team_stats[0].stats.core_stats.kills
+match_stats = from_record(records[0])
+```
+
+Record types are named after their model with a "Record" suffix, such as
+`MatchStatsRecord`, and are created on first use. Records do not have the
+properties of their models. Models nested in dictionary values are kept as
+they are.
+"""
+
+import collections
+import enum
+from typing import Any, MutableMapping
+from uuid import UUID
+
+from pydantic import BaseModel
+
+__all__ = ["from_record", "record_type", "to_record"]
+
+_RECORD_TYPES: dict[type[BaseModel], type[tuple]] = {}
+_MODELS: dict[type[tuple], type[BaseModel]] = {}
+
+
+def record_type(model: type[BaseModel]) -> type[tuple]:
+    """Get the named tuple type used for records of `model`.
+
+    Args:
+        model: The model type.
+
+    Returns:
+        A named tuple type with the fields of `model`.
+    """
+    record = _RECORD_TYPES.get(model)
+    if record is not None:
+        return record
+    name = f"{model.__name__}Record"
+    while name in globals():
+        # Projections of different fields share the name of their model.
+        name += "_"
+    record = collections.namedtuple(name, model.model_fields, module=__name__)
+    record.__doc__ = f"Compact record of `{model.__name__}`."
+    globals()[name] = record  # Allow pickling.
+    _RECORD_TYPES[model] = record
+    _MODELS[record] = model
+    return record
+
+
+def to_record(model: BaseModel, shared: MutableMapping[Any, Any] | None = None) -> Any:
+    """Convert a parsed model to a compact record.
+
+    Args:
+        model: The parsed model.
+        shared: Mapping of strings and UUIDs to the equal instances to use in
+            records. Values not in the mapping are added. Pass the same mapping
+            when converting many models to share their identifiers.
+
+    Returns:
+        A record of the model, with nested models converted to records.
+    """
+    if shared is None:
+        shared = {}
+    record = record_type(type(model))
+    return record._make(_compact(v, shared) for v in model.__dict__.values())
+
+
+def from_record(record: tuple) -> BaseModel:
+    """Convert a record created by `to_record` to its model.
+
+    The values of the record are not validated again.
+
+    Args:
+        record: The record.
+
+    Returns:
+        The model of the record, with nested records converted to models.
+
+    Raises:
+        TypeError: If `record` was not created by `to_record`.
+    """
+    model = _MODELS.get(type(record))
+    if model is None:
+        raise TypeError(f"Not a model record: {type(record).__name__}")
+    values = {k: _expand(v) for k, v in zip(record._fields, record)}
+    return model.model_construct(**values)
+
+
+def _compact(value: Any, shared: MutableMapping[Any, Any]) -> Any:
+    if isinstance(value, BaseModel):
+        return to_record(value, shared)
+    if type(value) is tuple:
+        return tuple(_compact(v, shared) for v in value)
+    if isinstance(value, (str, UUID)) and not isinstance(value, enum.Enum):
+        return shared.setdefault(value, value)
+    return value
+
+
+def _expand(value: Any) -> Any:
+    if type(value) in _MODELS:
+        return from_record(value)
+    if type(value) is tuple:
+        return tuple(_expand(v) for v in value)
+    return value
@@ -1,10 +1,9 @@
 """Models for the "skill" authority."""
 
-from uuid import UUID
-
 from pydantic import field_validator
 
 from spnkr.models.base import PascalCaseModel
+from spnkr.models.interning import InternedStr, InternedUUID
 from spnkr.models.refdata import SkillResultCode, SubTier, Tier
 from spnkr.models.types import ReadOnlyDict
 
@@ -104,7 +103,7 @@ class RankedRewards(PascalCaseModel, frozen=True):
         reward_id: The ID of the player's reward.
     """
 
-    reward_id: UUID
+    reward_id: InternedUUID
 
 
 class MatchSkillResult(PascalCaseModel, frozen=True):
@@ -146,7 +145,7 @@ class MatchSkillValue(PascalCaseModel, frozen=True):
         result: Skill data for a player in a match.
     """
 
-    id: str
+    id: InternedStr
     result_code: SkillResultCode
     result: MatchSkillResult
 
@@ -184,7 +183,7 @@ class PlaylistCsrValue(PascalCaseModel, frozen=True):
         result: CSR details for a player in a playlist.
     """
 
-    id: str
+    id: InternedStr
     result_code: SkillResultCode
     result: PlaylistCsrResult
 
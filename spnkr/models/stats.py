@@ -1,11 +1,11 @@
 """Models for the stats authority."""
 
 import datetime as dt
-from uuid import UUID
 
 from pydantic import Field
 
 from spnkr.models.base import PascalCaseModel
+from spnkr.models.interning import InternedStr, InternedUUID
 from spnkr.models.refdata import (
     AssetKind,
     BotDifficulty,
@@ -46,8 +46,8 @@ class Asset(PascalCaseModel, frozen=True):
     """
 
     asset_kind: AssetKind
-    asset_id: UUID
-    version_id: UUID
+    asset_id: InternedUUID
+    version_id: InternedUUID
 
 
 class MatchInfo(PascalCaseModel, frozen=True):
@@ -78,14 +78,14 @@ class MatchInfo(PascalCaseModel, frozen=True):
     duration: dt.timedelta
     lifecycle_mode: LifecycleMode
     game_variant_category: GameVariantCategory
-    level_id: UUID
+    level_id: InternedUUID
     map_variant: Asset
     ugc_game_variant: Asset
-    clearance_id: UUID
+    clearance_id: InternedUUID
     playlist: Asset | None
     playlist_experience: PlaylistExperience | None
     playlist_map_mode_pair: Asset | None
-    season_id: str | None
+    season_id: InternedStr | None
     playable_duration: dt.timedelta
     teams_enabled: bool
     team_scoring_enabled: bool
@@ -104,7 +104,7 @@ class MatchHistoryResult(PascalCaseModel, frozen=True):
         present_at_end_of_match: Whether the player was present at the end of the match.
     """
 
-    match_id: UUID
+    match_id: InternedUUID
     match_info: MatchInfo
     last_team_id: int
     outcome: Outcome
@@ -669,7 +669,7 @@ class PlayerStats(PascalCaseModel, frozen=True):
         player_team_stats: The player's performance statistics for each team they were on during the match.
     """
 
-    player_id: str
+    player_id: InternedStr
     player_type: PlayerType
     bot_attributes: BotAttributes | None
     last_team_id: int
@@ -694,7 +694,7 @@ class MatchStats(PascalCaseModel, frozen=True):
         players: Performance statistics for all players in the match.
     """
 
-    match_id: UUID
+    match_id: InternedUUID
     match_info: MatchInfo
     teams: tuple[TeamStats, ...]
     players: tuple[PlayerStats, ...]
@@ -716,10 +716,10 @@ class ServiceRecordSubqueries(PascalCaseModel, frozen=True):
         gameplay_interactions: Gameplay interactions available for filtering.
     """
 
-    season_ids: tuple[str, ...] | None
+    season_ids: tuple[InternedStr, ...] | None
     game_variant_categories: tuple[GameVariantCategory, ...] | None
     is_ranked: tuple[bool, ...] | None
-    playlist_asset_ids: tuple[UUID, ...] | None
+    playlist_asset_ids: tuple[InternedUUID, ...] | None
     gameplay_interactions: tuple[GameplayInteraction, ...] | None
 
 
@@ -0,0 +1,253 @@
+"""Rate limiting shared by the services of a client."""
+
+import asyncio
+import datetime as dt
+import math
+from email.utils import parsedate_to_datetime
+from typing import Mapping, NamedTuple, TypeAlias
+from urllib.parse import urlsplit
+
+from aiolimiter import AsyncLimiter
+
+__all__ = [
+    "HOSTS",
+    "MAX_RETRY_AFTER",
+    "THROTTLE_STATUSES",
+    "AdaptiveRateLimiter",
+    "RateLimit",
+    "RateLimiterRegistry",
+    "host_key",
+    "parse_retry_after",
+]
+
+HOSTS = (
+    "halostats",
+    "skill",
+    "profile",
+    "discovery-infiniteugc",
+    "economy",
+    "gamecms-hacs",
+)
+"""Keys of the Halo Infinite API hosts used by the client services."""
+THROTTLE_STATUSES = frozenset({429, 503})
+"""HTTP status codes indicating that requests should be slowed down."""
+MAX_RETRY_AFTER = 5 * 60.0
+"""Maximum delay in seconds parsed from a "Retry-After" header."""
+
+
+class RateLimit(NamedTuple):
+    """Request rate and burst allowance for a host.
+
+    Attributes:
+        requests_per_second: The sustained number of requests allowed per second.
+        burst: The number of requests that can be made back-to-back before the
+            sustained rate applies. A burst of 1 disallows bursts.
+    """
+
+    requests_per_second: float
+    burst: int = 1
+
+
+class AdaptiveRateLimiter:
+    """A token bucket rate limiter that adapts its rate to server feedback.
+
+    The rate is adjusted with additive increase/multiplicative decrease (AIMD).
+    Each successful response raises the rate so that it grows by about
+    `increase` requests per second every second at full throughput. A throttled
+    response (HTTP 429 or 503) multiplies the rate by `decrease` and pauses
+    requests for the duration of the "Retry-After" header, if provided.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int = 1,
+        *,
+        min_rate: float = 0.1,
+        max_rate: float | None = None,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ) -> None:
+        """Initialize an adaptive rate limiter.
+
+        Args:
+            requests_per_second: The initial rate.
+            burst: The number of requests that can be made back-to-back.
+            min_rate: The lower bound of the rate.
+            max_rate: The upper bound of the rate. Unbounded by default.
+            increase: Approximate rate increase per second of successful requests.
+            decrease: Factor applied to the rate when a request is throttled.
+
+        Raises:
+            ValueError: If the rate parameters are invalid.
+        """
+        if not 0 < min_rate <= requests_per_second:
+            raise ValueError("`min_rate` must be positive and <= the initial rate")
+        if max_rate is not None and max_rate < requests_per_second:
+            raise ValueError("`max_rate` must be >= the initial rate")
+        if not 0 < decrease < 1:
+            raise ValueError("`decrease` must be between 0 and 1")
+        self.rate = float(requests_per_second)
+        """The current requests per second."""
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = float(burst)
+        self._updated_at: float | None = None
+        self._paused_until = 0.0
+        self._decreased_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed. Waiters are served in FIFO order."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                self._refill(now)
+                delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+                if delay <= 0:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(delay)
+
+    def update(self, status: int, retry_after: str | None = None) -> None:
+        """Adjust the rate given the outcome of a request.
+
+        Decreases are applied at most once per second so that a batch of
+        concurrent throttled requests only reduces the rate once.
+
+        Args:
+            status: The HTTP status code of the response.
+            retry_after: The value of the "Retry-After" response header, if any.
+        """
+        now = asyncio.get_running_loop().time()
+        if status in THROTTLE_STATUSES:
+            if self._decreased_at is None or now - self._decreased_at >= 1:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._decreased_at = now
+            self._refill(now)
+            self._tokens = min(self._tokens, 0)
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                self._paused_until = max(self._paused_until, now + delay)
+        elif status < 400:
+            rate = self.rate + self.increase / self.rate
+            self.rate = rate if self.max_rate is None else min(rate, self.max_rate)
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last refill."""
+        if self._updated_at is not None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+Limiter: TypeAlias = AsyncLimiter | AdaptiveRateLimiter
+
+
+class RateLimiterRegistry:
+    """Rate limiters keyed by API host, shared by all services of a client.
+
+    Limiters are created on first use. Hosts without an explicit limit use the
+    default rate and burst.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 5,
+        burst: int = 1,
+        limits: Mapping[str, RateLimit] | None = None,
+        adaptive: bool = False,
+    ) -> None:
+        """Initialize a rate limiter registry.
+
+        Args:
+            requests_per_second: The default rate limit for each host.
+            burst: The default burst allowance for each host.
+            limits: Per-host overrides of the default rate limit, keyed by host
+                key (e.g., "halostats"). See `HOSTS` for the hosts used by the
+                client services.
+            adaptive: Whether to adapt each host's rate to throttling responses
+                using an `AdaptiveRateLimiter`. Configured rates are used as
+                the initial rates.
+
+        Raises:
+            ValueError: If a rate or burst is not positive.
+        """
+        self._default = RateLimit(requests_per_second, burst)
+        self._limits = dict(limits or {})
+        for limit in (self._default, *self._limits.values()):
+            if limit.requests_per_second <= 0 or limit.burst < 1:
+                raise ValueError(f"Invalid rate limit: {limit}")
+        self._adaptive = adaptive
+        self._limiters: dict[str, Limiter] = {}
+
+    def limit(self, host: str) -> RateLimit:
+        """Get the configured rate limit for `host`."""
+        return self._limits.get(host, self._default)
+
+    @property
+    def rates(self) -> dict[str, float]:
+        """The current requests per second of each host that has been requested."""
+        return {host: _get_rate(limiter) for host, limiter in self._limiters.items()}
+
+    def get(self, host: str) -> Limiter:
+        """Get the rate limiter for `host`, creating it if necessary."""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            rate, burst = self.limit(host)
+            if self._adaptive:
+                limiter = AdaptiveRateLimiter(rate, burst, min_rate=min(rate, 0.1))
+            else:
+                limiter = AsyncLimiter(burst, burst / rate)
+            self._limiters[host] = limiter
+        return limiter
+
+    def for_url(self, url: str) -> Limiter:
+        """Get the rate limiter for the host of `url`."""
+        return self.get(host_key(url))
+
+
+def host_key(url: str) -> str:
+    """Get the rate limit key for a URL.
+
+    The key is the first label of the URL's host name. For example,
+    "https://halostats.svc.halowaypoint.com:443/hi/matches" -> "halostats".
+    """
+    hostname = urlsplit(str(url)).hostname or ""
+    return hostname.split(".", 1)[0]
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a "Retry-After" header value into a delay in seconds.
+
+    Both the delay-seconds and HTTP-date forms are supported. The delay is
+    clamped between 0 and `MAX_RETRY_AFTER`. Returns `None` if the value is
+    missing or invalid, including non-finite numbers such as "inf" or "nan".
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            # Dates with a "-0000" zone are parsed as naive datetimes.
+            date = date.replace(tzinfo=dt.timezone.utc)
+        delay = (date - dt.datetime.now(dt.timezone.utc)).total_seconds()
+    if not math.isfinite(delay):
+        return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+def _get_rate(limiter: Limiter) -> float:
+    """Get the current requests per second of `limiter`."""
+    if isinstance(limiter, AdaptiveRateLimiter):
+        return limiter.rate
+    return limiter.max_rate / limiter.time_period
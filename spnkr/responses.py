@@ -1,18 +1,40 @@
 """Wrappers for API responses."""
 
-from dataclasses import dataclass
+import functools
+import json
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
+from spnkr import tracing
+from spnkr.metrics import DECODE, VALIDATE, MetricsSink
+
 if TYPE_CHECKING:
     from aiohttp import ClientResponse
     from aiohttp_client_cache.response import CachedResponse
+    from pydantic import TypeAdapter
+
+    from spnkr.cache import StoredResponse
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
 
 T = TypeVar("T")
 
 
+@functools.cache
+def type_adapter(type_: Any) -> "TypeAdapter":
+    """Get a cached pydantic `TypeAdapter` for `type_`, such as `list[User]`."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(type_)
+
+
 @dataclass(frozen=True)
 class _BaseResponse:
-    response: "ClientResponse | CachedResponse"
+    response: "ClientResponse | CachedResponse | StoredResponse"
 
     @property
     def from_cache(self) -> bool:
@@ -26,23 +48,105 @@ class _BaseResponse:
 
 @dataclass(frozen=True)
 class JsonResponse(_BaseResponse, Generic[T]):
-    """`ClientResponse` wrapper for a JSON HTTP response."""
+    """`ClientResponse` wrapper for a JSON HTTP response.
+
+    The parser is either a pydantic `TypeAdapter`, which validates the raw
+    response body in JSON mode without building intermediate Python objects,
+    or a function parsing the decoded JSON data.
+    """
+
+    _parser: "TypeAdapter[T] | Callable[[Any], T]"
+    _metrics: MetricsSink | None = field(default=None, repr=False)
+    _endpoint: str = ""
+    _memo: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    _parser: Callable[[Any], T]
+    async def read(self) -> bytes:
+        """Read the response content.
+
+        The content is read once and kept for later calls.
+        """
+        if "raw" not in self._memo:
+            self._memo["raw"] = await self.response.read()
+        return self._memo["raw"]
 
     async def json(self, **kwargs) -> Any:
         """Read the response body as JSON.
 
         Keyword arguments are passed to [aiohttp.ClientResponse.json](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.json).
+        Without keyword arguments, the body is decoded with `orjson` if it is
+        installed, and the decoded data is kept for later calls.
         """
-        return await self.response.json(**kwargs)
+        if kwargs:
+            return await self.response.json(**kwargs)
+        if "json" not in self._memo:
+            self._memo["json"] = _loads(await self.read())
+        return self._memo["json"]
 
     async def parse(self, **kwargs) -> T:
         """Parse the response data into the appropriate response model.
 
         Keyword arguments are passed to [aiohttp.ClientResponse.json](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.json).
+
+        Without keyword arguments, the parsed model is kept for later calls.
+        Models parsed from a response of the client's response cache are kept
+        in the cache, so parsing the same cached response again returns the
+        same model.
+        """
+        if kwargs:
+            with tracing.span("spnkr.parse", endpoint=self._endpoint):
+                return await self._parse(**kwargs)
+        if "parsed" not in self._memo:
+            self._memo["parsed"] = await self._parse_memoized()
+        return self._memo["parsed"]
+
+    async def parse_and_raw(self) -> tuple[T, bytes]:
+        """Parse the response data and get the raw response content.
+
+        The body is read and decoded once, so archiving the raw content does
+        not cost a second read.
+
+        Returns:
+            The parsed response model and the raw response content.
         """
-        return self._parser(await self.json(**kwargs))
+        return await self.parse(), await self.read()
+
+    async def _parse_memoized(self) -> T:
+        """Parse the response body, reusing a model kept in the cache entry."""
+        with tracing.span("spnkr.parse", endpoint=self._endpoint) as span:
+            entry = getattr(self.response, "entry", None)
+            if entry is None:
+                return await self._parse()
+            if entry.parsed is not None and entry.parsed[0] == self._parser:
+                if span is not None:
+                    span.set_attribute("memoized", True)
+                return entry.parsed[1]
+            result = await self._parse()
+            entry.parsed = (self._parser, result)
+            return result
+
+    async def _parse(self, **kwargs) -> T:
+        """Decode and parse the response body, timing both if instrumented."""
+        if not callable(self._parser):  # A TypeAdapter, imported lazily.
+            if kwargs:
+                return self._parser.validate_python(await self.json(**kwargs))
+            body = await self.read()
+            if self._metrics is None:
+                return self._parser.validate_json(body)
+            start = time.perf_counter()
+            result = self._parser.validate_json(body)
+            self._metrics.observe(self._endpoint, VALIDATE, time.perf_counter() - start)
+            return result
+        if self._metrics is None:
+            return self._parser(await self.json(**kwargs))
+        start = time.perf_counter()
+        data = await self.json(**kwargs)
+        decoded = time.perf_counter()
+        result = self._parser(data)
+        self._metrics.observe(self._endpoint, DECODE, decoded - start)
+        self._metrics.observe(self._endpoint, VALIDATE, time.perf_counter() - decoded)
+        return result
 
 
 class ImageResponse(_BaseResponse):
@@ -0,0 +1,176 @@
+"""Retrying failed requests with exponential backoff."""
+
+import asyncio
+import collections
+import random
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Awaitable, Callable, Mapping
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from spnkr.ratelimit import parse_retry_after
+
+if TYPE_CHECKING:
+    from spnkr.services.base import Response
+
+__all__ = ["RETRYABLE_STATUSES", "Retrier", "RetryBudget", "RetryPolicy"]
+
+RETRYABLE_STATUSES: Mapping[int, int] = MappingProxyType(
+    {408: 3, 429: 5, 500: 3, 502: 3, 503: 5, 504: 3}
+)
+"""Default maximum attempts for retryable HTTP status codes."""
+_RETRYABLE_ERRORS = (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Rules for retrying failed GET requests.
+
+    Delays grow exponentially with each attempt, i.e. `backoff * 2 ** n` for
+    the n-th retry, capped at `max_backoff`. With `jitter` enabled, the delay is
+    drawn uniformly between zero and that value ("full jitter") to spread out
+    retries from concurrent requests.
+
+    Attributes:
+        max_attempts: Maximum attempts, including the first, for requests that
+            fail with a connection error or timeout, including a connection
+            lost while reading the body of a successful response.
+        statuses: Maximum attempts, including the first, for each retryable
+            HTTP status code. Responses with other status codes are not retried.
+        backoff: Base delay in seconds.
+        max_backoff: Maximum delay in seconds, including delays requested by
+            a "Retry-After" header.
+        jitter: Whether to randomize delays.
+        respect_retry_after: Whether to wait at least as long as the
+            "Retry-After" header of a failed response requests. Responses
+            requesting a longer delay than `max_backoff` are not retried.
+    """
+
+    max_attempts: int = 3
+    statuses: Mapping[int, int] = field(default_factory=lambda: RETRYABLE_STATUSES)
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+
+    def delay(self, retry: int, retry_after: float | None = None) -> float:
+        """Get the delay in seconds before the `retry`-th retry (starting at 0).
+
+        The delay is at least `retry_after`, if respected, and at most
+        `max_backoff`.
+        """
+        delay = min(self.max_backoff, self.backoff * 2**retry)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and retry_after is not None:
+            delay = min(self.max_backoff, max(delay, retry_after))
+        return delay
+
+
+class RetryBudget:
+    """A client-wide allowance of retries, limiting retries to a share of requests.
+
+    The budget starts full with `max_tokens` tokens. Each retry spends a token
+    and each request earns `ratio` tokens back, up to `max_tokens`. During an
+    outage the budget is quickly spent, after which only about `ratio` retries
+    are made per request, so retries can't multiply the load on the API.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10) -> None:
+        """Initialize a retry budget.
+
+        Args:
+            ratio: Tokens earned per request.
+            max_tokens: Maximum (and initial) number of tokens.
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = float(max_tokens)
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens available."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Earn tokens for a request."""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend a token for a retry. Return `False` if the budget is exhausted."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class Retrier:
+    """Send requests, retrying failures according to a policy and a budget."""
+
+    def __init__(
+        self, policy: RetryPolicy | None = None, budget: RetryBudget | None = None
+    ) -> None:
+        """Initialize a retrier.
+
+        Args:
+            policy: The retry policy. Defaults to `RetryPolicy()`.
+            budget: The retry budget to share across requests. Defaults to
+                `RetryBudget()`.
+        """
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self.retries: collections.Counter[str] = collections.Counter()
+        """Count of retries made for each endpoint."""
+
+    async def send(
+        self, endpoint: str, request: Callable[[], Awaitable["Response"]]
+    ) -> "Response":
+        """Call `request` until it succeeds or can't be retried.
+
+        Args:
+            endpoint: Name of the endpoint requested, used to count retries.
+            request: Function sending the request and returning the response.
+
+        Returns:
+            The last response received. It may have a failed status code if the
+            retries are exhausted or its "Retry-After" header requests a longer
+            delay than the `max_backoff` of the policy.
+
+        Raises:
+            aiohttp.ClientConnectionError: If the last attempt failed to connect.
+            asyncio.TimeoutError: If the last attempt timed out.
+        """
+        self.budget.deposit()
+        retry = 0
+        while True:
+            try:
+                response = await request()
+            except _RETRYABLE_ERRORS:
+                if not self._can_retry(retry, self.policy.max_attempts):
+                    raise
+                delay = self.policy.delay(retry)
+            else:
+                max_attempts = self.policy.statuses.get(response.status, 1)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if self._waits_too_long(retry_after) or not self._can_retry(
+                    retry, max_attempts
+                ):
+                    return response
+                delay = self.policy.delay(retry, retry_after)
+                response.release()
+            self.retries[endpoint] += 1
+            await asyncio.sleep(delay)
+            retry += 1
+
+    def _waits_too_long(self, retry_after: float | None) -> bool:
+        """Whether a "Retry-After" delay is too long to wait for a retry."""
+        return (
+            self.policy.respect_retry_after
+            and retry_after is not None
+            and retry_after > self.policy.max_backoff
+        )
+
+    def _can_retry(self, retry: int, max_attempts: int) -> bool:
+        """Whether another attempt is allowed after `retry` retries."""
+        return retry + 1 < max_attempts and self.budget.withdraw()
@@ -0,0 +1,166 @@
+"""Prioritized scheduling of requests waiting for rate limit permits."""
+
+import asyncio
+import contextlib
+import contextvars
+import enum
+import itertools
+from dataclasses import dataclass
+from typing import Iterator
+
+from spnkr.ratelimit import Limiter
+
+__all__ = ["Priority", "PriorityScheduler", "QueueStats", "get_priority", "priority"]
+
+
+class Priority(enum.IntEnum):
+    """Priority class of a request. Lower values are served first."""
+
+    HIGH = 0
+    """Interactive requests, such as a user looking up their last match."""
+    NORMAL = 1
+    """The default priority."""
+    LOW = 2
+    """Background requests, such as historical backfills."""
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "spnkr_priority", default=Priority.NORMAL
+)
+
+
+@contextlib.contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """Set the priority of requests made within the context.
+
+    The priority applies to requests made in the current task and in tasks
+    created within the context. Concurrent requests for the same resource share
+    a single request, which runs with the priority of the first caller.
+
+    ```python
+    with priority(Priority.LOW):
+        await client.stats.get_match_stats(match_id)
+    ```
+    """
+    token = _priority.set(Priority(level))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def get_priority() -> Priority:
+    """Get the priority of requests made in the current context."""
+    return _priority.get()
+
+
+@dataclass
+class QueueStats:
+    """Statistics of requests of a priority class.
+
+    Attributes:
+        depth: Number of requests waiting for a permit.
+        dispatched: Number of requests that received a permit.
+        total_wait: Total seconds dispatched requests waited for a permit.
+        max_wait: Longest wait of a dispatched request in seconds.
+    """
+
+    depth: int = 0
+    dispatched: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Average seconds dispatched requests waited for a permit."""
+        return self.total_wait / self.dispatched if self.dispatched else 0.0
+
+
+@dataclass
+class _Waiter:
+    priority: Priority
+    enqueued_at: float
+    order: int
+    future: asyncio.Future[None]
+
+
+class PriorityScheduler:
+    """Grant rate limit permits to waiting requests by priority.
+
+    Each rate limiter gets its own queue. When a permit becomes available, it
+    is granted to the waiting request with the highest effective priority, and
+    to the longest waiting one among equals. A request's effective priority
+    rises by one class for every `aging` seconds it waits, so low priority
+    requests are delayed by high priority traffic but never starved.
+    """
+
+    def __init__(self, aging: float = 10.0) -> None:
+        """Initialize a priority scheduler.
+
+        Args:
+            aging: Seconds of waiting that raise a request's effective priority
+                by one class.
+
+        Raises:
+            ValueError: If `aging` is not positive.
+        """
+        if aging <= 0:
+            raise ValueError("`aging` must be positive")
+        self.aging = aging
+        self.stats = {level: QueueStats() for level in Priority}
+        """Queue depth and wait time statistics by priority class."""
+        self._queues: dict[Limiter, list[_Waiter]] = {}
+        self._dispatchers: dict[Limiter, asyncio.Task[None]] = {}
+        self._order = itertools.count()
+
+    async def acquire(self, limiter: Limiter, level: Priority | None = None) -> None:
+        """Wait for a permit from `limiter`.
+
+        Args:
+            limiter: The rate limiter of the requested host.
+            level: The priority of the request. Defaults to the priority of the
+                current context.
+        """
+        loop = asyncio.get_running_loop()
+        level = get_priority() if level is None else Priority(level)
+        waiter = _Waiter(level, loop.time(), next(self._order), loop.create_future())
+        self._queues.setdefault(limiter, []).append(waiter)
+        self.stats[level].depth += 1
+        dispatcher = self._dispatchers.get(limiter)
+        if dispatcher is None or dispatcher.done():
+            self._dispatchers[limiter] = loop.create_task(self._dispatch(limiter))
+        try:
+            await waiter.future
+        finally:
+            if not waiter.future.done():
+                waiter.future.cancel()
+
+    async def _dispatch(self, limiter: Limiter) -> None:
+        """Grant permits from `limiter` until its queue is empty."""
+        loop = asyncio.get_running_loop()
+        queue = self._queues[limiter]
+        while self._prune(queue):
+            await limiter.acquire()
+            if not self._prune(queue):
+                break  # All waiters were cancelled while acquiring the permit.
+            now = loop.time()
+            waiter = min(queue, key=lambda w: (self._rank(w, now), w.order))
+            queue.remove(waiter)
+            stats = self.stats[waiter.priority]
+            stats.depth -= 1
+            stats.dispatched += 1
+            wait = now - waiter.enqueued_at
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            waiter.future.set_result(None)
+
+    def _prune(self, queue: list[_Waiter]) -> bool:
+        """Remove cancelled waiters from `queue`. Return whether any remain."""
+        for waiter in [w for w in queue if w.future.done()]:
+            queue.remove(waiter)
+            self.stats[waiter.priority].depth -= 1
+        return bool(queue)
+
+    def _rank(self, waiter: _Waiter, now: float) -> float:
+        """Get the effective priority of `waiter`, raised by its waiting time."""
+        return waiter.priority - (now - waiter.enqueued_at) / self.aging
@@ -2,14 +2,21 @@
 
 Access service instances via
 [HaloInfiniteClient][spnkr.client.HaloInfiniteClient] properties.
+
+Service modules, and the response models they import, are loaded on first
+access.
 """
 
-from spnkr.services.discovery_ugc import DiscoveryUgcService
-from spnkr.services.economy import EconomyService
-from spnkr.services.gamecms_hacs import GameCmsHacsService
-from spnkr.services.profile import ProfileService
-from spnkr.services.skill import SkillService
-from spnkr.services.stats import StatsService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from spnkr.services.discovery_ugc import DiscoveryUgcService
+    from spnkr.services.economy import EconomyService
+    from spnkr.services.gamecms_hacs import GameCmsHacsService
+    from spnkr.services.profile import ProfileService
+    from spnkr.services.skill import SkillService
+    from spnkr.services.stats import StatsService
 
 __all__ = [
     "DiscoveryUgcService",
@@ -19,3 +26,25 @@ __all__ = [
     "SkillService",
     "StatsService",
 ]
+
+_MODULES = {
+    "DiscoveryUgcService": "spnkr.services.discovery_ugc",
+    "EconomyService": "spnkr.services.economy",
+    "GameCmsHacsService": "spnkr.services.gamecms_hacs",
+    "ProfileService": "spnkr.services.profile",
+    "SkillService": "spnkr.services.skill",
+    "StatsService": "spnkr.services.stats",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
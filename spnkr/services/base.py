@@ -1,37 +1,282 @@
 """Base service class."""
 
-from typing import TYPE_CHECKING, TypeAlias
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Mapping, TypeAlias
+from urllib.parse import urlencode
 
-from aiolimiter import AsyncLimiter
+from spnkr import metrics, tracing
+from spnkr.cache import CacheEntry, ResponseCache, StoredResponse
+from spnkr.metrics import MetricsSink
+from spnkr.ratelimit import AdaptiveRateLimiter, RateLimiterRegistry, host_key
+from spnkr.responses import JsonResponse, type_adapter
+from spnkr.retry import Retrier
+from spnkr.scheduler import PriorityScheduler
+from spnkr.tracing import Span
 
 if TYPE_CHECKING:
     from aiohttp import ClientResponse, ClientSession
+    from aiohttp_client_cache.backends import CacheBackend
     from aiohttp_client_cache.response import CachedResponse
     from aiohttp_client_cache.session import CachedSession
 
-Response: TypeAlias = "ClientResponse | CachedResponse"
+Response: TypeAlias = "ClientResponse | CachedResponse | StoredResponse"
 Session: TypeAlias = "ClientSession | CachedSession"
 
 
 class BaseService:
     """Base service class. Handles initialization and rate limiting requests."""
 
-    def __init__(self, session: Session, requests_per_second: int = 5) -> None:
+    def __init__(
+        self,
+        session: Session,
+        requests_per_second: int = 5,
+        *,
+        rate_limiters: RateLimiterRegistry | None = None,
+        retrier: Retrier | None = None,
+        cache: ResponseCache | None = None,
+        scheduler: PriorityScheduler | None = None,
+        metrics: MetricsSink | None = None,
+    ) -> None:
         """Initialize a service.
 
         Args:
             session: The authenticated aiohttp session to use.
-            requests_per_second: The rate limit to use.
+            requests_per_second: The rate limit to use if `rate_limiters` is
+                not provided.
+            rate_limiters: Per-host rate limiters to share with other services.
+                If not provided, the service uses its own limiters.
+            retrier: Retries failed requests. Failed requests are not retried
+                if not provided.
+            cache: Cache of responses to share with other services.
+            scheduler: Grants rate limit permits to waiting requests by
+                priority. Permits are granted in FIFO order if not provided.
+            metrics: Receives request metrics. Metrics are not recorded if not
+                provided.
         """
         self._session = session
-        # Setting the max rate to 1 disallows bursts.
-        self._rate_limiter = AsyncLimiter(1, 1 / requests_per_second)
-
-    async def _get(self, url: str, **kwargs) -> Response:
-        """Make a GET request to `url` and return the response."""
-        response = await self._session.get(url, **kwargs)
-        if not hasattr(response, "from_cache"):
-            # Only rate limit non-cached responses.
-            await self._rate_limiter.acquire()
+        if rate_limiters is None:
+            rate_limiters = RateLimiterRegistry(requests_per_second)
+        self._rate_limiters = rate_limiters
+        self._retrier = retrier
+        self._cache = cache
+        self._scheduler = scheduler
+        self._metrics = metrics
+        self._in_flight: dict[str, asyncio.Task[Response]] = {}
+
+    async def _get(
+        self, url: str, *, endpoint: str | None = None, **kwargs
+    ) -> Response:
+        """Make a GET request to `url` and return the response.
+
+        Concurrent requests for the same URL, query parameters, and
+        "Accept-Language" header share a single request and response. The
+        shared request runs with the scheduler priority and tracing context of
+        the first caller. The response body is read before it is returned. If the service has a
+        response cache, cached responses are returned without sending a request.
+
+        Expired cache entries with an "ETag" or "Last-Modified" header are
+        revalidated with a conditional request. If the response is "304 Not
+        Modified", the cached response, including any parsed model, is reused.
+
+        A rate limit permit is acquired before the request is sent. Responses
+        available from the session cache are returned without waiting for a
+        permit. Failed requests are retried if the service has a retrier.
+
+        Args:
+            url: The URL to request.
+            endpoint: Name of the requested endpoint, such as
+                "stats.get_match_stats". Defaults to the host key of `url`.
+            **kwargs: Keyword arguments passed to the session's `get` method.
+        """
+        with tracing.span("spnkr.get", endpoint=endpoint, url=url) as span:
+            return await self._get_shared(url, endpoint, span, **kwargs)
+
+    async def _get_shared(
+        self, url: str, endpoint: str | None, span: Span | None, **kwargs
+    ) -> Response:
+        """Get a cached response or share a request with concurrent callers."""
+        key = _request_key(url, kwargs.get("params"), kwargs.get("headers"))
+        if self._cache is not None:
+            entry = await self._cache.get(key)
+            if entry is not None:
+                if self._metrics is not None:
+                    self._metrics.count(endpoint or host_key(url), metrics.CACHE_HITS)
+                if span is not None:
+                    span.set_attribute("cache", "hit")
+                return StoredResponse(entry)
+        task = self._in_flight.get(key)
+        if span is not None:
+            span.set_attribute("shared", task is not None)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url, key, endpoint, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            task.add_done_callback(_retrieve_exception)
+        # Shield the shared request from the cancellation of a single caller.
+        return await asyncio.shield(task)
+
+    async def _get_json(
+        self,
+        url: str,
+        model: Any,
+        *,
+        endpoint: str,
+        **kwargs,
+    ) -> JsonResponse:
+        """Make a GET request to `url` and wrap the response to parse its JSON.
+
+        Args:
+            url: The URL to request.
+            model: The type to validate the JSON response body as, such as a
+                model class, `list[User]`, or `Any` for the raw data.
+            endpoint: Name of the requested endpoint.
+            **kwargs: Keyword arguments passed to `_get`.
+        """
+        response = await self._get(url, endpoint=endpoint, **kwargs)
+        return JsonResponse(response, type_adapter(model), self._metrics, endpoint)
+
+    async def _fetch(
+        self, url: str, key: str, endpoint: str | None, **kwargs
+    ) -> Response:
+        """Get a response from the session cache or the API and read its body."""
+        endpoint = endpoint or host_key(url)
+        response = await self._get_cached(url, **kwargs)
+        if response is not None:
+            stale = None
+            if self._metrics is not None:
+                self._metrics.count(endpoint, metrics.CACHE_HITS)
+            await self._read(response, endpoint)
+        else:
+            # A miss is only counted once the session cache has missed too.
+            cached = (
+                self._cache is not None or _session_cache(self._session) is not None
+            )
+            if self._metrics is not None and cached:
+                self._metrics.count(endpoint, metrics.CACHE_MISSES)
+            stale = await self._cache.get_stale(key) if self._cache else None
+            if stale is not None and stale.validators:
+                headers = {**kwargs.get("headers", {}), **stale.validators}
+                kwargs = {**kwargs, "headers": headers}
+            if self._retrier is None:
+                response = await self._send_and_read(url, endpoint, **kwargs)
+            else:
+                attempts = 0
+
+                async def request() -> Response:
+                    nonlocal attempts
+                    attempts += 1
+                    return await self._send_and_read(url, endpoint, **kwargs)
+
+                try:
+                    response = await self._retrier.send(endpoint, request)
+                finally:
+                    if self._metrics is not None and attempts > 1:
+                        self._metrics.count(endpoint, metrics.RETRIES, attempts - 1)
         response.raise_for_status()
+        if stale is not None and response.status == 304:
+            response.release()
+            stale.revalidate(response.headers)
+            await self._cache.set(key, endpoint, stale)
+            return StoredResponse(stale)
+        body = await response.read()
+        if self._cache is not None and response.status == 200:
+            entry = CacheEntry.from_response(response, body)
+            await self._cache.set(key, endpoint, entry)
         return response
+
+    async def _send_and_read(self, url: str, endpoint: str, **kwargs) -> Response:
+        """Send a GET request and read the body of a successful response.
+
+        Reading the body here lets the retrier retry a connection that is lost
+        while the body is received.
+        """
+        response = await self._send(url, endpoint, **kwargs)
+        if response.status == 200:
+            await self._read(response, endpoint)
+        return response
+
+    async def _read(self, response: Response, endpoint: str) -> bytes:
+        """Read the body of a response, which is kept by the response."""
+        if self._metrics is None:
+            return await response.read()
+        start = time.perf_counter()
+        body = await response.read()
+        elapsed = time.perf_counter() - start
+        self._metrics.observe(endpoint, metrics.BODY_READ, elapsed)
+        return body
+
+    async def _send(self, url: str, endpoint: str, **kwargs) -> Response:
+        """Send a GET request after acquiring a rate limit permit."""
+        limiter = self._rate_limiters.for_url(url)
+        start = time.perf_counter() if self._metrics is not None else 0.0
+        with tracing.span("spnkr.rate_limit"):
+            if self._scheduler is None:
+                await limiter.acquire()
+            else:
+                await self._scheduler.acquire(limiter)
+        with tracing.span("spnkr.request") as span:
+            if self._metrics is None:
+                response = await self._session.get(url, **kwargs)
+            else:
+                sent = time.perf_counter()
+                self._metrics.observe(endpoint, metrics.LIMITER_WAIT, sent - start)
+                response = await self._session.get(url, **kwargs)
+                elapsed = time.perf_counter() - sent
+                self._metrics.observe(endpoint, metrics.TIME_TO_HEADERS, elapsed)
+                self._metrics.count(
+                    endpoint, metrics.RESPONSES, status=str(response.status)
+                )
+            if span is not None:
+                span.set_attribute("status", response.status)
+        if isinstance(limiter, AdaptiveRateLimiter):
+            limiter.update(response.status, response.headers.get("Retry-After"))
+        return response
+
+    async def _get_cached(self, url: str, **kwargs) -> "CachedResponse | None":
+        """Look up a fresh response in the session cache without sending a request.
+
+        Only applies to a `CachedSession` from `aiohttp-client-cache`. Returns
+        `None` if the session is not cached or the response needs to be fetched.
+        """
+        cache = _session_cache(self._session)
+        if cache is None:
+            return None
+        key = cache.create_key("GET", url, **kwargs)
+        actions = cache.create_cache_actions(key, url, **kwargs)
+        if actions.revalidate:
+            return None
+        return await cache.request(actions)
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Retrieve the exception of a shared request whose callers were cancelled.
+
+    Otherwise, asyncio logs that the exception was never retrieved.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+def _session_cache(session: Session) -> "CacheBackend | None":
+    """Get the cache of a `CachedSession`, or `None` for other sessions."""
+    return getattr(session, "cache", None)
+
+
+def _request_key(
+    url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str] | None
+) -> str:
+    """Create a key identifying equivalent GET requests.
+
+    Query parameters are ordered by name. The order of repeated values, such as
+    a list of players, is preserved.
+    """
+    query = []
+    for name, value in sorted((params or {}).items()):
+        values = value if isinstance(value, (list, tuple)) else [value]
+        query.extend((name, str(v)) for v in values)
+    key = f"{url}?{urlencode(query)}" if query else url
+    language = (headers or {}).get("Accept-Language")
+    if language is not None:
+        key = f"{key} Accept-Language={language}"
+    return key
@@ -2,9 +2,10 @@
 
 import datetime as dt
 import warnings
-from typing import Iterable, Literal
+from typing import AsyncIterator, Iterable, Literal, TypeVar
 from uuid import UUID
 
+from spnkr._concurrency import as_completed
 from spnkr.models.discovery_ugc import (
     AssetSearchPage,
     Film,
@@ -16,6 +17,10 @@ from spnkr.models.discovery_ugc import (
 from spnkr.responses import JsonResponse
 from spnkr.services.base import BaseService
 
+T = TypeVar("T")
+AssetKind = Literal["map", "map_mode_pair", "playlist", "ugc_game_variant"]
+AssetKey = tuple[AssetKind, str | UUID, str | UUID]
+
 _HOST = "https://discovery-infiniteugc.svc.halowaypoint.com:443"
 _SortProperty = Literal[
     "name",
@@ -72,11 +77,14 @@ class DiscoveryUgcService(BaseService):
         asset_type: str,
         asset_id: str | UUID,
         version_id: str | UUID,
+        model: type[T],
         *,
+        endpoint: str,
         language: str | None = None,
-    ):
+    ) -> JsonResponse[T]:
         url = f"{_HOST}/hi/{asset_type}/{asset_id}/versions/{version_id}"
-        return await self._get(url, **self._get_localized_asset_kwargs(language))
+        kwargs = self._get_localized_asset_kwargs(language)
+        return await self._get_json(url, model, endpoint=endpoint, **kwargs)
 
     async def get_ugc_game_variant(
         self,
@@ -97,13 +105,14 @@ class DiscoveryUgcService(BaseService):
         Returns:
             The game variant details.
         """
-        resp = await self._get_asset(
+        return await self._get_asset(
             "ugcGameVariants",
             asset_id,
             version_id,
+            UgcGameVariant,
+            endpoint="discovery_ugc.get_ugc_game_variant",
             language=language,
         )
-        return JsonResponse(resp, lambda data: UgcGameVariant(**data))
 
     async def get_map_mode_pair(
         self,
@@ -124,13 +133,14 @@ class DiscoveryUgcService(BaseService):
         Returns:
             The map mode pair details.
         """
-        resp = await self._get_asset(
+        return await self._get_asset(
             "mapModePairs",
             asset_id,
             version_id,
+            MapModePair,
+            endpoint="discovery_ugc.get_map_mode_pair",
             language=language,
         )
-        return JsonResponse(resp, lambda data: MapModePair(**data))
 
     async def get_map(
         self,
@@ -151,13 +161,14 @@ class DiscoveryUgcService(BaseService):
         Returns:
             The map details.
         """
-        resp = await self._get_asset(
+        return await self._get_asset(
             "maps",
             asset_id,
             version_id,
+            Map,
+            endpoint="discovery_ugc.get_map",
             language=language,
         )
-        return JsonResponse(resp, lambda data: Map(**data))
 
     async def get_playlist(
         self,
@@ -178,13 +189,14 @@ class DiscoveryUgcService(BaseService):
         Returns:
             The playlist details.
         """
-        resp = await self._get_asset(
+        return await self._get_asset(
             "playlists",
             asset_id,
             version_id,
+            Playlist,
+            endpoint="discovery_ugc.get_playlist",
             language=language,
         )
-        return JsonResponse(resp, lambda data: Playlist(**data))
 
     async def search_assets(
         self,
@@ -269,8 +281,12 @@ class DiscoveryUgcService(BaseService):
             params["fromDatePublishedUtc"] = from_date_published_utc.isoformat()
         if to_date_published_utc is not None:
             params["toDatePublishedUtc"] = to_date_published_utc.isoformat()
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: AssetSearchPage(**data))
+        return await self._get_json(
+            url,
+            AssetSearchPage,
+            endpoint="discovery_ugc.search_assets",
+            params=params,
+        )
 
     async def get_film_by_match_id(self, match_id: str | UUID) -> JsonResponse[Film]:
         """Get metadata and download information for a film.
@@ -282,5 +298,59 @@ class DiscoveryUgcService(BaseService):
             The film details.
         """
         url = f"{_HOST}/hi/films/matches/{match_id}/spectate"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: Film(**data))
+        return await self._get_json(
+            url, Film, endpoint="discovery_ugc.get_film_by_match_id"
+        )
+
+    def get_assets_many(
+        self,
+        assets: Iterable[AssetKey],
+        concurrency: int = 10,
+        *,
+        language: str | None = None,
+    ) -> AsyncIterator[
+        tuple[
+            AssetKey,
+            JsonResponse[Map | MapModePair | Playlist | UgcGameVariant] | Exception,
+        ]
+    ]:
+        """Get details about many assets concurrently.
+
+        Results are yielded as requests complete. A failed request yields its
+        exception without affecting the other requests.
+
+        ```python
+        assets = [("map", map_id, map_version), ("playlist", pl_id, pl_version)]
+        async for key, result in client.discovery_ugc.get_assets_many(assets):
+            ...
+        ```
+
+        Args:
+            assets: (kind, asset ID, version ID) tuples identifying the assets,
+                where kind is one of "map", "map_mode_pair", "playlist", or
+                "ugc_game_variant". Assets are consumed lazily as requests
+                complete.
+            concurrency: Maximum number of requests in flight.
+            language: Optional BCP-47 locale sent via the Accept-Language
+                header.
+
+        Returns:
+            An async iterator of (asset tuple, asset details or exception) tuples.
+        """
+        getters = {
+            "map": self.get_map,
+            "map_mode_pair": self.get_map_mode_pair,
+            "playlist": self.get_playlist,
+            "ugc_game_variant": self.get_ugc_game_variant,
+        }
+
+        async def get_asset(
+            asset: AssetKey,
+        ) -> JsonResponse[Map | MapModePair | Playlist | UgcGameVariant]:
+            kind, asset_id, version_id = asset
+            getter = getters.get(kind)
+            if getter is None:
+                raise ValueError(f"Invalid asset kind: {kind!r}")
+            return await getter(asset_id, version_id, language=language)
+
+        return as_completed(assets, get_asset, concurrency)
@@ -2,7 +2,11 @@
 
 from typing import Literal
 
-from spnkr.models.economy import PlayerCareerRank, PlayerCustomization, PlayerOperationPasses
+from spnkr.models.economy import (
+    PlayerCareerRank,
+    PlayerCustomization,
+    PlayerOperationPasses,
+)
 from spnkr.responses import JsonResponse
 from spnkr.services.base import BaseService
 from spnkr.xuid import wrap_xuid
@@ -28,8 +32,11 @@ class EconomyService(BaseService):
             The player's active and available operation reward tracks.
         """
         url = f"{_HOST}/hi/players/{wrap_xuid(xuid)}/rewardtracks/operations"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: PlayerOperationPasses(**data))
+        return await self._get_json(
+            url,
+            PlayerOperationPasses,
+            endpoint="economy.get_player_reward_track_operations",
+        )
 
     async def get_player_career_rank(
         self,
@@ -48,8 +55,11 @@ class EconomyService(BaseService):
             The player's current career rank progress.
         """
         url = f"{_HOST}/hi/players/{wrap_xuid(xuid)}/rewardtracks/careerranks/{reward_track_id}"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: PlayerCareerRank(**data))
+        return await self._get_json(
+            url,
+            PlayerCareerRank,
+            endpoint="economy.get_player_career_rank",
+        )
 
     async def get_player_customization(
         self,
@@ -70,5 +80,9 @@ class EconomyService(BaseService):
         """
         url = f"{_HOST}/hi/players/{wrap_xuid(xuid)}/customization"
         params = {"view": view_type}
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: PlayerCustomization(**data))
+        return await self._get_json(
+            url,
+            PlayerCustomization,
+            endpoint="economy.get_player_customization",
+            params=params,
+        )
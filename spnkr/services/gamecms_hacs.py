@@ -31,8 +31,9 @@ class GameCmsHacsService(BaseService):
             The raw JSON payload for the requested progression file.
         """
         url = f"{_HOST}/hi/Progression/file/{relative_path.lstrip('/')}"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: data)
+        return await self._get_json(
+            url, Any, endpoint="gamecms_hacs.get_progression_file"
+        )
 
     async def get_medal_metadata(self) -> JsonResponse[MedalMetadata]:
         """Get details for all medals obtainable in the game.
@@ -41,8 +42,11 @@ class GameCmsHacsService(BaseService):
             The medal metadata.
         """
         url = f"{_HOST}/hi/Waypoint/file/medals/metadata.json"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: MedalMetadata(**data))
+        return await self._get_json(
+            url,
+            MedalMetadata,
+            endpoint="gamecms_hacs.get_medal_metadata",
+        )
 
     async def get_csr_season_calendar(self) -> JsonResponse[CsrSeasonCalendar]:
         """Get IDs and dates for past and current CSR seasons.
@@ -53,8 +57,11 @@ class GameCmsHacsService(BaseService):
             The CSR season calendar.
         """
         url = f"{_HOST}/hi/Progression/file/Csr/Calendars/CsrSeasonCalendar.json"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: CsrSeasonCalendar(**data))
+        return await self._get_json(
+            url,
+            CsrSeasonCalendar,
+            endpoint="gamecms_hacs.get_csr_season_calendar",
+        )
 
     async def get_season_calendar(self) -> JsonResponse[SeasonCalendar]:
         """Get IDs and dates for past/current reward track events/operations.
@@ -66,8 +73,11 @@ class GameCmsHacsService(BaseService):
             The calendar of reward tracks.
         """
         url = f"{_HOST}/hi/progression/file/calendars/seasons/seasoncalendar.json"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: SeasonCalendar(**data))
+        return await self._get_json(
+            url,
+            SeasonCalendar,
+            endpoint="gamecms_hacs.get_season_calendar",
+        )
 
     async def get_career_reward_track(self) -> JsonResponse[CareerRewardTrack]:
         """Get details for the career rank progression reward track.
@@ -76,8 +86,11 @@ class GameCmsHacsService(BaseService):
             The career rank reward track.
         """
         url = f"{_HOST}/hi/Progression/file/RewardTracks/CareerRanks/careerRank1.json"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: CareerRewardTrack(**data))
+        return await self._get_json(
+            url,
+            CareerRewardTrack,
+            endpoint="gamecms_hacs.get_career_reward_track",
+        )
 
     async def get_operation_reward_track(
         self,
@@ -93,8 +106,11 @@ class GameCmsHacsService(BaseService):
             The operation reward track definition.
         """
         url = f"{_HOST}/hi/Progression/file/{reward_track_path.lstrip('/')}"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: OperationRewardTrack(**data))
+        return await self._get_json(
+            url,
+            OperationRewardTrack,
+            endpoint="gamecms_hacs.get_operation_reward_track",
+        )
 
     async def get_image(self, relative_path: str) -> ImageResponse:
         """Get an image from the game content management service.
@@ -107,4 +123,4 @@ class GameCmsHacsService(BaseService):
             The image data.
         """
         url = f"{_HOST}/hi/images/file/{relative_path.lstrip('/')}"
-        return ImageResponse(await self._get(url))
+        return ImageResponse(await self._get(url, endpoint="gamecms_hacs.get_image"))
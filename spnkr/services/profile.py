@@ -1,21 +1,24 @@
 """Profile data services."""
 
-from typing import Iterable
+import itertools
+from typing import AsyncIterator, Iterable, Iterator, TypeVar
 
+from spnkr._concurrency import as_completed
 from spnkr.models.profile import User
 from spnkr.responses import JsonResponse
 from spnkr.services.base import BaseService
 from spnkr.xuid import unwrap_xuid, wrap_xuid
 
+T = TypeVar("T")
+
 _HOST = "https://profile.svc.halowaypoint.com"
 
 
 class ProfileService(BaseService):
     """Profile data services."""
 
-    async def _get_user(self, user: str) -> JsonResponse[User]:
-        resp = await self._get(f"{_HOST}/users/{user}")
-        return JsonResponse(resp, lambda data: User(**data))
+    async def _get_user(self, user: str, endpoint: str) -> JsonResponse[User]:
+        return await self._get_json(f"{_HOST}/users/{user}", User, endpoint=endpoint)
 
     async def get_current_user(self) -> JsonResponse[User]:
         """Get the current user profile.
@@ -23,7 +26,7 @@ class ProfileService(BaseService):
         Returns:
             The user.
         """
-        return await self._get_user("me")
+        return await self._get_user("me", "profile.get_current_user")
 
     async def get_user_by_gamertag(self, gamertag: str) -> JsonResponse[User]:
         """Get user profile for the given gamertag.
@@ -34,7 +37,7 @@ class ProfileService(BaseService):
         Returns:
             The user.
         """
-        return await self._get_user(f"gt({gamertag})")
+        return await self._get_user(f"gt({gamertag})", "profile.get_user_by_gamertag")
 
     async def get_user_by_id(self, xuid: str | int) -> JsonResponse[User]:
         """Get user profile for the given Xbox Live ID.
@@ -45,7 +48,7 @@ class ProfileService(BaseService):
         Returns:
             The user.
         """
-        return await self._get_user(wrap_xuid(xuid))
+        return await self._get_user(wrap_xuid(xuid), "profile.get_user_by_id")
 
     async def get_users_by_id(
         self, xuids: Iterable[str | int]
@@ -65,5 +68,47 @@ class ProfileService(BaseService):
             raise TypeError("`xuids` must be an iterable of XUIDs, got `str`")
         url = f"{_HOST}/users"
         params = {"xuids": [unwrap_xuid(x) for x in xuids]}
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: [User(**u) for u in data])
+        return await self._get_json(
+            url, list[User], endpoint="profile.get_users_by_id", params=params
+        )
+
+    def get_users_many(
+        self,
+        xuids: Iterable[str | int],
+        batch_size: int = 100,
+        concurrency: int = 5,
+    ) -> AsyncIterator[
+        tuple[tuple[str | int, ...], JsonResponse[list[User]] | Exception]
+    ]:
+        """Get user profiles for many Xbox Live IDs, in batches, concurrently.
+
+        Each batch of XUIDs is requested with `get_users_by_id`. Results are
+        yielded as requests complete. A failed request yields its exception
+        without affecting the other requests.
+
+        Args:
+            xuids: The Xbox Live IDs of the players. IDs are consumed lazily as
+                requests complete.
+            batch_size: Maximum number of users requested at once.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            An async iterator of (batch of XUIDs, users or exception) tuples.
+
+        Raises:
+            TypeError: If `xuids` is a `str` instead of an iterable of XUIDs.
+            ValueError: If `batch_size` is less than 1.
+        """
+        if isinstance(xuids, str):
+            raise TypeError("`xuids` must be an iterable of XUIDs, got `str`")
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        batches = _batched(xuids, batch_size)
+        return as_completed(batches, self.get_users_by_id, concurrency)
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[tuple[T, ...]]:
+    """Split `items` into tuples of up to `size` items."""
+    iterator = iter(items)
+    while batch := tuple(itertools.islice(iterator, size)):
+        yield batch
@@ -38,8 +38,12 @@ class SkillService(BaseService):
             raise ValueError("`xuids` cannot be empty")
         url = f"{_HOST}/hi/matches/{match_id}/skill"
         params = {"players": [wrap_xuid(x) for x in xuids]}
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: MatchSkill(**data))
+        return await self._get_json(
+            url,
+            MatchSkill,
+            endpoint="skill.get_match_skill",
+            params=params,
+        )
 
     async def get_playlist_csr(
         self,
@@ -73,8 +77,12 @@ class SkillService(BaseService):
         params: dict = {"players": [wrap_xuid(x) for x in xuids]}
         if season_id:
             params["season"] = _clean_season_id(season_id)
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: PlaylistCsr(**data))
+        return await self._get_json(
+            url,
+            PlaylistCsr,
+            endpoint="skill.get_playlist_csr",
+            params=params,
+        )
 
 
 def _clean_season_id(season_id: str) -> str:
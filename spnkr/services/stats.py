@@ -1,9 +1,12 @@
 """Stats data services."""
 
+import functools
 import warnings
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Iterable, Literal, overload
 from uuid import UUID
 
+from spnkr._concurrency import as_completed
+from spnkr.models.projection import project
 from spnkr.models.refdata import GameplayInteraction, GameVariantCategory
 from spnkr.models.stats import (
     MatchCount,
@@ -47,8 +50,7 @@ class StatsService(BaseService):
         """
         xuid_or_gamertag = wrap_xuid_or_gamertag(player)
         url = f"{_HOST}/hi/players/{xuid_or_gamertag}/decks"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: data)
+        return await self._get_json(url, Any, endpoint="stats.get_challenge_decks")
 
     async def get_match_count(self, player: str | int) -> JsonResponse[MatchCount]:
         """Get match counts across different game experiences for a player.
@@ -66,8 +68,7 @@ class StatsService(BaseService):
         """
         xuid_or_gamertag = wrap_xuid_or_gamertag(player)
         url = f"{_HOST}/hi/players/{xuid_or_gamertag}/matches/count"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: MatchCount(**data))
+        return await self._get_json(url, MatchCount, endpoint="stats.get_match_count")
 
     async def get_service_record(
         self,
@@ -148,8 +149,12 @@ class StatsService(BaseService):
                 f"Invalid filter combination: {filters}. Options:\n{valid}"
             )
         params = {k.replace("_", ""): str(v) for k, v in filters.items()}
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: ServiceRecord(**data))
+        return await self._get_json(
+            url,
+            ServiceRecord,
+            endpoint="stats.get_service_record",
+            params=params,
+        )
 
     async def get_match_history(
         self,
@@ -176,18 +181,113 @@ class StatsService(BaseService):
         xuid_or_gamertag = wrap_xuid_or_gamertag(player)
         url = f"{_HOST}/hi/players/{xuid_or_gamertag}/matches"
         params = {"start": start, "count": count, "type": match_type}
-        resp = await self._get(url, params=params)
-        return JsonResponse(resp, lambda data: MatchHistory(**data))
+        return await self._get_json(
+            url,
+            MatchHistory,
+            endpoint="stats.get_match_history",
+            params=params,
+        )
 
-    async def get_match_stats(self, match_id: str | UUID) -> JsonResponse[MatchStats]:
+    @overload
+    async def get_match_stats(
+        self, match_id: str | UUID, *, fields: None = None
+    ) -> JsonResponse[MatchStats]: ...
+
+    @overload
+    async def get_match_stats(
+        self, match_id: str | UUID, *, fields: Iterable[str]
+    ) -> JsonResponse[Any]: ...
+
+    async def get_match_stats(
+        self, match_id: str | UUID, *, fields: Iterable[str] | None = None
+    ) -> JsonResponse[Any]:
         """Request match details using the Halo Infinite match GUID.
 
+        Parse only the needed parts of the match details by selecting fields.
+        Fields that are not selected are skipped when parsing the response.
+
+        ```python
+        resp = await client.stats.get_match_stats(
+            match_id,
+            fields=["match_info", "players.player_team_stats.stats.core_stats"],
+        )
+        match_stats = await resp.parse()
+        ```
+
         Args:
             match_id: Halo Infinite GUID identifying the match.
+            fields: Names or dotted paths of `MatchStats` fields to parse, such
+                as "players.player_team_stats.stats.core_stats". If given, the
+                response is parsed into a projection of `MatchStats` with only
+                these fields. Properties such as `MatchStats.xuids` raise an
+                `AttributeError` if they use a field that is not selected. See
+                `spnkr.models.projection.project`.
 
         Returns:
             The match details.
+
+        Raises:
+            ValueError: If a selected field does not exist.
         """
+        model = MatchStats if fields is None else project(MatchStats, *fields)
         url = f"{_HOST}/hi/matches/{match_id}/stats"
-        resp = await self._get(url)
-        return JsonResponse(resp, lambda data: MatchStats(**data))
+        return await self._get_json(url, model, endpoint="stats.get_match_stats")
+
+    @overload
+    def get_match_stats_many(
+        self,
+        match_ids: Iterable[str | UUID],
+        concurrency: int = 10,
+        *,
+        fields: None = None,
+    ) -> AsyncIterator[tuple[str | UUID, JsonResponse[MatchStats] | Exception]]: ...
+
+    @overload
+    def get_match_stats_many(
+        self,
+        match_ids: Iterable[str | UUID],
+        concurrency: int = 10,
+        *,
+        fields: Iterable[str],
+    ) -> AsyncIterator[tuple[str | UUID, JsonResponse[Any] | Exception]]: ...
+
+    def get_match_stats_many(
+        self,
+        match_ids: Iterable[str | UUID],
+        concurrency: int = 10,
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[tuple[str | UUID, JsonResponse[Any] | Exception]]:
+        """Request details for many matches concurrently.
+
+        Results are yielded as requests complete, not in the order of
+        `match_ids`. A failed request yields its exception without affecting
+        the other requests.
+
+        ```python
+        async for match_id, result in client.stats.get_match_stats_many(ids):
+            if isinstance(result, Exception):
+                print(f"Failed to get {match_id}: {result}")
+            else:
+                match_stats = await result.parse()
+        ```
+
+        Args:
+            match_ids: Halo Infinite GUIDs identifying the matches. IDs are
+                consumed lazily as requests complete.
+            concurrency: Maximum number of requests in flight.
+            fields: Names or dotted paths of `MatchStats` fields to parse. See
+                `get_match_stats`.
+
+        Returns:
+            An async iterator of (match ID, match details or exception) tuples.
+
+        Raises:
+            ValueError: If a selected field does not exist.
+        """
+        if fields is None:
+            return as_completed(match_ids, self.get_match_stats, concurrency)
+        fields = tuple(fields)
+        project(MatchStats, *fields)  # Fail fast on invalid fields.
+        request = functools.partial(self.get_match_stats, fields=fields)
+        return as_completed(match_ids, request, concurrency)
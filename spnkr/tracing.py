@@ -0,0 +1,227 @@
+"""Tracing spans around API calls, authentication, and film reads.
+
+Tracing is disabled until a tracer is installed with `set_tracer`. Spans started
+within another span become its children, including spans started in tasks
+created within the parent span, such as with `asyncio.gather`.
+
+```python
+from spnkr import tracing
+
+exporter = tracing.InMemoryExporter()
+tracing.set_tracer(tracing.Tracer(exporter))
+with tracing.span("crawl"):
+    await asyncio.gather(*(client.stats.get_match_stats(m) for m in match_ids))
+exporter.dump("trace.json")
+```
+"""
+
+import contextlib
+import contextvars
+import functools
+import itertools
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, ParamSpec, TypeVar
+
+__all__ = [
+    "InMemoryExporter",
+    "JsonLinesExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "get_tracer",
+    "set_tracer",
+    "span",
+    "traced",
+]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    """A timed operation.
+
+    Attributes:
+        name: Name of the operation, such as "spnkr.get".
+        trace_id: ID shared by all spans of a trace.
+        span_id: ID of the span.
+        parent_id: ID of the parent span. `None` for the root span of a trace.
+        start: Start time as seconds since the epoch.
+        end: End time as seconds since the epoch. `None` until the span ends.
+        attributes: Details of the operation, such as the requested endpoint.
+        error: Description of the exception raised within the span, if any.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    end: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the span in seconds. `None` until the span ends."""
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+
+class SpanExporter(ABC):
+    """Base class for receivers of finished spans."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Receive a finished span."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keep finished spans in memory."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        """Finished spans in the order they ended."""
+
+    def export(self, span: Span) -> None:
+        """Keep a finished span."""
+        self.spans.append(span)
+
+    def children(self, parent: Span) -> list[Span]:
+        """Get the finished child spans of `parent` in the order they started."""
+        children = [s for s in self.spans if s.parent_id == parent.span_id]
+        return sorted(children, key=lambda s: s.start)
+
+    def to_json(self) -> str:
+        """Serialize the finished spans as a JSON array."""
+        return json.dumps([asdict(s) for s in self.spans], default=str)
+
+    def dump(self, path: str | Path) -> None:
+        """Write the finished spans to a JSON file."""
+        Path(path).write_text(self.to_json(), encoding="utf-8")
+
+    def clear(self) -> None:
+        """Remove all finished spans."""
+        self.spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """Append finished spans to a file as JSON lines."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize a JSON lines exporter.
+
+        Args:
+            path: Path of the file to append spans to.
+        """
+        self.path = Path(path)
+
+    def export(self, span: Span) -> None:
+        """Append a finished span to the file."""
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(span), default=str) + "\n")
+
+
+class Tracer:
+    """Create spans and send them to exporters when they end."""
+
+    def __init__(self, *exporters: SpanExporter) -> None:
+        """Initialize a tracer.
+
+        Args:
+            *exporters: Receivers of finished spans.
+        """
+        self.exporters = list(exporters)
+        self._ids = itertools.count(1)
+        self._prefix = f"{os.getpid():x}-{time.time_ns():x}"
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time the operation within the context as a child of the current span.
+
+        Args:
+            name: Name of the operation.
+            **attributes: Details of the operation.
+
+        Yields:
+            The span, which can be given further attributes.
+        """
+        parent = _current_span.get()
+        span_id = f"{self._prefix}-{next(self._ids)}"
+        span = Span(
+            name,
+            trace_id=span_id if parent is None else parent.trace_id,
+            span_id=span_id,
+            parent_id=None if parent is None else parent.span_id,
+            start=time.time(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as ex:
+            span.error = f"{type(ex).__name__}: {ex}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end = time.time()
+            for exporter in self.exporters:
+                exporter.export(span)
+
+
+_tracer: Tracer | None = None
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "spnkr_span", default=None
+)
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Install a tracer to enable tracing, or `None` to disable it."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Get the installed tracer, if tracing is enabled."""
+    return _tracer
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Trace the operation within the context with the installed tracer.
+
+    Yields:
+        The span, or `None` if tracing is disabled.
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.span(name, **attributes) as s:
+        yield s
+
+
+def traced(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Decorate a coroutine function to trace its calls as spans named `name`."""
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with _tracer.span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -11,10 +11,16 @@ from aiohttp_client_cache.response import CachedResponse
 class MockResponse:
     def __init__(self, data) -> None:
         self._data = data
+        self.url = "url"
+        self.status = 200
+        self.headers = {}
 
     def raise_for_status(self) -> None:
         pass
 
+    def release(self) -> None:
+        pass
+
     async def read(self) -> bytes:
         return self._data
 
@@ -0,0 +1,308 @@
+"""Test the spnkr.cache module."""
+
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from spnkr.cache import (
+    ENDPOINT_MUTABILITY,
+    CacheEntry,
+    CachePolicy,
+    MemoryCache,
+    Mutability,
+    ResponseCache,
+    SqliteCache,
+    StoredResponse,
+)
+from spnkr.responses import JsonResponse
+from spnkr.services import (
+    DiscoveryUgcService,
+    EconomyService,
+    GameCmsHacsService,
+    ProfileService,
+    SkillService,
+    StatsService,
+)
+
+
+def _entry(body: bytes = b'{"a": 1}') -> CacheEntry:
+    headers = CIMultiDictProxy(CIMultiDict({"Content-Type": "application/json"}))
+    return CacheEntry("url", 200, headers, body)
+
+
+@pytest.fixture
+def monotonic(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("spnkr.cache.time.monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.asyncio
+async def test_stored_response():
+    response = StoredResponse(_entry())
+    assert response.from_cache
+    assert response.ok
+    assert response.status == 200
+    assert response.headers["content-type"] == "application/json"
+    assert await response.read() == b'{"a": 1}'
+    assert await response.text() == '{"a": 1}'
+    assert await response.json() == {"a": 1}
+
+
+def test_response_cache_requires_overrides():
+    class IncompleteCache(ResponseCache):
+        async def get(self, key: str) -> CacheEntry | None:
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteCache()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_get_set():
+    cache = MemoryCache()
+    assert await cache.get("key") is None
+    entry = _entry()
+    await cache.set("key", "endpoint", entry)
+    assert await cache.get("key") is entry
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+    assert cache.size == len(entry.body)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_keep_parsed():
+    cache = MemoryCache(keep_parsed=False)
+    entry = _entry()
+    await cache.set("key", "endpoint", entry)
+    stored = await cache.get("key")
+    assert stored == entry
+    stored.parsed = (dict, {"a": 1})
+    cached = await cache.get("key")
+    assert cached is not None
+    assert cached.parsed is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_ttl(monotonic):
+    cache = MemoryCache(
+        policy=CachePolicy(short=10), ttls={"forever": None, "never": 0}
+    )
+    await cache.set("a", "endpoint", _entry())
+    await cache.set("b", "forever", _entry())
+    await cache.set("c", "never", _entry())
+    assert await cache.get("c") is None
+    monotonic[0] += 9
+    assert await cache.get("a") is not None
+    monotonic[0] += 1
+    assert await cache.get("a") is None
+    assert await cache.get("b") is not None
+    assert len(cache) == 1
+
+
+def test_cache_policy_ttl():
+    policy = CachePolicy(immutable=None, long=3600, short=60)
+    assert policy.ttl("stats.get_match_stats") is None
+    assert policy.ttl("gamecms_hacs.get_medal_metadata") == 3600
+    assert policy.ttl("stats.get_service_record") == 60
+    assert policy.ttl("profile.get_current_user") == 0
+    assert policy.mutability("unknown") is Mutability.SHORT
+    assert policy.ttl("unknown") == 60
+
+
+@pytest.mark.parametrize(
+    "codes,expected",
+    [
+        ([0, 0], Mutability.IMMUTABLE),
+        ([0, 2], Mutability.LONG),
+        ([1], Mutability.LONG),
+        (None, Mutability.LONG),
+    ],
+)
+def test_cache_policy_match_skill_condition(codes, expected):
+    if codes is None:
+        body = b"not json"
+    else:
+        values = ",".join(f'{{"ResultCode": {code}}}' for code in codes)
+        body = f'{{"Value": [{values}]}}'.encode()
+    policy = CachePolicy(immutable=None, long=3600)
+    assert policy.mutability("skill.get_match_skill", body) is expected
+    assert policy.mutability("skill.get_match_skill") is Mutability.IMMUTABLE
+    ttl = None if expected is Mutability.IMMUTABLE else 3600
+    assert policy.ttl("skill.get_match_skill", body) == ttl
+
+
+def test_endpoint_mutability_covers_service_methods():
+    services = {
+        "discovery_ugc": DiscoveryUgcService,
+        "economy": EconomyService,
+        "gamecms_hacs": GameCmsHacsService,
+        "profile": ProfileService,
+        "skill": SkillService,
+        "stats": StatsService,
+    }
+    endpoints = {
+        f"{name}.{attr}"
+        for name, service in services.items()
+        for attr in vars(service)
+        if not attr.startswith("_") and not attr.endswith("_many")
+    }
+    assert endpoints == set(ENDPOINT_MUTABILITY)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_policy(monotonic):
+    cache = MemoryCache(ttls={"stats.get_match_stats": 5})
+    await cache.set("a", "stats.get_match_stats", _entry())
+    await cache.set("b", "skill.get_match_skill", _entry())
+    await cache.set("c", "stats.get_service_record", _entry())
+    monotonic[0] += 60
+    assert await cache.get("a") is None
+    assert await cache.get("b") is not None
+    assert await cache.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_keeps_stale_entries_with_validators(monotonic):
+    cache = MemoryCache(policy=CachePolicy(short=10))
+    entry = _entry()
+    entry.headers = CIMultiDictProxy(CIMultiDict({"ETag": '"abc"'}))
+    await cache.set("a", "endpoint", entry)
+    await cache.set("b", "endpoint", _entry())
+    monotonic[0] += 10
+    assert await cache.get("a") is None
+    assert await cache.get("b") is None
+    assert await cache.get_stale("a") is entry
+    assert await cache.get_stale("b") is None
+    entry.revalidate({"ETag": '"def"', "Last-Modified": "date"})
+    assert entry.validators == {
+        "If-None-Match": '"def"',
+        "If-Modified-Since": "date",
+    }
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_lru_eviction():
+    cache = MemoryCache(max_bytes=20)
+    await cache.set("a", "endpoint", _entry(b"a" * 8))
+    await cache.set("b", "endpoint", _entry(b"b" * 8))
+    await cache.get("a")
+    await cache.set("c", "endpoint", _entry(b"c" * 8))
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert await cache.get("c") is not None
+    assert cache.size == 16
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_skips_large_entries():
+    cache = MemoryCache(max_bytes=4)
+    await cache.set("a", "endpoint", _entry(b"12345"))
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_replace_and_clear():
+    cache = MemoryCache()
+    await cache.set("a", "endpoint", _entry(b"1234"))
+    await cache.set("a", "endpoint", _entry(b"12"))
+    assert cache.size == 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+@pytest.mark.asyncio
+async def test_json_response_parse_memoized_in_cache():
+    entry = _entry()
+    parser = dict
+    first = await JsonResponse(StoredResponse(entry), parser).parse()
+    second = await JsonResponse(StoredResponse(entry), parser).parse()
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_service_serves_cached_response(session):
+    service = StatsService(session, cache=MemoryCache())
+    session.set_response("get_match_stats.json")
+    first = await service.get_match_stats("match_id")
+    second = await service.get_match_stats("match_id")
+    session.get.assert_called_once()
+    assert not first.from_cache
+    assert second.from_cache
+    assert await first.read() == await second.read()
+    third = await service.get_match_stats("match_id")
+    assert await second.parse() is await third.parse()
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    cache = SqliteCache(tmp_path / "cache.sqlite")
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_get_set(sqlite_cache: SqliteCache):
+    assert await sqlite_cache.get("key") is None
+    await sqlite_cache.set("key", "stats.get_match_stats", _entry())
+    entry = await sqlite_cache.get("key")
+    assert entry is not None
+    assert entry.body == b'{"a": 1}'
+    assert entry.headers["content-type"] == "application/json"
+    assert entry.expires is None
+    assert (sqlite_cache.hits, sqlite_cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_immutable_only(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("key", "stats.get_service_record", _entry())
+    assert await sqlite_cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_skips_unfinished_match_skill(sqlite_cache: SqliteCache):
+    body = b'{"Value": [{"ResultCode": 0}, {"ResultCode": 3}]}'
+    await sqlite_cache.set("key", "skill.get_match_skill", _entry(body))
+    assert await sqlite_cache.get("key") is None
+    body = b'{"Value": [{"ResultCode": 0}, {"ResultCode": 0}]}'
+    await sqlite_cache.set("key", "skill.get_match_skill", _entry(body))
+    assert await sqlite_cache.get("key") is not None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_expiration(tmp_path, monkeypatch):
+    cache = SqliteCache(tmp_path / "cache.sqlite", immutable_only=False)
+    now = [1000.0]
+    monkeypatch.setattr("spnkr.cache.time.time", lambda: now[0])
+    await cache.set("key", "stats.get_service_record", _entry())
+    assert await cache.get("key") is not None
+    now[0] += 60
+    assert await cache.get("key") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_shared_file(tmp_path):
+    writer = SqliteCache(tmp_path / "cache.sqlite")
+    reader = SqliteCache(tmp_path / "cache.sqlite")
+    await writer.set("key", "stats.get_match_stats", _entry())
+    assert await reader.get("key") is not None
+    await reader.clear()
+    assert await writer.get("key") is None
+    writer.close()
+    reader.close()
+
+
+@pytest.mark.asyncio
+async def test_service_serves_response_from_sqlite_cache(session, tmp_path):
+    path = tmp_path / "cache.sqlite"
+    session.set_response("get_match_stats.json")
+    cache = SqliteCache(path)
+    await StatsService(session, cache=cache).get_match_stats("match_id")
+    cache.close()
+    cache = SqliteCache(path)
+    response = await StatsService(session, cache=cache).get_match_stats("match_id")
+    cache.close()
+    session.get.assert_called_once()
+    assert response.from_cache
+    assert (await response.parse()).match_id
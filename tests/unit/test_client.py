@@ -6,6 +6,8 @@ import time
 import pytest
 
 from spnkr.client import HaloInfiniteClient
+from spnkr.ratelimit import RateLimit
+from spnkr.retry import RetryPolicy
 from spnkr.services import (
     DiscoveryUgcService,
     EconomyService,
@@ -50,15 +52,70 @@ def test_client_services(client: HaloInfiniteClient):
 async def test_client_requests_per_second_multiple_services(
     client: HaloInfiniteClient,
 ):
-    """Test that requests per second is applied per service."""
+    """Test that requests per second is applied per host."""
     tasks = []
-    for _ in range(3):
-        tasks.append(client.discovery_ugc._get(""))
-        tasks.append(client.gamecms_hacs._get(""))
-        tasks.append(client.profile._get(""))
-        tasks.append(client.skill._get(""))
-        tasks.append(client.stats._get(""))
+    for i in range(3):
+        tasks.append(
+            client.discovery_ugc._get(f"https://discovery-infiniteugc.svc/{i}")
+        )
+        tasks.append(client.gamecms_hacs._get(f"https://gamecms-hacs.svc/{i}"))
+        tasks.append(client.profile._get(f"https://profile.svc/{i}"))
+        tasks.append(client.skill._get(f"https://skill.svc/{i}"))
+        tasks.append(client.stats._get(f"https://halostats.svc/{i}"))
     t0 = time.time()
     await asyncio.gather(*tasks)
     t1 = time.time()
     assert t1 - t0 <= 1
+
+
+@pytest.mark.asyncio
+async def test_client_services_share_rate_limiters(client: HaloInfiniteClient):
+    """Test that services share per-host rate limiters owned by the client."""
+    assert client.stats._rate_limiters is client.skill._rate_limiters
+    assert client.stats._rate_limiters is client._rate_limiters
+
+
+@pytest.mark.asyncio
+async def test_client_rate_limits_per_host(session):
+    """Test that per-host rate limits override the default rate."""
+    client = HaloInfiniteClient(
+        session,
+        "spartan",
+        "clearance",
+        1,
+        rate_limits={"halostats": RateLimit(100, 10)},
+    )
+    t0 = time.time()
+    await asyncio.gather(
+        *(client.stats._get(f"https://halostats.svc/{i}") for i in range(10))
+    )
+    t1 = time.time()
+    assert t1 - t0 < 0.5
+
+
+def test_client_retrier(session):
+    """Test that a retrier is shared by services when retries are enabled."""
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    assert client.retrier is None
+    assert client.stats._retrier is None
+    client = HaloInfiniteClient(
+        session, "spartan", "clearance", retry_policy=RetryPolicy()
+    )
+    assert client.retrier is not None
+    assert client.stats._retrier is client.retrier
+    assert client.profile._retrier is client.retrier
+
+
+@pytest.mark.asyncio
+async def test_client_create():
+    """Test that `create` owns a session with a tuned connection pool."""
+    rate_limits = {"halostats": RateLimit(10, burst=4)}
+    async with HaloInfiniteClient.create(
+        "spartan", "clearance", rate_limits=rate_limits, retry_policy=RetryPolicy()
+    ) as client:
+        session = client._session
+        assert session.connector.limit_per_host == 14
+        assert session.connector.limit == 14 * 6
+        assert session.headers["343-clearance"] == "clearance"
+        assert client.retrier is not None
+    assert session.closed
@@ -1,16 +1,23 @@
 import collections
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from spnkr import film
+from spnkr.client import HaloInfiniteClient
 from spnkr.errors import FilmReadError
 from spnkr.film import highlight_events
+from spnkr.models.discovery_ugc import Film
 from spnkr.models.stats import MatchStats
 
 FILM_DIR = Path(__file__).parents[1] / "data/film"
 HIGHLIGHT_EVENTS_FILE = FILM_DIR / "highlight_events.gzip"
 STATS_FILE = FILM_DIR / "match_stats.json"
+RESPONSES_DIR = Path(__file__).parents[1] / "data/responses"
 
 
 @pytest.fixture
@@ -77,6 +84,268 @@ def test_read_film_major_versions(
     assert counts["medal"] == medals
 
 
+@pytest.mark.parametrize(
+    "path", sorted(FILM_DIR.glob("[34]*.gzip")), ids=lambda p: p.name[:2]
+)
+def test_read_table(path: Path):
+    data = path.read_bytes()
+    version = int(path.name[:2])
+    table = highlight_events.read_table(data, version, path.stem)
+    events = list(highlight_events.read(data, version))
+    assert list(table.events()) == events
+    assert table.match_ids == [path.stem]
+    assert set(table.match) == {0}
+    assert table.gamertags == {e.xuid: e.gamertag for e in events}
+    codes = [highlight_events.EVENT_TYPES[code] for code in table.event_type]
+    assert codes == [e.event_type for e in events]
+
+
+def test_table_concat():
+    paths = sorted(FILM_DIR.glob("3[01]*.gzip"))
+    tables = [
+        highlight_events.read_table(p.read_bytes(), int(p.name[:2]), p.stem)
+        for p in paths
+    ]
+    table = highlight_events.HighlightEventTable.concat(tables)
+    assert len(table) == sum(len(t) for t in tables)
+    assert table.match_ids == [p.stem for p in paths]
+    assert list(table.match) == [0] * len(tables[0]) + [1] * len(tables[1])
+    assert list(table.events()) == [e for t in tables for e in t.events()]
+
+
+def test_table_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    table = highlight_events.read_table(data, 37)
+    columns = table.to_numpy()
+    assert set(columns) == set(highlight_events.HighlightEventTable.COLUMNS)
+    assert columns["xuid"].dtype == numpy.uint64
+    assert columns["time_ms"].tolist() == list(table.time_ms)
+
+
+def test_find_bits_unaligned():
+    pattern = b"\x00\x00\x2e\xe0"
+    value = int.from_bytes(b"\xff" * 4 + pattern + b"\xff" * 4, "big") >> 3
+    views = highlight_events._shifted_views(value.to_bytes(12, "big"))
+    assert highlight_events._find_bits(views, pattern, 0, views.size) == 35
+    assert highlight_events._find_bits(views, pattern, 36, views.size) == -1
+    assert highlight_events._find_bits(views, pattern, 0, 66) == -1
+
+
+def test_read_incomplete_event():
+    xuid = (2535445291321133).to_bytes(8, "little")
+    data = zlib.compress(b"\x00" * 16 + xuid + b"\x2d\xc0" + b"\x00" * 100)
+    with pytest.raises(FilmReadError):
+        list(highlight_events.read(data, 37))
+
+
+@pytest.mark.parametrize("part_size", [100, 4096, 1_000_000])
+def test_stream_reader(part_size: int):
+    path = FILM_DIR / "38_63391382-6b88-43f9-9ff4-6313404c419c.gzip"
+    data = path.read_bytes()
+    reader = highlight_events.StreamReader(38, max_buffer=8192)
+    events = []
+    for i in range(0, len(data), part_size):
+        events.extend(reader.feed(data[i : i + part_size]))
+    events.extend(reader.close())
+    assert events == list(highlight_events.read(data, 38))
+
+
+def test_stream_reader_incomplete():
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    reader = highlight_events.StreamReader(37)
+    reader.feed(data[:-10])
+    with pytest.raises(FilmReadError):
+        reader.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_highlight_events(session):
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    chunk = MagicMock()
+    chunk.content.iter_chunked = lambda n: _aiter(
+        data[i : i + n] for i in range(0, len(data), n)
+    )
+    session.set_response("get_film_by_match_id.json")
+    session.get.side_effect = [session.get.return_value, chunk]
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    events = [e async for e in film.iter_highlight_events(client, "id", 100)]
+    assert events == list(highlight_events.read(data, 34))
+
+
+class _ChunkServer:
+    """Serve film chunk bodies, supporting range requests."""
+
+    def __init__(self, session, ranges: bool = True) -> None:
+        data = (RESPONSES_DIR / "get_film_by_match_id.json").read_bytes()
+        self.film = Film.model_validate_json(data)
+        self.bodies = {
+            url: bytes([chunk.index]) * chunk.chunk_size
+            for chunk, url in self.film.get_chunks_and_urls()
+        }
+        self.ranges = ranges
+        self.requests = []
+        session.set_response("get_film_by_match_id.json")
+        self._film_response = session.get.return_value
+        session.get.side_effect = self.get
+
+    async def get(self, url, headers=None, **kwargs):
+        if url not in self.bodies:
+            return self._film_response
+        self.requests.append((url, headers))
+        body = self.bodies[url]
+        response = MagicMock()
+        response.status = 200
+        if headers and self.ranges:
+            start = int(headers["Range"].removeprefix("bytes=").removesuffix("-"))
+            body = body[start:]
+            response.status = 206
+        response.content.iter_chunked = lambda n: _aiter(
+            body[i : i + n] for i in range(0, len(body), n)
+        )
+        return response
+
+
+@pytest.mark.asyncio
+async def test_download_film(session, tmp_path):
+    server = _ChunkServer(session)
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    paths = await film.download_film(client, "id", tmp_path / "film", 3)
+    assert [p.name for p in paths[:2]] == [
+        "00_film_header.gzip",
+        "01_replication_data.gzip",
+    ]
+    assert len(paths) == len(server.bodies)
+    for path, body in zip(paths, server.bodies.values()):
+        assert path.read_bytes() == body
+    assert not list((tmp_path / "film").glob("*.part"))
+
+    # Downloaded chunks are skipped.
+    server.requests.clear()
+    assert await film.download_film(client, "id", tmp_path / "film") == paths
+    assert not server.requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ranges", [True, False])
+async def test_download_film_resume(session, tmp_path, ranges):
+    server = _ChunkServer(session, ranges)
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    chunk, url = server.film.get_chunks_and_urls()[0]
+    partial = tmp_path / "00_film_header.gzip.part"
+    partial.write_bytes(server.bodies[url][:1000])
+    paths = await film.download_film(client, "id", tmp_path)
+    assert paths[0].read_bytes() == server.bodies[url]
+    assert (url, {"Range": "bytes=1000-"}) in server.requests
+    assert not partial.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_film_size_mismatch(session, tmp_path):
+    server = _ChunkServer(session)
+    chunk, url = server.film.get_chunks_and_urls()[1]
+    server.bodies[url] = server.bodies[url][:-1]
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    with pytest.raises(FilmReadError):
+        await film.download_film(client, "id", tmp_path)
+    assert (tmp_path / "01_replication_data.gzip.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_download_film_invalid_concurrency(session, tmp_path):
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    with pytest.raises(ValueError):
+        await film.download_film(client, "id", tmp_path, concurrency=0)
+
+
+class _HighlightEventsServer:
+    """Serve film metadata and highlight events chunks for any match."""
+
+    def __init__(self, session, data: bytes) -> None:
+        session.set_response("get_film_by_match_id.json")
+        self._film_response = session.get.return_value
+        film_data = (RESPONSES_DIR / "get_film_by_match_id.json").read_bytes()
+        self.url = Film.model_validate_json(film_data).highlight_events_url
+        self.data = data
+        session.get.side_effect = self.get
+
+    async def get(self, url, **kwargs):
+        if url != self.url:
+            return self._film_response
+        chunk = MagicMock()
+        chunk.read = AsyncMock(return_value=self.data)
+        return chunk
+
+
+@pytest.mark.asyncio
+async def test_read_highlight_events_many(session):
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    _HighlightEventsServer(session, data)
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    results = {}
+    async for match_id, result in film.read_highlight_events_many(
+        client, ["a", "b", "c"], workers=2, concurrency=2
+    ):
+        results[match_id] = result
+    expected = list(highlight_events.read(data, 34))
+    assert results == {"a": expected, "b": expected, "c": expected}
+
+
+@pytest.mark.asyncio
+async def test_read_highlight_events_table(session):
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    _HighlightEventsServer(session, data)
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    table = await film.read_highlight_events(client, "a", table=True)
+    assert table.match_ids == ["a"]
+    assert list(table.events()) == await film.read_highlight_events(client, "a")
+
+
+@pytest.mark.asyncio
+async def test_read_highlight_events_many_table(session):
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    _HighlightEventsServer(session, data)
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    tables = [
+        result
+        async for _, result in film.read_highlight_events_many(
+            client, ["a", "b"], workers=1, table=True
+        )
+    ]
+    table = highlight_events.HighlightEventTable.concat(tables)
+    assert sorted(table.match_ids) == ["a", "b"]
+    expected = list(highlight_events.read(data, 34))
+    assert list(table.events()) == expected * 2
+
+
+@pytest.mark.asyncio
+async def test_read_highlight_events_many_error(session):
+    data = HIGHLIGHT_EVENTS_FILE.read_bytes()
+    _HighlightEventsServer(session, data[: len(data) // 2])
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    with ThreadPoolExecutor(1) as executor:
+        results = [
+            result
+            async for result in film.read_highlight_events_many(
+                client, ["a", "b"], executor=executor
+            )
+        ]
+    assert sorted(match_id for match_id, _ in results) == ["a", "b"]
+    assert all(isinstance(error, zlib.error) for _, error in results)
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"concurrency": 0}])
+def test_read_highlight_events_many_invalid(session, kwargs):
+    client = HaloInfiniteClient(session, "spartan", "clearance")
+    with pytest.raises(ValueError):
+        film.read_highlight_events_many(client, ["a"], **kwargs)
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
+
+
 def test_infer_event_type_error():
     with pytest.raises(FilmReadError):
         highlight_events._infer_event_type(0, False)
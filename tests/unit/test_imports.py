@@ -0,0 +1,52 @@
+"""Test that importing spnkr defers loading services and models."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import spnkr",
+        "from spnkr import HaloInfiniteClient",
+        "import spnkr.services",
+        "import spnkr.film",
+    ],
+)
+def test_import_is_lazy(statement: str):
+    modules = _loaded_modules(statement)
+    assert "pydantic" not in modules
+    assert not {m for m in modules if m.startswith("spnkr.models")}
+    services = {m for m in modules if m.startswith("spnkr.services.")}
+    assert services <= {"spnkr.services.base"}
+
+
+def test_service_loaded_on_access():
+    modules = _loaded_modules(
+        "from types import SimpleNamespace;"
+        "from spnkr.client import HaloInfiniteClient;"
+        "client = HaloInfiniteClient(SimpleNamespace(headers={}), '', '');"
+        "client.stats"
+    )
+    assert "spnkr.services.stats" in modules
+    assert "spnkr.models.stats" in modules
+    assert "spnkr.services.profile" not in modules
+
+
+def test_services_lazy_attribute():
+    import spnkr.services
+    from spnkr.services.stats import StatsService
+
+    assert spnkr.services.StatsService is StatsService
+    with pytest.raises(AttributeError):
+        spnkr.services.UnknownService  # noqa: B018
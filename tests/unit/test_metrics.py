@@ -0,0 +1,159 @@
+"""Test the spnkr.metrics module."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from spnkr import metrics
+from spnkr.cache import MemoryCache
+from spnkr.metrics import (
+    Histogram,
+    LoggingSink,
+    MemorySink,
+    MetricsSink,
+    PrometheusSink,
+)
+from spnkr.retry import Retrier, RetryPolicy
+from spnkr.services.stats import StatsService
+
+
+def test_metrics_sink_requires_overrides():
+    class IncompleteSink(MetricsSink):
+        def observe(self, endpoint: str, name: str, seconds: float) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink()  # type: ignore
+
+
+def test_histogram():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(0.6625)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+
+
+def test_memory_sink_snapshot():
+    sink = MemorySink()
+    sink.observe("stats.get_match_stats", metrics.DECODE, 0.002)
+    sink.count("stats.get_match_stats", metrics.CACHE_HITS)
+    sink.count("stats.get_match_stats", metrics.RESPONSES, status="200")
+    snapshot = sink.snapshot()
+    decode = snapshot["histograms"]["decode"]["stats.get_match_stats"]
+    assert decode["count"] == 1
+    assert decode["p50"] == 0.005
+    assert snapshot["counters"] == {
+        "cache_hits": {"stats.get_match_stats": 1},
+        "responses": {"stats.get_match_stats": {"200": 1}},
+    }
+    sink.clear()
+    assert sink.snapshot() == {"histograms": {}, "counters": {}}
+
+
+def test_prometheus_sink_render():
+    sink = PrometheusSink(buckets=(0.1, 1.0))
+    sink.observe("stats.get_match_stats", metrics.BODY_READ, 0.5)
+    sink.count("stats.get_match_stats", metrics.RESPONSES, status="200")
+    assert sink.render().splitlines() == [
+        "# TYPE spnkr_body_read_seconds histogram",
+        'spnkr_body_read_seconds_bucket{endpoint="stats.get_match_stats",le="0.1"} 0',
+        'spnkr_body_read_seconds_bucket{endpoint="stats.get_match_stats",le="1.0"} 1',
+        'spnkr_body_read_seconds_bucket{endpoint="stats.get_match_stats",le="+Inf"} 1',
+        'spnkr_body_read_seconds_sum{endpoint="stats.get_match_stats"} 0.5',
+        'spnkr_body_read_seconds_count{endpoint="stats.get_match_stats"} 1',
+        "# TYPE spnkr_responses_total counter",
+        'spnkr_responses_total{endpoint="stats.get_match_stats",status="200"} 1',
+    ]
+
+
+def test_logging_sink(caplog):
+    sink = LoggingSink()
+    with caplog.at_level(logging.DEBUG, logger="spnkr.metrics"):
+        sink.observe("endpoint", metrics.VALIDATE, 0.25)
+        sink.count("endpoint", metrics.RETRIES, 2)
+    assert caplog.messages == ["endpoint validate 0.250000s", "endpoint retries +2 {}"]
+
+
+@pytest.mark.asyncio
+async def test_service_records_metrics(session, response):
+    sink = MemorySink()
+    failed = type(response)(b"")
+    failed.status = 503
+    session.get.side_effect = [failed, response]
+    service = StatsService(
+        session,
+        retrier=Retrier(RetryPolicy(backoff=0)),
+        cache=MemoryCache(),
+        metrics=sink,
+    )
+    await service.get_match_stats("match_id")
+    snapshot = sink.snapshot()
+    endpoint = "stats.get_match_stats"
+    for name in (metrics.LIMITER_WAIT, metrics.TIME_TO_HEADERS, metrics.BODY_READ):
+        assert endpoint in snapshot["histograms"][name]
+    assert snapshot["histograms"][metrics.LIMITER_WAIT][endpoint]["count"] == 2
+    counters = snapshot["counters"]
+    assert counters[metrics.CACHE_MISSES] == {endpoint: 1}
+    assert counters[metrics.RETRIES] == {endpoint: 1}
+    assert counters[metrics.RESPONSES] == {endpoint: {"200": 1, "503": 1}}
+    await service.get_match_stats("match_id")
+    assert sink.snapshot()["counters"][metrics.CACHE_HITS] == {endpoint: 1}
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.asyncio
+async def test_service_records_session_cache_hit(session, cached_response):
+    cached_response._body = b"{}"
+    session.cache = AsyncMock()
+    session.cache.create_key = Mock(return_value="key")
+    session.cache.create_cache_actions = Mock(return_value=Mock(revalidate=False))
+    session.cache.request.return_value = cached_response
+    sink = MemorySink()
+    service = StatsService(session, cache=MemoryCache(), metrics=sink)
+    await service._get("url", endpoint="stats.get_match_stats")
+    counters = sink.snapshot()["counters"]
+    assert counters[metrics.CACHE_HITS] == {"stats.get_match_stats": 1}
+    assert metrics.CACHE_MISSES not in counters
+
+
+@pytest.mark.asyncio
+async def test_service_records_concurrent_retries(session, response):
+    sink = MemorySink()
+    failed = type(response)(b"")
+    failed.status = 503
+    seen = set()
+
+    async def get(url, **kwargs):
+        if url in seen:
+            return response
+        seen.add(url)
+        await asyncio.sleep(0)
+        return failed
+
+    session.get.side_effect = get
+    retrier = Retrier(RetryPolicy(backoff=0))
+    service = StatsService(session, retrier=retrier, metrics=sink)
+    await asyncio.gather(*(service.get_match_stats(str(i)) for i in range(5)))
+    endpoint = "stats.get_match_stats"
+    assert retrier.retries[endpoint] == 5
+    assert sink.snapshot()["counters"][metrics.RETRIES] == {endpoint: 5}
+
+
+@pytest.mark.asyncio
+async def test_json_response_records_parse_metrics(session):
+    sink = MemorySink()
+    session.set_response("get_match_count.json")
+    service = StatsService(session, metrics=sink)
+    resp = await service.get_match_count("xuid(123)")
+    await resp.parse()
+    histograms = sink.snapshot()["histograms"]
+    # Decoding is part of validation for models validated from raw JSON.
+    assert metrics.DECODE not in histograms
+    assert histograms[metrics.VALIDATE]["stats.get_match_count"]["count"] == 1
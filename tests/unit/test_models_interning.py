@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from spnkr.models.interning import InternPool, get_intern_pool, set_intern_pool
+from spnkr.models.skill import MatchSkill
+from spnkr.models.stats import MatchStats
+
+RESPONSES = Path("tests/data/responses")
+
+
+@pytest.fixture
+def pool():
+    pool = InternPool()
+    set_intern_pool(pool)
+    yield pool
+    set_intern_pool(None)
+
+
+def test_interning_disabled():
+    assert get_intern_pool() is None
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    first = MatchStats.model_validate_json(body)
+    second = MatchStats.model_validate_json(body)
+    assert first.match_id is not second.match_id
+
+
+def test_interning_shares_identifiers(pool: InternPool):
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    first = MatchStats.model_validate_json(body)
+    second = MatchStats.model_validate_json(body)
+    assert second == first
+    assert second.match_id is first.match_id
+    assert second.players[0].player_id is first.players[0].player_id
+    asset = first.match_info.map_variant.asset_id
+    assert second.match_info.map_variant.asset_id is asset
+    assert pool.stats.hits > 0
+    assert pool.stats.saved_bytes > 0
+    skill = MatchSkill.model_validate_json(
+        (RESPONSES / "get_match_skill.json").read_bytes()
+    )
+    assert any(v.id is pool.intern(v.id) for v in skill.value)
+
+
+def test_intern_pool_bounded():
+    pool = InternPool(max_size=2)
+    a, b, c = "xuid(1)", "xuid(2)", "xuid(3)"
+    pool.intern(a)
+    pool.intern(b)
+    pool.intern(a)  # Use "a" so "b" is evicted first.
+    pool.intern(c)
+    assert len(pool) == 2
+    assert pool.stats.evictions == 1
+    duplicate = "".join(["xuid(", "1)"])
+    assert pool.intern(duplicate) is a
+    assert pool.stats.hits == 2
+    assert pool.stats.hit_rate == 2 / 5
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.stats.hits == 0
+
+
+def test_intern_pool_invalid_size():
+    with pytest.raises(ValueError):
+        InternPool(max_size=0)
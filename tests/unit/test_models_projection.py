@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, field_serializer, field_validator, model_validator
+
+from spnkr.film.highlight_events import check, read
+from spnkr.models.projection import project
+from spnkr.models.skill import MatchSkill
+from spnkr.models.stats import MatchStats
+
+RESPONSES = Path("tests/data/responses")
+CORE_FIELDS = (
+    "match_info",
+    "players.player_id",
+    "players.player_team_stats.stats.core_stats",
+)
+
+
+def test_project_match_stats():
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    full = MatchStats.model_validate_json(body)
+    result = project(MatchStats, *CORE_FIELDS).model_validate_json(body)
+    assert result.match_info == full.match_info
+    assert set(type(result).model_fields) == {"match_info", "players"}
+    player = result.players[0]
+    assert set(type(player).model_fields) == {"player_id", "player_team_stats"}
+    assert player.player_id == full.players[0].player_id
+    stats = player.player_team_stats[0].stats
+    assert set(type(stats).model_fields) == {"core_stats"}
+    assert stats.core_stats == full.players[0].player_team_stats[0].stats.core_stats
+
+
+def test_project_is_cached():
+    projection = project(MatchStats, *CORE_FIELDS)
+    assert project(MatchStats, *reversed(CORE_FIELDS)) is projection
+
+
+def test_project_parent_field_selects_all():
+    projection = project(MatchStats, "players", "players.player_id")
+    annotation = projection.model_fields["players"].annotation
+    assert annotation == MatchStats.model_fields["players"].annotation
+
+
+def test_project_frozen():
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    result = project(MatchStats, "match_id").model_validate_json(body)
+    with pytest.raises(ValueError):
+        result.match_id = None  # type: ignore
+
+
+def test_project_keeps_properties():
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    full = MatchStats.model_validate_json(body)
+    projection = project(MatchStats, "players.player_id", "players.player_type")
+    result = projection.model_validate_json(body)
+    assert result.xuids == full.xuids
+    assert result.players[0].is_human
+    result = project(MatchStats, "players.player_id").model_validate_json(body)
+    with pytest.raises(AttributeError):
+        result.xuids
+
+
+def test_project_highlight_events_check():
+    film_dir = Path("tests/data/film")
+    events = list(read((film_dir / "highlight_events.gzip").read_bytes(), 37))
+    projection = project(
+        MatchStats,
+        "match_info.game_variant_category",
+        "players.player_id",
+        "players.player_type",
+        "players.player_team_stats.stats.core_stats",
+    )
+    stats = projection.model_validate_json((film_dir / "match_stats.json").read_text())
+    assert check(events, stats) == []
+
+
+def test_project_keeps_field_validators():
+    data = json.loads((RESPONSES / "get_match_skill.json").read_bytes())
+    data["Value"][0]["Result"]["StatPerformances"] = {}
+    projection = project(MatchSkill, "value.result.stat_performances")
+    result = projection.model_validate(data)
+    assert result.value[0].result.stat_performances is None
+    assert MatchSkill.model_validate(data).value[0].result.stat_performances is None
+
+
+def test_project_keeps_model_validators():
+    class Model(BaseModel):
+        a: int
+        b: int
+
+        @field_validator("a", "b", mode="before")
+        @classmethod
+        def _double(cls, v):
+            return v * 2
+
+        @model_validator(mode="after")
+        def _check(self):
+            if self.a < 0:
+                raise ValueError("negative")
+            return self
+
+    result = project(Model, "a").model_validate({"a": 1, "b": 1})
+    assert result.a == 2
+    with pytest.raises(ValueError):
+        project(Model, "a").model_validate({"a": -1})
+
+
+def test_project_unsupported_decorators():
+    class Model(BaseModel):
+        a: int
+
+        @field_serializer("a")
+        def _serialize(self, v):
+            return str(v)
+
+    with pytest.raises(ValueError):
+        project(Model, "a")
+
+
+@pytest.mark.parametrize("fields", [(), ("unknown",), ("match_id.unknown",)])
+def test_project_invalid_fields(fields: tuple[str, ...]):
+    with pytest.raises(ValueError):
+        project(MatchStats, *fields)
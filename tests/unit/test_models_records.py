@@ -0,0 +1,61 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from spnkr.models.projection import project
+from spnkr.models.records import from_record, record_type, to_record
+from spnkr.models.stats import MatchHistory, MatchStats, ServiceRecord
+
+RESPONSES = Path("tests/data/responses")
+
+
+@pytest.mark.parametrize(
+    ("file_name", "model"),
+    [
+        ("get_match_stats.json", MatchStats),
+        ("get_match_stats_pve.json", MatchStats),
+        ("get_match_history.json", MatchHistory),
+        ("get_service_record.json", ServiceRecord),
+    ],
+)
+def test_record_round_trip(file_name: str, model):
+    parsed = model.model_validate_json((RESPONSES / file_name).read_bytes())
+    record = to_record(parsed)
+    assert type(record) is record_type(model)
+    assert from_record(record) == parsed
+
+
+def test_record_fields():
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    parsed = MatchStats.model_validate_json(body)
+    record = to_record(parsed)
+    assert type(record).__name__ == "MatchStatsRecord"
+    assert record.match_id == parsed.match_id
+    core_stats = record.players[0].player_team_stats[0].stats.core_stats
+    assert (
+        core_stats.kills
+        == parsed.players[0].player_team_stats[0].stats.core_stats.kills
+    )
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_record_shares_identifiers():
+    body = (RESPONSES / "get_match_stats.json").read_bytes()
+    shared = {}
+    first = to_record(MatchStats.model_validate_json(body), shared)
+    second = to_record(MatchStats.model_validate_json(body), shared)
+    assert second.match_id is first.match_id
+    assert second.players[0].player_id is first.players[0].player_id
+
+
+def test_record_projection_names_are_unique():
+    first = record_type(project(MatchStats, "match_id"))
+    second = record_type(project(MatchStats, "match_info"))
+    assert first is not second
+    assert first.__name__ != second.__name__
+
+
+def test_from_record_invalid():
+    with pytest.raises(TypeError):
+        from_record((1, 2))
@@ -0,0 +1,166 @@
+"""Test the spnkr.ratelimit module."""
+
+import asyncio
+import datetime as dt
+import time
+from email.utils import format_datetime
+
+import pytest
+
+from spnkr.ratelimit import (
+    MAX_RETRY_AFTER,
+    AdaptiveRateLimiter,
+    RateLimit,
+    RateLimiterRegistry,
+    host_key,
+    parse_retry_after,
+)
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://halostats.svc.halowaypoint.com:443/hi/matches", "halostats"),
+        ("https://profile.svc.halowaypoint.com/users/me", "profile"),
+        (
+            "https://discovery-infiniteugc.svc.halowaypoint.com/hi/maps",
+            "discovery-infiniteugc",
+        ),
+        ("url", ""),
+    ],
+)
+def test_host_key(url: str, expected: str):
+    assert host_key(url) == expected
+
+
+def test_registry_shares_limiter_per_host():
+    registry = RateLimiterRegistry()
+    limiter = registry.for_url("https://skill.svc.halowaypoint.com/hi/a")
+    assert registry.for_url("https://skill.svc.halowaypoint.com/hi/b") is limiter
+    assert registry.get("skill") is limiter
+    assert registry.get("halostats") is not limiter
+
+
+def test_registry_limits():
+    registry = RateLimiterRegistry(2, limits={"skill": RateLimit(10, 5)})
+    assert registry.limit("halostats") == RateLimit(2, 1)
+    limiter = registry.get("skill")
+    assert limiter.max_rate == 5
+    assert limiter.time_period == 0.5
+
+
+@pytest.mark.parametrize("limit", [RateLimit(0), RateLimit(1, 0)])
+def test_registry_invalid_limit(limit: RateLimit):
+    with pytest.raises(ValueError):
+        RateLimiterRegistry(limits={"skill": limit})
+
+
+def test_registry_rates():
+    registry = RateLimiterRegistry(2, limits={"skill": RateLimit(10, 5)})
+    registry.get("skill")
+    registry.get("profile")
+    assert registry.rates == {"skill": 10, "profile": 2}
+
+
+def test_registry_adaptive():
+    registry = RateLimiterRegistry(2, adaptive=True)
+    limiter = registry.get("skill")
+    assert isinstance(limiter, AdaptiveRateLimiter)
+    assert limiter.rate == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_additive_increase():
+    limiter = AdaptiveRateLimiter(5, increase=1)
+    limiter.update(200)
+    assert limiter.rate == pytest.approx(5.2)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_max_rate():
+    limiter = AdaptiveRateLimiter(5, max_rate=5)
+    limiter.update(200)
+    assert limiter.rate == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_ignores_client_errors():
+    limiter = AdaptiveRateLimiter(5)
+    limiter.update(404)
+    assert limiter.rate == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 503])
+async def test_adaptive_limiter_multiplicative_decrease(status: int):
+    limiter = AdaptiveRateLimiter(8, min_rate=3)
+    limiter.update(status)
+    assert limiter.rate == 4
+    # Concurrent throttled responses only decrease the rate once.
+    limiter.update(status)
+    assert limiter.rate == 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_min_rate():
+    limiter = AdaptiveRateLimiter(8, min_rate=6)
+    limiter.update(429)
+    assert limiter.rate == 6
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_acquire_rate():
+    limiter = AdaptiveRateLimiter(20)
+    t0 = time.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+    t1 = time.time()
+    assert 0.15 <= t1 - t0 < 0.5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_retry_after_pauses():
+    limiter = AdaptiveRateLimiter(100, burst=10)
+    limiter.update(429, "0.3")
+    t0 = time.time()
+    await limiter.acquire()
+    t1 = time.time()
+    assert t1 - t0 >= 0.3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_rate": 0},
+        {"min_rate": 10},
+        {"max_rate": 1},
+        {"decrease": 1},
+    ],
+)
+def test_adaptive_limiter_invalid(kwargs: dict):
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(5, **kwargs)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("86400") == MAX_RETRY_AFTER
+
+
+def test_parse_retry_after_date():
+    date = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=60)
+    assert parse_retry_after(format_datetime(date, usegmt=True)) == pytest.approx(
+        60, abs=2
+    )
+
+
+def test_parse_retry_after_date_without_zone():
+    date = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=60)
+    value = format_datetime(date).replace("+0000", "-0000")
+    assert value.endswith("-0000")
+    assert parse_retry_after(value) == pytest.approx(60, abs=2)
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", "inf", "-inf", "1e309", "nan"])
+def test_parse_retry_after_invalid(value):
+    assert parse_retry_after(value) is None
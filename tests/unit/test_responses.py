@@ -1,8 +1,32 @@
 """Test the spnkr.responses module."""
 
+import json
+from pathlib import Path
+
 import pytest
+from pydantic import TypeAdapter
+
+from spnkr.models.discovery_ugc import (
+    AssetSearchPage,
+    Film,
+    Map,
+    MapModePair,
+    Playlist,
+    UgcGameVariant,
+)
+from spnkr.models.economy import PlayerCustomization
+from spnkr.models.gamecms_hacs import (
+    CareerRewardTrack,
+    CsrSeasonCalendar,
+    MedalMetadata,
+    SeasonCalendar,
+)
+from spnkr.models.profile import User
+from spnkr.models.skill import MatchSkill, PlaylistCsr
+from spnkr.models.stats import MatchCount, MatchHistory, MatchStats, ServiceRecord
+from spnkr.responses import JsonResponse, _BaseResponse, type_adapter
 
-from spnkr.responses import JsonResponse, _BaseResponse
+RESPONSES = Path("tests/data/responses")
 
 
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
@@ -27,3 +51,56 @@ async def test_json_response_json(response):
 async def test_json_response_parse(response):
     result: JsonResponse[dict] = JsonResponse(response, lambda data: data | {"test": 1})
     assert (await result.parse())["test"] == 1
+
+
+@pytest.mark.asyncio
+async def test_json_response_reads_and_parses_once(response, monkeypatch):
+    reads = []
+    read = response.read
+
+    async def counting_read():
+        reads.append(1)
+        return await read()
+
+    monkeypatch.setattr(response, "read", counting_read)
+    calls = []
+    result: JsonResponse[dict] = JsonResponse(response, lambda d: calls.append(d) or d)
+    parsed, raw = await result.parse_and_raw()
+    assert raw == b"{}"
+    assert await result.parse() is parsed
+    assert await result.json() is await result.json()
+    assert await result.read() is raw
+    assert len(reads) == 1
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("file_name", "model"),
+    [
+        ("get_career_reward_track.json", CareerRewardTrack),
+        ("get_csr_season_calendar.json", CsrSeasonCalendar),
+        ("get_film_by_match_id.json", Film),
+        ("get_map.json", Map),
+        ("get_map_mode_pair.json", MapModePair),
+        ("get_match_count.json", MatchCount),
+        ("get_match_history.json", MatchHistory),
+        ("get_match_skill.json", MatchSkill),
+        ("get_match_stats.json", MatchStats),
+        ("get_match_stats_pve.json", MatchStats),
+        ("get_medal_metadata.json", MedalMetadata),
+        ("get_player_customization.json", PlayerCustomization),
+        ("get_playlist.json", Playlist),
+        ("get_playlist_csr.json", PlaylistCsr),
+        ("get_season_calendar.json", SeasonCalendar),
+        ("get_service_record.json", ServiceRecord),
+        ("get_ugc_game_variant.json", UgcGameVariant),
+        ("get_users.json", list[User]),
+        ("search_assets.json", AssetSearchPage),
+    ],
+)
+@pytest.mark.asyncio
+async def test_json_response_parse_json_mode(response, file_name: str, model):
+    """Test that validating raw JSON matches validating decoded data."""
+    response._data = (RESPONSES / file_name).read_bytes()
+    result = await JsonResponse(response, type_adapter(model)).parse()
+    assert result == TypeAdapter(model).validate_python(json.loads(response._data))
@@ -0,0 +1,129 @@
+"""Test the spnkr.retry module."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiohttp import ServerDisconnectedError
+
+from spnkr.retry import Retrier, RetryBudget, RetryPolicy
+
+NO_DELAY = RetryPolicy(backoff=0)
+
+
+def _response(status: int, headers=None) -> Mock:
+    return Mock(status=status, headers=headers or {})
+
+
+@pytest.mark.parametrize(
+    "retry,retry_after,expected",
+    [
+        (0, None, 1),
+        (1, None, 2),
+        (3, None, 8),
+        (10, None, 10),
+        (0, 5.0, 5),
+        (0, 20.0, 10),
+    ],
+)
+def test_policy_delay(retry: int, retry_after, expected: float):
+    policy = RetryPolicy(backoff=1, max_backoff=10, jitter=False)
+    assert policy.delay(retry, retry_after) == expected
+
+
+def test_policy_delay_jitter():
+    policy = RetryPolicy(backoff=1)
+    assert all(0 <= policy.delay(2) <= 4 for _ in range(100))
+
+
+def test_policy_delay_ignore_retry_after():
+    policy = RetryPolicy(backoff=1, jitter=False, respect_retry_after=False)
+    assert policy.delay(0, 5.0) == 1
+
+
+def test_budget():
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 1
+
+
+@pytest.mark.asyncio
+async def test_retrier_retries_status():
+    retrier = Retrier(NO_DELAY)
+    request = AsyncMock(side_effect=[_response(503), _response(503), _response(200)])
+    response = await retrier.send("stats.get_match_stats", request)
+    assert response.status == 200
+    assert request.call_count == 3
+    assert retrier.retries == {"stats.get_match_stats": 2}
+
+
+@pytest.mark.asyncio
+async def test_retrier_status_max_attempts():
+    retrier = Retrier(RetryPolicy(backoff=0, statuses={500: 2}))
+    request = AsyncMock(return_value=_response(500))
+    response = await retrier.send("endpoint", request)
+    assert response.status == 500
+    assert request.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [200, 400, 404])
+async def test_retrier_non_retryable_status(status: int):
+    retrier = Retrier(NO_DELAY)
+    request = AsyncMock(return_value=_response(status))
+    await retrier.send("endpoint", request)
+    assert request.call_count == 1
+    assert not retrier.retries
+
+
+@pytest.mark.asyncio
+async def test_retrier_connection_error():
+    retrier = Retrier(RetryPolicy(backoff=0, max_attempts=2))
+    request = AsyncMock(side_effect=ServerDisconnectedError())
+    with pytest.raises(ServerDisconnectedError):
+        await retrier.send("endpoint", request)
+    assert request.call_count == 2
+    assert retrier.retries == {"endpoint": 1}
+
+
+@pytest.mark.asyncio
+async def test_retrier_budget_exhausted():
+    retrier = Retrier(NO_DELAY, RetryBudget(ratio=0, max_tokens=1))
+    request = AsyncMock(return_value=_response(503))
+    await retrier.send("endpoint", request)
+    assert request.call_count == 2
+    request.reset_mock()
+    await retrier.send("endpoint", request)
+    assert request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retrier_retry_after(monkeypatch):
+    sleep = AsyncMock()
+    monkeypatch.setattr("spnkr.retry.asyncio.sleep", sleep)
+    retrier = Retrier(NO_DELAY)
+    request = AsyncMock(
+        side_effect=[_response(429, {"Retry-After": "3"}), _response(200)]
+    )
+    await retrier.send("endpoint", request)
+    sleep.assert_called_once_with(3.0)
+
+
+@pytest.mark.asyncio
+async def test_retrier_retry_after_exceeds_max_backoff(monkeypatch):
+    sleep = AsyncMock()
+    monkeypatch.setattr("spnkr.retry.asyncio.sleep", sleep)
+    retrier = Retrier(RetryPolicy(max_backoff=10))
+    response = _response(503, {"Retry-After": "60"})
+    request = AsyncMock(side_effect=[response, _response(200)])
+    assert await retrier.send("endpoint", request) is response
+    request.assert_called_once()
+    sleep.assert_not_called()
+    response.release.assert_not_called()
+    assert retrier.budget.tokens == retrier.budget.max_tokens
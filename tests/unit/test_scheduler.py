@@ -0,0 +1,111 @@
+"""Test the spnkr.scheduler module."""
+
+import asyncio
+
+import pytest
+
+from spnkr.scheduler import Priority, PriorityScheduler, get_priority, priority
+from spnkr.services.base import BaseService
+
+
+class ManualLimiter:
+    """A limiter granting permits when released by the test."""
+
+    def __init__(self) -> None:
+        self.permits = asyncio.Semaphore(0)
+
+    async def acquire(self) -> None:
+        await self.permits.acquire()
+
+
+async def _request(
+    scheduler: PriorityScheduler, limiter, level: Priority, name: str, order: list
+):
+    await scheduler.acquire(limiter, level)
+    order.append(name)
+
+
+def test_priority_context():
+    assert get_priority() is Priority.NORMAL
+    with priority(Priority.HIGH):
+        assert get_priority() is Priority.HIGH
+    assert get_priority() is Priority.NORMAL
+
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_high_priority_first():
+    scheduler = PriorityScheduler()
+    limiter = ManualLimiter()
+    order = []
+    tasks = [
+        asyncio.create_task(_request(scheduler, limiter, level, name, order))
+        for level, name in [
+            (Priority.LOW, "low1"),
+            (Priority.LOW, "low2"),
+            (Priority.HIGH, "high"),
+            (Priority.NORMAL, "normal"),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.stats[Priority.LOW].depth == 2
+    for _ in tasks:
+        limiter.permits.release()
+    await asyncio.gather(*tasks)
+    assert order == ["high", "normal", "low1", "low2"]
+    assert scheduler.stats[Priority.LOW].depth == 0
+    assert scheduler.stats[Priority.LOW].dispatched == 2
+    assert scheduler.stats[Priority.HIGH].mean_wait >= 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_aging_prevents_starvation():
+    scheduler = PriorityScheduler(aging=0.01)
+    limiter = ManualLimiter()
+    order = []
+    low = asyncio.create_task(_request(scheduler, limiter, Priority.LOW, "low", order))
+    await asyncio.sleep(0.05)
+    high = asyncio.create_task(
+        _request(scheduler, limiter, Priority.HIGH, "high", order)
+    )
+    await asyncio.sleep(0)
+    limiter.permits.release()
+    limiter.permits.release()
+    await asyncio.gather(low, high)
+    assert order == ["low", "high"]
+    assert scheduler.stats[Priority.LOW].max_wait >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_cancelled_requests():
+    scheduler = PriorityScheduler()
+    limiter = ManualLimiter()
+    order = []
+    cancelled = asyncio.create_task(
+        _request(scheduler, limiter, Priority.HIGH, "cancelled", order)
+    )
+    waiting = asyncio.create_task(
+        _request(scheduler, limiter, Priority.LOW, "waiting", order)
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    limiter.permits.release()
+    await waiting
+    assert order == ["waiting"]
+    assert scheduler.stats[Priority.HIGH].depth == 0
+
+
+def test_scheduler_invalid_aging():
+    with pytest.raises(ValueError):
+        PriorityScheduler(aging=0)
+
+
+@pytest.mark.asyncio
+async def test_service_uses_context_priority(session):
+    scheduler = PriorityScheduler()
+    service = BaseService(session, scheduler=scheduler)
+    with priority(Priority.LOW):
+        await service._get("https://halostats.svc.halowaypoint.com/hi/matches")
+    await service._get("https://halostats.svc.halowaypoint.com/hi/other")
+    assert scheduler.stats[Priority.LOW].dispatched == 1
+    assert scheduler.stats[Priority.NORMAL].dispatched == 1
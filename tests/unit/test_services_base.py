@@ -1,10 +1,17 @@
 """Test BaseService."""
 
+import asyncio
+import gc
 import time
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from aiohttp import ClientPayloadError, ServerDisconnectedError
+from aiohttp_client_cache import CacheBackend
 
+from spnkr.cache import CachePolicy, MemoryCache
+from spnkr.ratelimit import RateLimiterRegistry
+from spnkr.retry import Retrier, RetryPolicy
 from spnkr.services.base import BaseService
 
 
@@ -29,8 +36,210 @@ async def test_rate_limiter(service: BaseService):
 async def test_get_cached_bypass_rate_limiter(
     session, service: BaseService, cached_response
 ):
-    """Test that _get bypasses the rate limiter if the response is from cache."""
-    session.get.return_value = cached_response
-    service._rate_limiter = AsyncMock()
+    """Test that _get bypasses the rate limiter if the response is cached."""
+    session.cache = AsyncMock()
+    session.cache.create_key = Mock(return_value="key")
+    session.cache.create_cache_actions = Mock(return_value=Mock(revalidate=False))
+    session.cache.request.return_value = cached_response
+    service._rate_limiters = Mock()
+    assert await service._get("url") is cached_response
+    assert not service._rate_limiters.for_url.called
+    assert not session.get.called
+
+
+@pytest.mark.asyncio
+async def test_get_acquires_permit_before_sending(
+    session, service: BaseService, response
+):
+    """Test that a rate limit permit is acquired before the request is sent."""
+    calls = []
+    limiter = AsyncMock()
+    limiter.acquire.side_effect = lambda: calls.append("acquire")
+    session.get.side_effect = lambda url: calls.append("get") or response
+    service._rate_limiters = Mock()
+    service._rate_limiters.for_url.return_value = limiter
+    await service._get("url")
+    assert calls == ["acquire", "get"]
+
+
+@pytest.mark.asyncio
+async def test_get_cache_miss_acquires_permit(session, service: BaseService):
+    """Test that a session cache miss waits for a rate limit permit."""
+    session.cache = CacheBackend()
+    service._rate_limiters = Mock()
+    service._rate_limiters.for_url.return_value = AsyncMock()
+    await service._get("https://halostats.svc.halowaypoint.com/hi/matches")
+    service._rate_limiters.for_url.assert_called_once()
+    session.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_adaptive_rate_limit_feedback(session, service: BaseService):
+    """Test that throttled responses reduce the adaptive rate of the host."""
+    service._rate_limiters = RateLimiterRegistry(4, adaptive=True)
+    session.get.return_value.status = 429
+    await service._get("https://skill.svc.halowaypoint.com/hi/a")
+    assert service._rate_limiters.rates == {"skill": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_retries_failed_request(session, response):
+    """Test that failed requests are retried when a retrier is provided."""
+    failed = Mock(status=503, headers={})
+    session.get.side_effect = [failed, response]
+    service = BaseService(session, retrier=Retrier(RetryPolicy(backoff=0)))
+    assert await service._get("url", endpoint="stats.get_match_stats") is response
+    assert service._retrier.retries == {"stats.get_match_stats": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_retries_interrupted_body(session, response):
+    """Test that a connection lost while reading the body is retried."""
+    failed = Mock(status=200, headers={})
+    failed.read = AsyncMock(side_effect=ClientPayloadError("Connection reset"))
+    session.get.side_effect = [failed, response]
+    service = BaseService(session, retrier=Retrier(RetryPolicy(backoff=0)))
+    assert await service._get("url", endpoint="stats.get_match_stats") is response
+    assert service._retrier.retries == {"stats.get_match_stats": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_coalesces_concurrent_requests(session, service: BaseService):
+    """Test that concurrent identical requests share one request and response."""
+    params = {"players": ["xuid(1)", "xuid(2)"], "season": "CsrSeason5-1"}
+    responses = await asyncio.gather(
+        service._get("url", params=params),
+        service._get("url", params=dict(reversed(params.items()))),
+    )
+    session.get.assert_called_once()
+    assert responses[0] is responses[1]
+    assert not service._in_flight
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"params": {"players": ["xuid(2)", "xuid(1)"]}},
+        {
+            "params": {"players": ["xuid(1)", "xuid(2)"]},
+            "headers": {"Accept-Language": "fr-FR"},
+        },
+    ],
+)
+async def test_get_does_not_coalesce_different_requests(
+    session, service: BaseService, kwargs: dict
+):
+    """Test that requests differing by parameters or language are not shared."""
+    await asyncio.gather(
+        service._get("url", params={"players": ["xuid(1)", "xuid(2)"]}),
+        service._get("url", **kwargs),
+    )
+    assert session.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_coalesced_error(session, service: BaseService):
+    """Test that an error is raised for all callers sharing a request."""
+    session.get.side_effect = ServerDisconnectedError()
+    results = await asyncio.gather(
+        service._get("url"), service._get("url"), return_exceptions=True
+    )
+    session.get.assert_called_once()
+    assert all(isinstance(r, ServerDisconnectedError) for r in results)
+    assert not service._in_flight
+
+
+@pytest.mark.asyncio
+async def test_get_coalesced_error_after_cancellation(session, service: BaseService):
+    """Test that the error of a request whose callers were cancelled is retrieved."""
+    errors = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    async def get(url):
+        await asyncio.sleep(0.01)
+        raise ServerDisconnectedError()
+
+    session.get.side_effect = get
+    try:
+        caller = asyncio.create_task(service._get("url"))
+        await asyncio.sleep(0)
+        task = service._in_flight["url"]
+        caller.cancel()
+        await asyncio.wait([task])
+        del caller, task
+        gc.collect()
+        await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    assert not errors
+
+
+@pytest.mark.asyncio
+async def test_get_revalidates_expired_entry(session, response, monkeypatch):
+    """Test that a "304 Not Modified" response reuses the cached response."""
+    now = [1000.0]
+    monkeypatch.setattr("spnkr.cache.time.monotonic", lambda: now[0])
+    response.headers = {"ETag": '"v1"', "Last-Modified": "date"}
+    session.get.return_value = response
+    service = BaseService(session, cache=MemoryCache(policy=CachePolicy(short=10)))
+    first = await service._get("url", headers={"Accept-Language": "en-US"})
+    now[0] += 10
+    session.get.return_value = Mock(status=304, headers={"ETag": '"v2"'})
+    second = await service._get("url", headers={"Accept-Language": "en-US"})
+    session.get.assert_called_with(
+        "url",
+        headers={
+            "Accept-Language": "en-US",
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "date",
+        },
+    )
+    assert second.from_cache
+    assert await second.read() == await first.read()
+    assert second.entry.validators["If-None-Match"] == '"v2"'
+    assert not second.entry.is_expired
+
+
+@pytest.mark.asyncio
+async def test_get_revalidation_without_keep_parsed(session, response, monkeypatch):
+    """Test that models parsed from a revalidated response aren't cached."""
+    now = [1000.0]
+    monkeypatch.setattr("spnkr.cache.time.monotonic", lambda: now[0])
+    response.headers = {"ETag": '"v1"'}
+    session.get.return_value = response
+    cache = MemoryCache(policy=CachePolicy(short=10), keep_parsed=False)
+    service = BaseService(session, cache=cache)
+    await service._get("url")
+    now[0] += 10
+    session.get.return_value = Mock(status=304, headers={"ETag": '"v1"'})
+    revalidated = await service._get("url")
+    assert revalidated.from_cache
+    revalidated.entry.parsed = (dict, {})
+    entry = await cache.get("url")
+    assert entry is not None
+    assert entry.parsed is None
+    assert cache._entries["url"].parsed is None
+
+
+@pytest.mark.asyncio
+async def test_get_revalidation_replaces_modified_entry(session, response, monkeypatch):
+    """Test that a modified response replaces an expired entry."""
+    now = [1000.0]
+    monkeypatch.setattr("spnkr.cache.time.monotonic", lambda: now[0])
+    response.headers = {"ETag": '"v1"'}
+    session.get.return_value = response
+    cache = MemoryCache(policy=CachePolicy(short=10))
+    service = BaseService(session, cache=cache)
     await service._get("url")
-    assert not service._rate_limiter.acquire.called
+    now[0] += 10
+    modified = Mock(status=200, url="url", headers={"ETag": '"v2"'})
+    modified.read = AsyncMock(return_value=b"{}")
+    session.get.return_value = modified
+    assert await service._get("url") is modified
+    session.get.assert_called_with("url", headers={"If-None-Match": '"v1"'})
+    entry = await cache.get("url")
+    assert entry is not None
+    assert entry.validators == {"If-None-Match": '"v2"'}
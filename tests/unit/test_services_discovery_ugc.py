@@ -1,9 +1,9 @@
 """Test DiscoveryUgcService."""
 
 import datetime as dt
-from types import SimpleNamespace
 
 import pytest
+from aiohttp_client_cache import CacheBackend
 
 from spnkr.services.discovery_ugc import DiscoveryUgcService
 
@@ -83,7 +83,7 @@ async def test_get_asset_with_language_disables_cache_without_header_keys(
     session,
     service: DiscoveryUgcService,
 ):
-    session.cache = SimpleNamespace(include_headers=False)
+    session.cache = CacheBackend(include_headers=False)
     session.set_response("get_map.json")
     with pytest.warns(UserWarning, match="include_headers=True"):
         await service.get_map("asset_id", "version_id", language="fr-FR")
@@ -99,7 +99,7 @@ async def test_get_asset_with_language_keeps_cache_when_headers_are_keyed(
     session,
     service: DiscoveryUgcService,
 ):
-    session.cache = SimpleNamespace(include_headers=True)
+    session.cache = CacheBackend(include_headers=True)
     session.set_response("get_map.json")
     await service.get_map("asset_id", "version_id", language="fr-FR")
     session.get.assert_called_with(
@@ -180,3 +180,15 @@ async def test_get_film_by_match_id(session, service: DiscoveryUgcService):
     session.get.assert_called_with(
         "https://discovery-infiniteugc.svc.halowaypoint.com:443/hi/films/matches/match_id/spectate"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_assets_many(session, service: DiscoveryUgcService):
+    session.set_response("get_map.json")
+    assets = [("map", "a", "v"), ("invalid", "b", "v")]
+    results = dict([r async for r in service.get_assets_many(assets)])  # type: ignore
+    assert not isinstance(results["map", "a", "v"], Exception)
+    assert isinstance(results["invalid", "b", "v"], ValueError)
+    session.get.assert_called_once_with(
+        "https://discovery-infiniteugc.svc.halowaypoint.com:443/hi/maps/a/versions/v"
+    )
@@ -51,3 +51,20 @@ async def test_get_users_by_id(session, service: ProfileService):
 async def test_get_users_by_id_invalid(service: ProfileService):
     with pytest.raises(TypeError):
         await service.get_users_by_id("xuid(1234567890123456)")
+
+
+@pytest.mark.asyncio
+async def test_get_users_many(session, service: ProfileService):
+    session.set_response("get_users.json")
+    xuids = range(2533274796688500, 2533274796688505)
+    results = [r async for r in service.get_users_many(xuids, batch_size=2)]
+    assert sorted(key for key, _ in results) == [
+        tuple(xuids[:2]),
+        tuple(xuids[2:4]),
+        tuple(xuids[4:]),
+    ]
+    assert not any(isinstance(r, Exception) for _, r in results)
+    session.get.assert_any_call(
+        "https://profile.svc.halowaypoint.com/users",
+        params={"xuids": [2533274796688504]},
+    )
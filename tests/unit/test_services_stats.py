@@ -1,7 +1,12 @@
 """Test StatsService."""
 
+import asyncio
+
 import pytest
+from aiohttp import ClientResponseError
 
+from spnkr.models.stats import MatchStats
+from spnkr.ratelimit import RateLimiterRegistry
 from spnkr.services.stats import StatsService
 
 
@@ -119,3 +124,59 @@ async def test_get_match_stats(session, service: StatsService):
     session.get.assert_called_with(
         "https://halostats.svc.halowaypoint.com:443/hi/matches/match_id/stats"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_match_stats_fields(session, service: StatsService):
+    session.set_response("get_match_stats.json")
+    resp = await service.get_match_stats("match_id", fields=["match_id"])
+    result = await resp.parse()
+    assert not isinstance(result, MatchStats)
+    assert set(type(result).model_fields) == {"match_id"}
+
+
+def test_get_match_stats_many_invalid_fields(service: StatsService):
+    with pytest.raises(ValueError):
+        service.get_match_stats_many(["a"], fields=["unknown"])
+
+
+@pytest.mark.asyncio
+async def test_get_match_stats_many(session, service: StatsService, response):
+    failed = ClientResponseError(None, (), status=404)  # type: ignore
+    session.get.side_effect = [response, failed, response]
+    results = [
+        r async for r in service.get_match_stats_many(["a", "b", "c"], concurrency=2)
+    ]
+    assert sorted(key for key, _ in results) == ["a", "b", "c"]
+    errors = {key: r for key, r in results if isinstance(r, Exception)}
+    assert list(errors.values()) == [failed]
+    assert session.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_match_stats_many_bounded(session, service: StatsService):
+    in_flight = max_in_flight = 0
+
+    async def get(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return session.get.return_value
+
+    service._rate_limiters = RateLimiterRegistry(1000, burst=100)
+    session.get.side_effect = get
+    ids = (str(i) for i in range(20))
+    count = 0
+    async for _ in service.get_match_stats_many(ids, concurrency=3):
+        count += 1
+    assert count == 20
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_get_match_stats_many_invalid_concurrency(service: StatsService):
+    with pytest.raises(ValueError):
+        async for _ in service.get_match_stats_many(["a"], concurrency=0):
+            pass
@@ -0,0 +1,85 @@
+"""Test the spnkr.tracing module."""
+
+import asyncio
+import json
+
+import pytest
+
+from spnkr import tracing
+from spnkr.services.stats import StatsService
+
+
+@pytest.fixture
+def exporter():
+    exporter = tracing.InMemoryExporter()
+    tracing.set_tracer(tracing.Tracer(exporter))
+    yield exporter
+    tracing.set_tracer(None)
+
+
+def test_span_exporter_requires_export():
+    class IncompleteExporter(tracing.SpanExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteExporter()  # type: ignore
+
+
+def test_span_disabled():
+    with tracing.span("name") as span:
+        assert span is None
+
+
+@pytest.mark.asyncio
+async def test_span_children_across_gather(exporter: tracing.InMemoryExporter):
+    @tracing.traced("child")
+    async def child():
+        await asyncio.sleep(0)
+
+    with tracing.span("root", job="crawl") as root:
+        await asyncio.gather(child(), child())
+    assert root is not None
+    assert root.parent_id is None
+    assert root.attributes == {"job": "crawl"}
+    children = exporter.children(root)
+    assert [c.name for c in children] == ["child", "child"]
+    assert all(c.trace_id == root.trace_id for c in children)
+    assert root.duration is not None and root.duration >= 0
+
+
+def test_span_records_error(exporter: tracing.InMemoryExporter):
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError("bad")
+    assert exporter.spans[0].error == "ValueError: bad"
+
+
+def test_exporters_write_json(exporter: tracing.InMemoryExporter, tmp_path):
+    lines = tracing.JsonLinesExporter(tmp_path / "spans.jsonl")
+    tracing.get_tracer().exporters.append(lines)  # type: ignore
+    with tracing.span("a"):
+        with tracing.span("b"):
+            pass
+    exporter.dump(tmp_path / "spans.json")
+    spans = json.loads((tmp_path / "spans.json").read_text())
+    assert [s["name"] for s in spans] == ["b", "a"]
+    assert spans[0]["parent_id"] == spans[1]["span_id"]
+    records = (tmp_path / "spans.jsonl").read_text().splitlines()
+    assert [json.loads(r)["name"] for r in records] == ["b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_service_spans(session, exporter: tracing.InMemoryExporter):
+    session.set_response("get_match_count.json")
+    service = StatsService(session)
+    with tracing.span("job") as job:
+        resp = await service.get_match_count("xuid(123)")
+        await resp.parse()
+    get, parse = exporter.children(job)  # type: ignore
+    assert get.name == "spnkr.get"
+    assert get.attributes["endpoint"] == "stats.get_match_count"
+    assert parse.name == "spnkr.parse"
+    names = {s.name for s in exporter.spans if s.trace_id == get.trace_id}
+    assert {"spnkr.rate_limit", "spnkr.request"} <= names
+    request = next(s for s in exporter.spans if s.name == "spnkr.request")
+    assert request.attributes["status"] == 200